@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+DNS Resolver Benchmark - UdpResolver Ölçüm ve Doğrulama Düzeneği
+benchmarks/stub_dns.py ile yerel ad sunucuları açar ve UdpResolver'ı
+şu senaryolarda çalıştırır:
+
+  throughput : gecikmeli stub üzerinde toplu çözümleme (q/s) ve tek tek
+               sorgulayan bloklayıcı taban çizgisi
+  pool       : ölü sunucu + SERVFAIL sunucusu içeren havuz, iki tur
+  tcp        : TC bitli yanıtlardan TCP'ye geçiş, yanlış txid'li TCP yanıtı
+  names      : IDN isimler ve kanonik olmayan IPv6 sunucu adresi
+  subdomain  : domain_search.subdomain_enumeration uçtan uca
+
+Kullanım: python benchmarks/bench_dns_resolver.py [--names 20000] [--delay 0.02]
+"""
+
+import argparse
+import contextlib
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent))
+
+from modules.dns_resolver import UdpResolver  # noqa: E402
+
+DEAD_SERVER = '127.0.0.1:9'       # discard portu; yanıt gelmez
+
+
+def free_port(host='127.0.0.1'):
+    """UDP ve TCP'de boş bir port bul"""
+    family = socket.AF_INET6 if ':' in host else socket.AF_INET
+    with socket.socket(family, socket.SOCK_DGRAM) as udp, socket.socket(family, socket.SOCK_STREAM) as tcp:
+        udp.bind((host, 0))
+        port = udp.getsockname()[1]
+        tcp.bind((host, port))
+        return port
+
+
+@contextlib.contextmanager
+def stub_server(delay=0.0, mode='ok', host='127.0.0.1'):
+    """Stub sunucuyu alt süreçte başlat, 'host:port' adresini ver"""
+    port = free_port(host)
+    process = subprocess.Popen([sys.executable, str(BENCH_DIR / 'stub_dns.py'), str(port),
+                                '--delay', str(delay), '--mode', mode, '--host', host],
+                               stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    try:
+        if process.stdout.readline().strip() != 'ready':
+            raise RuntimeError(f"stub DNS başlatılamadı ({mode})")
+        yield f"[{host}]:{port}" if ':' in host else f"{host}:{port}"
+    finally:
+        process.kill()
+        process.wait()
+
+
+def resolve_count(resolver, names):
+    """İsimleri çöz; (var olan sayısı, yanıt alınan sayısı, süre) döndür"""
+    counts = [0, 0]
+
+    def on_result(answer):
+        counts[0] += bool(answer.exists)
+        counts[1] += answer.rcode is not None
+
+    start = time.monotonic()
+    resolver.resolve_many(names, on_result)
+    return counts[0], counts[1], time.monotonic() - start
+
+
+def describe(answers):
+    return ', '.join(f"{name}: rcode={answer.rcode} {answer.addresses}" for name, answer in answers.items())
+
+
+def bench_throughput(args):
+    with stub_server(args.delay) as server:
+        print(f"[throughput] {args.names} isim, stub gecikmesi {args.delay * 1000:.0f} ms")
+        resolver = UdpResolver([server], timeout=1.0, concurrency=args.concurrency)
+        found, _, elapsed = resolve_count(resolver, (f"h{i}.example.com" for i in range(args.names)))
+        print(f"  UdpResolver ({args.concurrency} eşzamanlı) {elapsed:6.2f} s  "
+              f"{int(args.names / elapsed):>6} q/s  çözülen {found}/{args.names}")
+        baseline = 200
+        resolver = UdpResolver([server], timeout=1.0, concurrency=1)
+        found, _, elapsed = resolve_count(resolver, (f"b{i}.example.com" for i in range(baseline)))
+        print(f"  tek tek (bloklayıcı)          {elapsed:6.2f} s  "
+              f"{int(baseline / elapsed):>6} q/s  çözülen {found}/{baseline}")
+
+
+def bench_pool(args):
+    with stub_server(args.delay) as good, stub_server(mode='servfail') as bad:
+        print(f"[pool] sağlam + ölü ({DEAD_SERVER}) + SERVFAIL sunucu")
+        resolver = UdpResolver([good, DEAD_SERVER, bad], timeout=0.2, concurrency=100)
+        for round_no in (1, 2):
+            found, _, elapsed = resolve_count(resolver, (f"r{round_no}-{i}.example.com" for i in range(300)))
+            print(f"  tur {round_no}: {found}/300 çözüldü, {elapsed:.2f} s")
+            for health in resolver.health():
+                print(f"    {health['nameserver']}: {health['answered']}/{health['sent']} "
+                      f"({'sağlıklı' if health['healthy'] else 'sorunlu'})")
+
+        resolver = UdpResolver([good, DEAD_SERVER], timeout=0.2, concurrency=500)
+        found, _, elapsed = resolve_count(resolver, (f"d{i}.example.com" for i in range(5000)))
+        print(f"  ölü sunuculu havuz, 5000 isim / 500 eşzamanlı: {found} çözüldü, {elapsed:.2f} s")
+
+
+def bench_tcp(args):
+    names = ['www.example.com', 'nxapi.example.com']
+    with stub_server(mode='tc') as truncating, stub_server(mode='tcbad') as spoofing:
+        resolver = UdpResolver([truncating], timeout=0.3, retries=1)
+        print(f"[tcp] TC yanıtı → TCP: {describe(resolver.lookup(names))}; "
+              f"tcp_fallbacks={resolver.stats['tcp_fallbacks']}")
+        resolver = UdpResolver([spoofing], timeout=0.3, retries=1)
+        print(f"[tcp] yanlış txid'li TCP yanıtı reddedilir (adres listesi boş beklenir): "
+              f"{describe(resolver.lookup(names[:1]))}")
+
+
+def bench_names(args):
+    with stub_server() as server:
+        resolver = UdpResolver([server], timeout=0.3)
+        print(f"[names] IDN: {describe(resolver.lookup(['bücher.example.com', 'ÖRNEK.com.tr.']))}")
+    try:
+        with stub_server(host='::1') as server:
+            port = server.rsplit(':', 1)[1]
+            resolver = UdpResolver([f"[0:0:0:0:0:0:0:1]:{port}"], timeout=0.3, retries=2)
+            print(f"[names] kanonik olmayan IPv6 sunucu: {describe(resolver.lookup(['www.example.com']))}")
+    except (OSError, RuntimeError) as e:
+        print(f"[names] IPv6 atlandı: {e}")
+
+
+def bench_subdomain(args):
+    try:
+        from modules import domain_search
+    except ImportError as e:
+        print(f"[subdomain] atlandı: {e}")
+        return
+    # Stub her isme yanıt verdiği için wildcard filtresi, adresi wildcard
+    # sondalarıyla çakışan isimleri de eler; bulunan sayı 3000'in biraz altındadır
+    words = [f"w{i}" for i in range(3000)] + ['nxapi'] + [f"{c}.nxapi" for c in 'abcdef']
+    with stub_server(args.delay) as server:
+        start = time.monotonic()
+        found = domain_search.subdomain_enumeration('example.com', words, nameservers=[server],
+                                                    out=lambda *a, **k: None)
+        print(f"[subdomain] {len(words)} kelime, UDP yolu: {len(found)} bulundu, "
+              f"{time.monotonic() - start:.2f} s")
+
+
+SCENARIOS = {
+    'throughput': bench_throughput,
+    'pool': bench_pool,
+    'tcp': bench_tcp,
+    'names': bench_names,
+    'subdomain': bench_subdomain,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='UdpResolver ölçüm düzeneği')
+    parser.add_argument('--names', type=int, default=20000)
+    parser.add_argument('--delay', type=float, default=0.02, help='stub yanıt gecikmesi (s)')
+    parser.add_argument('--concurrency', type=int, default=500)
+    parser.add_argument('scenarios', nargs='*', metavar='SENARYO',
+                        help=f"çalıştırılacak senaryolar: {', '.join(SCENARIOS)} (varsayılan: hepsi)")
+    args = parser.parse_args()
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"bilinmeyen senaryo: {', '.join(sorted(unknown))}")
+    for name in args.scenarios or SCENARIOS:
+        SCENARIOS[name](args)
+
+
+if __name__ == '__main__':
+    main()
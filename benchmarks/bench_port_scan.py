@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Port Scan Benchmark - Thread ve Asenkron Motor Karşılaştırması
+127.0.0.1 üzerinde yerel bir dinleyici düzeneği kurar ve iki motoru
+aynı port listesinde çalıştırır:
+
+  filtered : kabul kuyruğu dolu dinleyiciler SYN'leri düşürür, bağlantı
+             zaman aşımına uğrar (gerçek ağdaki filtrelenmiş port gibi)
+  loopback : kapalı portlar anında reddedilir (RST)
+
+Kullanım: python benchmarks/bench_port_scan.py [--filtered 1000] [--range 20000]
+"""
+
+import argparse
+import contextlib
+import io
+import socket
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from modules import port_scanner  # noqa: E402
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def raise_fd_limit(wanted):
+    """Düzenek için gereken dosya tanıtıcısı sınırını yükselt"""
+    if resource is None:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    target = wanted if hard == resource.RLIM_INFINITY else min(wanted, hard)
+    if soft < target:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+
+
+def filtered_fixture(count):
+    """Kuyruğu doldurulmuş `count` dinleyici + bir açık dinleyici kur
+
+    Döner: (port listesi, açık port, kapatılacak soketler)
+    """
+    held = []
+    ports = []
+    for _ in range(count):
+        listener = socket.socket()
+        listener.bind(('127.0.0.1', 0))
+        listener.listen(0)
+        port = listener.getsockname()[1]
+        for _ in range(2):
+            client = socket.socket()
+            client.setblocking(False)
+            client.connect_ex(('127.0.0.1', port))
+            held.append(client)
+        held.append(listener)
+        ports.append(port)
+    time.sleep(0.2)
+    open_listener = socket.socket()
+    open_listener.bind(('127.0.0.1', 0))
+    open_listener.listen(100)
+    held.append(open_listener)
+    open_port = open_listener.getsockname()[1]
+    ports.append(open_port)
+    return ports, open_port, held
+
+
+def timed_scan(ports, engine, threads, concurrency, timeout):
+    """Tek bir taramayı çalıştır, (süre, açık portlar) döndür"""
+    start = time.monotonic()
+    with contextlib.redirect_stdout(io.StringIO()):
+        records = port_scanner.run_scan((socket.AF_INET, '127.0.0.1'), ports, engine, threads,
+                                        concurrency, timeout, adaptive=False, banners=False)
+    return time.monotonic() - start, [record['port'] for record in records]
+
+
+def report(label, ports, elapsed, found, expected):
+    rate = int(len(ports) / elapsed) if elapsed else 0
+    status = 'OK' if expected <= set(found) else 'EKSİK'
+    print(f"  {label:<28} {elapsed:6.2f} s  {rate:>7} port/s  açık: {status}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Port tarama motorları karşılaştırması')
+    parser.add_argument('--filtered', type=int, default=1000, help='filtrelenmiş port sayısı')
+    parser.add_argument('--range', type=int, default=20000, help='loopback aralık genişliği')
+    parser.add_argument('--timeout', type=float, default=0.5)
+    args = parser.parse_args()
+    raise_fd_limit(args.filtered * 3 + 4096)
+
+    ports, open_port, held = filtered_fixture(args.filtered)
+    try:
+        print(f"[filtered] {len(ports)} port, zaman aşımı {args.timeout} s")
+        for label, engine, threads, concurrency in (('thread, 100 thread', 'thread', 100, 0),
+                                                    ('async, 500 eşzamanlı', 'async', 0, 500),
+                                                    ('async, 2000 eşzamanlı', 'async', 0, 2000)):
+            elapsed, found = timed_scan(ports, engine, threads, concurrency, args.timeout)
+            report(label, ports, elapsed, found, {open_port})
+    finally:
+        for sock in held:
+            sock.close()
+
+    listeners = []
+    for _ in range(5):
+        listener = socket.socket()
+        listener.bind(('127.0.0.1', 0))
+        listener.listen(100)
+        listeners.append(listener)
+    try:
+        opened = {listener.getsockname()[1] for listener in listeners}
+        low = max(1, min(opened) - args.range // 2)
+        ports = list(range(low, min(65535, low + args.range) + 1))
+        expected = {port for port in opened if port in ports}
+        print(f"[loopback] {len(ports)} port")
+        for label, engine, threads, concurrency in (('thread, 50 thread', 'thread', 50, 0),
+                                                    ('async, 500 eşzamanlı', 'async', 0, 500)):
+            elapsed, found = timed_scan(ports, engine, threads, concurrency, args.timeout)
+            report(label, ports, elapsed, found, expected)
+    finally:
+        for listener in listeners:
+            listener.close()
+
+
+if __name__ == '__main__':
+    main()
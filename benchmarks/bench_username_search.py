@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Username Search Benchmark - Sıralı ve Asenkron Motor Karşılaştırması
+Her isteğe sabit gecikmeyle yanıt veren yerel bir HTTP sunucusu açar ve
+site kataloğunu 127.0.0.x loopback host'larına dağılmış sahte sitelerle
+değiştirir. Yolunda kullanıcı adı geçen sayfalar 200, diğerleri 404 döner.
+
+İkinci bölüm yavaşlatılmış bir host'u ölçer: 127.0.0.200 her sayfanın ilk
+isteğine 429 + Retry-After ile yanıt verir. Bu host'un sınırlayıcıda
+bekleyen görevleri diğer host'ların sonuçlarını geciktirmemelidir.
+
+Kullanım: python benchmarks/bench_username_search.py [--sites 60] [--hosts 20] [--delay 0.2]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from modules import username_search  # noqa: E402
+
+USERNAME = 'alice'
+THROTTLED_HOST = '127.0.0.200'
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Gecikmeli, keep-alive destekli sahte profil sayfası"""
+    protocol_version = 'HTTP/1.1'
+    delay = 0.2
+    retry_after = 2
+    seen = set()
+    seen_lock = threading.Lock()
+
+    def respond(self, with_body):
+        time.sleep(self.delay)
+        if self.headers.get('Host', '').split(':')[0] == THROTTLED_HOST:
+            with self.seen_lock:
+                first = self.path not in self.seen
+                self.seen.add(self.path)
+            if first:
+                self.send_response(429)
+                self.send_header('Retry-After', str(self.retry_after))
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+        found = USERNAME in self.path
+        body = b'profile' if found else b'not found'
+        self.send_response(200 if found else 404)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if with_body:
+            self.wfile.write(body)
+
+    def do_GET(self):
+        self.respond(True)
+
+    def do_HEAD(self):
+        self.respond(False)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_stub(delay):
+    """Sunucuyu arka planda başlat, portunu döndür"""
+    StubHandler.delay = delay
+    ThreadingHTTPServer.request_queue_size = 256
+    server = ThreadingHTTPServer(('0.0.0.0', 0), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def timed_search(**kwargs):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = username_search.search_username(USERNAME, use_cache=False, **kwargs)
+    return time.perf_counter() - start, results
+
+
+async def throttled_run(concurrency, per_host):
+    """Sonuç akışını izle; her grubun son sonucunun geldiği anı döndür"""
+    start = time.perf_counter()
+    finished = {}
+    async for site_name, _, _ in username_search.iter_username_async(USERNAME, concurrency, per_host):
+        finished[site_name.rstrip('0123456789')] = time.perf_counter() - start
+    return finished
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Kullanıcı adı arama motorları karşılaştırması')
+    parser.add_argument('--sites', type=int, default=60)
+    parser.add_argument('--hosts', type=int, default=20, help='127.0.0.x host sayısı (en fazla 254)')
+    parser.add_argument('--delay', type=float, default=0.2, help='istek başına sunucu gecikmesi (s)')
+    parser.add_argument('--throttled', type=int, default=4, help='yavaşlatılmış host üzerindeki site sayısı')
+    args = parser.parse_args()
+
+    server = start_stub(args.delay)
+    port = server.server_address[1]
+    username_search.SOCIAL_SITES = {
+        f'site{i}': f'http://127.0.0.{i % args.hosts + 1}:{port}/site{i}/{{}}'
+        for i in range(args.sites)
+    }
+    print(f"{args.sites} site, {args.hosts} host, {args.delay * 1000:.0f} ms gecikme")
+    runs = (('sıralı', dict(engine='sequential')),
+            ('async (50 toplam, 4 host başına)', dict(concurrency=50, per_host=4)),
+            ('async (100 toplam, 8 host başına)', dict(concurrency=100, per_host=8)))
+    try:
+        for label, kwargs in runs:
+            elapsed, results = timed_search(**kwargs)
+            print(f"  {label:<36} {elapsed:6.2f} s  bulunan {len(results['found'])}, "
+                  f"bulunamayan {len(results['not_found'])}, hata {len(results['errors'])}")
+        
+        if args.throttled:
+            StubHandler.delay = 0.05
+            username_search.SOCIAL_SITES = {
+                **{f'slow{i}': f'http://{THROTTLED_HOST}:{port}/slow{i}/{{}}' for i in range(args.throttled)},
+                **{f'fast{i}': f'http://127.0.0.{i % args.hosts + 1}:{port}/fast{i}/{{}}' for i in range(50)},
+            }
+            print(f"{args.throttled} site 429 + Retry-After: {StubHandler.retry_after} veren hostta, "
+                  f"50 site diğer hostlarda, 10 eşzamanlı")
+            finished = asyncio.run(throttled_run(10, 4))
+            print(f"  diğer hostların son sonucu  {finished['fast']:6.2f} s")
+            print(f"  yavaş hostun son sonucu     {finished['slow']:6.2f} s")
+    finally:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+WHOIS Benchmark - WhoisClient Önbellek ve Yönlendirme Düzeneği
+benchmarks/fake_whois.py ile yerel IANA / registry / registrar sunucuları
+açar (her yanıt --latency kadar gecikir) ve geçici bir önbellek
+dosyasıyla şu senaryoları ölçer:
+
+  soğuk arama (bilinmeyen TLD), tekrar arama, süresi dolmuş kayıt
+  (zincir önbellekte), tekrarlanan "no match", sorgu sınırı yanıtı,
+  registrar'a ulaşılamaması ve hiçbir sunucuya ulaşılamaması
+
+Kullanım: python benchmarks/bench_whois.py [--latency 0.3]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fake_whois import IANA_SERVER, REGISTRAR_SERVER, UNREACHABLE, FakeWhois  # noqa: E402
+from modules import whois_client  # noqa: E402
+from modules.result_cache import ResultCache  # noqa: E402
+from modules.whois_client import WhoisClient, WhoisError  # noqa: E402
+
+
+def timed(label, fake, func):
+    """func'ı çalıştır; süreyi ve sunucu başına sorgu sayısını yazdır"""
+    before = fake.snapshot()
+    start = time.perf_counter()
+    try:
+        result = func()
+    except WhoisError as e:
+        result = e
+    elapsed = time.perf_counter() - start
+    queries = ', '.join(f"{name.split('.')[1]}={count}" for name, count in fake.delta(before).items())
+    shown = f"{elapsed * 1000:8.1f} ms" if elapsed < 0.1 else f"{elapsed:8.2f} s "
+    print(f"  {label:<38} {shown}  sorgular: {queries}")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='WhoisClient önbellek/yönlendirme ölçümü')
+    parser.add_argument('--latency', type=float, default=0.3, help='sahte sunucu yanıt gecikmesi (s)')
+    args = parser.parse_args()
+
+    fake = FakeWhois(args.latency).start()
+    fake.install(whois_client)
+    fd, db = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+
+    def client():
+        return WhoisClient(cache_path=db, port=fake.port, iana_server=IANA_SERVER, rate=1000)
+
+    try:
+        print(f"Sahte WHOIS sunucuları, {args.latency * 1000:.0f} ms gecikme")
+        entry = timed('soğuk arama (bilinmeyen TLD)', fake, lambda: client().lookup('Example.TEST.'))
+        print(f"    zincir {entry['referral_chain']}, kayıt sahibi {entry['record'].get('org')}")
+        entry = timed('tekrar arama', fake, lambda: client().lookup('example.test'))
+        print(f"    önbellekten: {entry['cached']}")
+
+        with ResultCache(db) as cache:
+            cache.delete(whois_client.CACHE_NAMESPACE, 'example.test')
+        entry = timed('süresi dolmuş kayıt (zincir kayıtlı)', fake, lambda: client().lookup('example.test'))
+        print(f"    name_servers {entry['record'].get('name_servers')}")
+
+        timed('"no match"', fake, lambda: client().lookup('nxdomain.test'))
+        entry = timed('"no match" tekrar', fake, lambda: client().lookup('nxdomain.test'))
+        print(f"    bulundu: {entry['found']}, önbellekten: {entry['cached']}")
+
+        throttled = client()
+        error = timed('sorgu sınırı yanıtı', fake, lambda: throttled.lookup('busy.test'))
+        rate = throttled.limiter.current_rate('whois.registry.fake')
+        with ResultCache(db) as cache:
+            stored = cache.get(whois_client.CACHE_NAMESPACE, 'busy.test')
+        print(f"    {type(error).__name__}: {error}; sunucu hızı {rate:g}/s, önbellekte: {stored is not None}")
+
+        fake.hosts[REGISTRAR_SERVER] = UNREACHABLE
+        entry = timed("registrar'a ulaşılamıyor", fake, lambda: client().lookup('other.test', refresh=True))
+        print(f"    bulundu: {entry['found']}, zincir {entry['referral_chain']}, "
+              f"registrar {entry['record'].get('registrar')}")
+
+        offline = WhoisClient(cache_path=None, port=fake.port, servers={'test': UNREACHABLE}, timeout=1.0)
+        error = timed('hiçbir sunucuya ulaşılamıyor', fake, lambda: offline.lookup('x.test'))
+        print(f"    {type(error).__name__}: {error}")
+    finally:
+        fake.uninstall(whois_client)
+        fake.stop()
+        os.unlink(db)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Fake WHOIS - Yerel IANA / Registry / Registrar Sunucuları
+Üç sahte TCP/43 sunucusunu 127.0.0.2-4 adreslerinde aynı portta açar.
+Her yanıt sabit bir gecikmeyle gelir ve sunucu başına sorgu sayısı
+tutulur. Registrar yönlendirmesi gerçek bir host adı olmak zorunda
+olduğundan install() istemcinin bağlantılarını bu adreslere yönlendirir.
+
+  whois.iana.fake      : her TLD için 'whois: whois.registry.fake'
+  whois.registry.fake  : 'nx' ile başlayan isimlere "No match", 'busy'
+                         ile başlayanlara sorgu sınırı, diğerlerine kayıt
+                         + registrar yönlendirmesi
+  whois.registrar.fake : kayıt sahibi bilgileriyle ayrıntılı kayıt
+"""
+
+import socket
+import threading
+import time
+
+REGISTRY_RESPONSE = """   Domain Name: {upper}
+   Registry Domain ID: 1234_DOMAIN_TEST
+   Registrar WHOIS Server: whois.registrar.fake
+   Registrar URL: http://www.registrar.fake
+   Updated Date: 2024-08-14T07:01:34Z
+   Creation Date: 1995-08-14T04:00:00Z
+   Registry Expiry Date: 2030-08-13T04:00:00Z
+   Registrar: Fake Registrar, Inc.
+   Registrar Abuse Contact Email: abuse@registrar.fake
+   Domain Status: clientDeleteProhibited https://icann.org/epp#clientDeleteProhibited
+   Domain Status: clientTransferProhibited https://icann.org/epp#clientTransferProhibited
+   Name Server: A.IANA-SERVERS.NET
+   Name Server: B.IANA-SERVERS.NET
+>>> Last update of whois database: 2026-10-17T10:00:00Z <<<
+"""
+
+REGISTRAR_RESPONSE = """Domain Name: {lower}
+Registrar WHOIS Server: whois.registrar.fake
+Creation Date: 1995-08-14T04:00:00Z
+Registrar Registration Expiration Date: 2030-08-13T04:00:00Z
+Registrar: Fake Registrar, Inc.
+Registrant Name: Jane Admin
+Registrant Organization: Example Org
+Registrant Street: 1 Test Way
+Registrant City: Istanbul
+Registrant State/Province: IST
+Registrant Postal Code: 34000
+Registrant Country: TR
+Registrant Email: admin@{lower}
+"""
+
+IANA_RESPONSE = """% IANA WHOIS server
+
+domain:       {upper}
+
+whois:        whois.registry.fake
+
+status:       ACTIVE
+"""
+
+IANA_SERVER = 'whois.iana.fake'
+REGISTRY_SERVER = 'whois.registry.fake'
+REGISTRAR_SERVER = 'whois.registrar.fake'
+UNREACHABLE = '127.0.0.9'
+
+
+def registry_answer(query):
+    if query.startswith('nx'):
+        return f'No match for "{query.upper()}".\n'
+    if query.startswith('busy'):
+        return 'WHOIS LIMIT EXCEEDED - query rate too high, try again later\n'
+    return REGISTRY_RESPONSE.format(upper=query.upper())
+
+
+class FakeWhois:
+    """Sahte sunucu üçlüsü; hosts ile istemcinin göreceği adresler değiştirilebilir"""
+
+    def __init__(self, latency=0.3):
+        self.latency = latency
+        self.counts = {}
+        self.hosts = {IANA_SERVER: '127.0.0.2', REGISTRY_SERVER: '127.0.0.3', REGISTRAR_SERVER: '127.0.0.4'}
+        self.port = None
+        self._sockets = []
+        self._lock = threading.Lock()
+        self._real_connect = None
+
+    def start(self):
+        answers = {
+            IANA_SERVER: lambda query: IANA_RESPONSE.format(upper=query.upper()),
+            REGISTRY_SERVER: registry_answer,
+            REGISTRAR_SERVER: lambda query: REGISTRAR_RESPONSE.format(lower=query.lower()),
+        }
+        for name, address in self.hosts.items():
+            listener = socket.socket()
+            listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            listener.bind((address, self.port or 0))
+            self.port = listener.getsockname()[1]
+            listener.listen(64)
+            self._sockets.append(listener)
+            threading.Thread(target=self._accept_loop, args=(listener, name, answers[name]),
+                             daemon=True).start()
+        return self
+
+    def _accept_loop(self, listener, name, answer):
+        while True:
+            try:
+                conn, _ = listener.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._handle, args=(conn, name, answer), daemon=True).start()
+
+    def _handle(self, conn, name, answer):
+        with conn:
+            query = conn.makefile('rb').readline().decode('utf-8', 'replace').strip()
+            with self._lock:
+                self.counts[name] = self.counts.get(name, 0) + 1
+            time.sleep(self.latency)
+            conn.sendall(answer(query).encode('utf-8'))
+
+    def install(self, module):
+        """module.socket.create_connection'ı sahte host adlarına yönlendir"""
+        self._real_connect = real_connect = module.socket.create_connection
+
+        def connect(address, timeout=None, *args, **kwargs):
+            host, port = address
+            return real_connect((self.hosts.get(host, host), port), timeout, *args, **kwargs)
+
+        module.socket.create_connection = connect
+
+    def uninstall(self, module):
+        if self._real_connect is not None:
+            module.socket.create_connection = self._real_connect
+            self._real_connect = None
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self.counts)
+
+    def delta(self, before):
+        """snapshot()'tan bu yana sunucu başına sorgu sayısı"""
+        now = self.snapshot()
+        return {name: now.get(name, 0) - before.get(name, 0) for name in self.hosts}
+
+    def stop(self):
+        for listener in self._sockets:
+            listener.close()
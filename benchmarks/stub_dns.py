@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Stub DNS - Yerel Test Ad Sunucusu
+Aynı port üzerinde UDP ve TCP dinleyen, yalnızca standart kütüphaneyle
+yazılmış asyncio ad sunucusu. Her A sorgusuna 192.0.2.x (isimden türetilen)
+ile yanıt verir; 'nx' ile başlayan etiket içeren isimler NXDOMAIN döner.
+
+Modlar:
+  ok       : normal yanıt
+  tc       : UDP yanıtları TC bitiyle boş gelir, cevap yalnızca TCP'de
+  tcbad    : tc gibi, ama TCP yanıtlarının transaction id'si yanlış
+  servfail : her sorguya SERVFAIL
+
+Kullanım: python benchmarks/stub_dns.py PORT [--delay 0.02] [--mode ok] [--host 127.0.0.1]
+Sunucu hazır olunca stdout'a 'ready' yazar.
+"""
+
+import argparse
+import asyncio
+import socket
+import struct
+import sys
+import zlib
+
+RECV_BUFFER = 8 << 20
+
+
+def build_answer(query, mode, over_tcp):
+    """Sorgu paketine moda göre yanıt paketi üret"""
+    offset = 12
+    labels = []
+    while query[offset]:
+        labels.append(query[offset + 1:offset + 1 + query[offset]])
+        offset += 1 + query[offset]
+    question = query[12:offset + 5]
+    txid = query[:2]
+    if mode == 'tcbad' and over_tcp:
+        txid = bytes((txid[0] ^ 0xff, txid[1]))
+    
+    def header(flags, answers):
+        return txid + struct.pack('!HHHHH', flags, 1, answers, 0, 0) + question
+    
+    if mode == 'servfail':
+        return header(0x8182, 0)
+    if any(label.startswith(b'nx') for label in labels):
+        return header(0x8183, 0)
+    if mode in ('tc', 'tcbad') and not over_tcp:
+        return header(0x8380, 0)
+    address = bytes((192, 0, 2, zlib.crc32(b'.'.join(labels)) % 250 + 1))
+    return header(0x8180, 1) + b'\xc0\x0c' + struct.pack('!HHIH', 1, 1, 60, 4) + address
+
+
+class StubProtocol(asyncio.DatagramProtocol):
+    def __init__(self, delay, mode):
+        self.delay = delay
+        self.mode = mode
+        self.transport = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        reply = build_answer(data, self.mode, False)
+        if self.delay:
+            asyncio.get_running_loop().call_later(self.delay, self.transport.sendto, reply, addr)
+        else:
+            self.transport.sendto(reply, addr)
+
+
+async def serve(port, delay, mode, host):
+    async def handle_tcp(reader, writer):
+        try:
+            size = struct.unpack('!H', await reader.readexactly(2))[0]
+            reply = build_answer(await reader.readexactly(size), mode, True)
+            writer.write(struct.pack('!H', len(reply)) + reply)
+            await writer.drain()
+        finally:
+            writer.close()
+    
+    loop = asyncio.get_running_loop()
+    transport, _ = await loop.create_datagram_endpoint(lambda: StubProtocol(delay, mode),
+                                                       local_addr=(host, port))
+    # Tek iş parçacıklı sunucu yük altında geride kalır; büyük alım tamponu
+    # kuyruk taşıp paket düşmesini (istemcide sahte zaman aşımı) önler
+    transport.get_extra_info('socket').setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, RECV_BUFFER)
+    server = await asyncio.start_server(handle_tcp, host, port)
+    print('ready', flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Yerel stub DNS sunucusu')
+    parser.add_argument('port', type=int)
+    parser.add_argument('--delay', type=float, default=0.0, help='UDP yanıt gecikmesi (s)')
+    parser.add_argument('--mode', choices=('ok', 'tc', 'tcbad', 'servfail'), default='ok')
+    parser.add_argument('--host', default='127.0.0.1')
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.port, args.delay, args.mode, args.host))
+    except KeyboardInterrupt:
+        sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()
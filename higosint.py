@@ -130,7 +130,7 @@ def check_dependencies():
     required_modules = [
         'requests', 'beautifulsoup4', 'colorama', 'phonenumbers',
         'googlesearch-python', 'pillow', 'flask', 'cryptography',
-        'ping3', 'python-whois', 'dnspython', 'shodan', 'tweepy',
+        'ping3', 'dnspython', 'shodan', 'tweepy',
         'instagram-scraper', 'tiktok-scraper', 'opencv-python'
     ]
     
@@ -22,5 +22,14 @@ __all__ = [
     'subdomain_scanner',
     'pdf_metadata',
     'advanced_tools',
+    'result_cache',
+    'rate_limiter',
+    'http_client',
+    'fingerprints',
+    'dns_resolver',
+    'wordlists',
+    'task_graph',
+    'tls_probe',
+    'whois_client',
     'settings'
 ]
@@ -25,6 +25,13 @@ import platform
 import subprocess
 import shutil
 
+try:
+    from modules.http_client import create_async_session, PageMemo
+    from modules.rate_limiter import limited_session_request
+except ImportError:
+    from http_client import create_async_session, PageMemo
+    from rate_limiter import limited_session_request
+
 # Platform-specific imports
 if os.name == 'nt' or platform.system() == 'Windows':
     try:
@@ -125,28 +132,23 @@ class AresCore:
             'archives': []
         }
         self.semaphore = asyncio.Semaphore(50)  # Rate limiting
+        self.pages = PageMemo()  # Operasyon boyunca paylaşılan sayfa önbelleği
         self.base_dir = Path("ares_reports")
         self.base_dir.mkdir(exist_ok=True)
 
     async def __aenter__(self):
         """Async context manager - HTTP session başlat."""
-        connector = aiohttp.TCPConnector(
-            limit=100,
-            limit_per_host=30,
-            ttl_dns_cache=300,
-            use_dns_cache=True,
-        )
-        timeout = aiohttp.ClientTimeout(total=30, connect=10)
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
             'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
         }
-        self.session = aiohttp.ClientSession(
-            connector=connector,
-            timeout=timeout,
+        self.session = create_async_session(
+            limit=100,
+            limit_per_host=30,
+            timeout=30,
+            connect_timeout=10,
             headers=headers
         )
         return self
@@ -225,7 +227,7 @@ class DeepWebArchiveScraper:
             for keyword in keywords[:5]:  # Rate limit
                 try:
                     url = self.WAYBACK_CDXML.format(keyword)
-                    async with session.get(url) as resp:
+                    async with limited_session_request(session, 'GET', url) as resp:
                         if resp.status == 200:
                             data = await resp.json()
                             if 'archived_snapshots' in data.get('archived_snapshots', {}):
@@ -245,7 +247,7 @@ class DeepWebArchiveScraper:
                 paste_id = keyword.split('.')[-2] if '.' in keyword else keyword[:8]
                 paste_url = f"{paste_prefix}{paste_id}"
                 try:
-                    async with session.get(paste_url, timeout=5) as resp:
+                    async with limited_session_request(session, 'GET', paste_url, timeout=5) as resp:
                         if resp.status == 200:
                             content = await resp.text()
                             emails = self.EMAIL_REGEX.findall(content)
@@ -264,6 +266,9 @@ class DeepWebArchiveScraper:
 class VisualMediaExtractor:
     """Görsel & medya çıkarıcı - EXIF + metadata analizi."""
     
+    def __init__(self, pages: Optional[PageMemo] = None):
+        self.pages = pages if pages is not None else PageMemo()
+    
     async def extract_images(self, session: aiohttp.ClientSession, 
                            urls: List[str], semaphore: asyncio.Semaphore) -> List[Dict]:
         """Tüm img tag'lerini ve metadata'yı çıkar."""
@@ -308,22 +313,21 @@ class VisualMediaExtractor:
         return images
     
     async def _static_image_scrape(self, session: aiohttp.ClientSession, target_url: str):
-        """Fallback static scraping."""
+        """Fallback static scraping (sayfa paylaşılan PageMemo'dan alınır)."""
         try:
-            async with session.get(target_url) as resp:
-                html = await resp.text()
-                img_matches = re.findall(r'<img[^>]+src=["\']([^"\']+)["\'][^>]*>', html)
-                alt_matches = re.findall(r'<img[^>]+alt=["\']([^"\']+)["\'][^>]*>', html)
-                
-                images = []
-                for i, src in enumerate(img_matches[:20]):
-                    images.append({
-                        'url': src,
-                        'alt': alt_matches[i] if i < len(alt_matches) else '',
-                        'filename': src.split('/')[-1],
-                        'target_context': target_url
-                    })
-                return images
+            html = (await self.pages.get_async(session, target_url)).text
+            img_matches = re.findall(r'<img[^>]+src=["\']([^"\']+)["\'][^>]*>', html)
+            alt_matches = re.findall(r'<img[^>]+alt=["\']([^"\']+)["\'][^>]*>', html)
+            
+            images = []
+            for i, src in enumerate(img_matches[:20]):
+                images.append({
+                    'url': src,
+                    'alt': alt_matches[i] if i < len(alt_matches) else '',
+                    'filename': src.split('/')[-1],
+                    'target_context': target_url
+                })
+            return images
         except:
             return []
 
@@ -347,7 +351,7 @@ class APIIntegrationLayer:
         async with semaphore:
             try:
                 url = f"https://api.shodan.io/shodan/host/search?key={self.shodan_key}&query={query}"
-                async with session.get(url) as resp:
+                async with limited_session_request(session, 'GET', url) as resp:
                     data = await resp.json()
                     return data.get('matches', [])
             except:
@@ -362,7 +366,7 @@ class APIIntegrationLayer:
         async with semaphore:
             try:
                 url = f"https://api.hunter.io/v2/domain-search?domain={domain}&api_key={self.hunter_key}"
-                async with session.get(url) as resp:
+                async with limited_session_request(session, 'GET', url) as resp:
                     data = await resp.json()
                     return [e['value'] for e in data.get('data', {}).get('emails', [])]
             except:
@@ -378,7 +382,7 @@ class APIIntegrationLayer:
             try:
                 url = f"https://haveibeenpwned.com/api/v3/breachedaccount/{email}?truncateResponse=false"
                 headers = {'User-Agent': 'ARES-V5', 'hibp-api-key': self.hibp_key}
-                async with session.get(url, headers=headers) as resp:
+                async with limited_session_request(session, 'GET', url, headers=headers) as resp:
                     if resp.status == 200:
                         return await resp.json()
                     return []
@@ -621,7 +625,7 @@ async def main_operation():
         ]
         
         # Image extraction
-        ares.results['images'] = await VisualMediaExtractor().extract_images(
+        ares.results['images'] = await VisualMediaExtractor(ares.pages).extract_images(
             ares.session, sample_sites, ares.semaphore
         )
         
@@ -652,7 +656,7 @@ def print_requirements():
     """Gerekli kütüphaneler."""
     reqs = """
 🛠️  GEREKLİ KÜTÜPHANELER (pip install):
-    aiohttp asyncio playwright jinja2 colorama pillow python-whois dnspython
+    aiohttp asyncio playwright jinja2 colorama pillow dnspython
 
 Termux için:
 $ pkg install python chromium
@@ -0,0 +1,478 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+DNS Resolver Module - Ham UDP DNS Çözücü
+Sorguları sistem çözücüsünü atlayarak doğrudan yapılandırılmış DNS
+sunucu havuzuna, tek bir bloklamayan UDP soketi üzerinden gönderir.
+Zaman aşımında yeniden gönderim, sunucu başına sağlık takibi ve kırpılmış
+(TC) yanıtlarda TCP'ye geri dönüş içerir.
+"""
+
+import asyncio
+import ipaddress
+import random
+import socket
+import struct
+import time
+from pathlib import Path
+
+try:
+    from modules.settings import get_setting_section
+except ImportError:
+    try:
+        from settings import get_setting_section
+    except ImportError:
+        get_setting_section = None
+
+RESOLV_CONF = Path('/etc/resolv.conf')
+
+QTYPE_A = 1
+QTYPE_AAAA = 28
+QTYPES = {'A': QTYPE_A, 'AAAA': QTYPE_AAAA}
+
+RCODE_NOERROR = 0
+RCODE_SERVFAIL = 2
+RCODE_NXDOMAIN = 3
+RCODE_REFUSED = 5
+
+FLAG_QR = 0x8000
+FLAG_TC = 0x0200
+FLAG_RD = 0x0100
+
+EDNS_PAYLOAD = 1232               # Parçalanmadan taşınabilen UDP yük boyutu
+DEFAULT_TIMEOUT = 1.0             # İlk gönderim için bekleme (sonrakilerde ikiye katlanır)
+MAX_RETRANSMIT_TIMEOUT = 4.0
+DEFAULT_RETRIES = 3
+DEFAULT_CONCURRENCY = 500         # Aynı anda uçuşta olan sorgu sayısı
+MAX_CONSECUTIVE_FAILURES = 3      # Bu kadar ardışık hatadan sonra sunucu dinlenmeye alınır
+NAMESERVER_BACKOFF = 5.0
+MAX_NAMESERVER_BACKOFF = 60.0
+MAX_BACKOFF_DOUBLINGS = 16        # Üs sınırı; 2**n float'a sığmayacak kadar büyümesin
+RECV_BUFFER = 4 << 20             # Yüzlerce yanıt aynı anda gelince çekirdek kuyruğu taşmasın
+
+
+class DnsError(Exception):
+    """Çözümlenemeyen DNS yanıtı"""
+
+
+def wire_name(name):
+    """İsmi sorguda gönderilen ve yanıtta geri gelen biçime çevir
+
+    Küçük harf, sondaki nokta yok, ASCII olmayan etiketler IDNA (punycode).
+    Yanıttaki soru adı bu biçimle karşılaştırılır.
+    """
+    labels = []
+    for label in name.rstrip('.').lower().split('.'):
+        if label:
+            try:
+                labels.append(label if label.isascii() else label.encode('idna').decode('ascii'))
+            except UnicodeError as e:
+                raise DnsError(f"Geçersiz etiket: {label}") from e
+    return '.'.join(labels)
+
+
+def build_query(txid, name, qtype):
+    """RD bayraklı, EDNS0 OPT kayıtlı tek soruluk DNS sorgusu oluştur"""
+    header = struct.pack('!HHHHHH', txid, FLAG_RD, 1, 0, 0, 1)
+    qname = b''
+    for label in wire_name(name).split('.'):
+        if label:
+            encoded = label.encode('ascii')
+            if len(encoded) > 63:
+                raise DnsError(f"Etiket çok uzun: {label}")
+            qname += bytes((len(encoded),)) + encoded
+    opt = b'\x00' + struct.pack('!HHIH', 41, EDNS_PAYLOAD, 0, 0)
+    return header + qname + b'\x00' + struct.pack('!HH', qtype, 1) + opt
+
+
+def read_name(data, offset):
+    """Sıkıştırma işaretçilerini izleyerek alan adını oku → (ad, sonraki offset)"""
+    labels = []
+    end = None
+    jumps = 0
+    while True:
+        if offset >= len(data):
+            raise DnsError("Ad alanı yanıt dışına taşıyor")
+        length = data[offset]
+        if length & 0xC0 == 0xC0:
+            if offset + 1 >= len(data):
+                raise DnsError("Kesik sıkıştırma işaretçisi")
+            if end is None:
+                end = offset + 2
+            jumps += 1
+            if jumps > 32:
+                raise DnsError("Sıkıştırma döngüsü")
+            offset = ((length & 0x3F) << 8) | data[offset + 1]
+            continue
+        offset += 1
+        if length == 0:
+            break
+        labels.append(data[offset:offset + length].decode('ascii', 'replace').lower())
+        offset += length
+    return '.'.join(labels), end if end is not None else offset
+
+
+def parse_response(data):
+    """Yanıtı çöz → (txid, bayraklar, soru adı, [(tip, adres)])
+
+    Yalnızca A/AAAA kayıtlarının adresleri döndürülür; CNAME zincirindeki
+    ara kayıtlar atlanır.
+    """
+    if len(data) < 12:
+        raise DnsError("Yanıt çok kısa")
+    txid, flags, qdcount, ancount, _, _ = struct.unpack_from('!HHHHHH', data)
+    offset = 12
+    qname = ''
+    for index in range(qdcount):
+        name, offset = read_name(data, offset)
+        if index == 0:
+            qname = name
+        offset += 4
+    records = []
+    for _ in range(ancount):
+        _, offset = read_name(data, offset)
+        if offset + 10 > len(data):
+            raise DnsError("Kesik kaynak kaydı")
+        rtype, _, _, rdlength = struct.unpack_from('!HHIH', data, offset)
+        offset += 10
+        rdata = data[offset:offset + rdlength]
+        offset += rdlength
+        if rtype == QTYPE_A and rdlength == 4:
+            records.append((rtype, socket.inet_ntop(socket.AF_INET, rdata)))
+        elif rtype == QTYPE_AAAA and rdlength == 16:
+            records.append((rtype, socket.inet_ntop(socket.AF_INET6, rdata)))
+    return txid, flags, qname, records
+
+
+class DnsAnswer:
+    """Tek bir sorgunun sonucu; rcode None ise hiçbir sunucudan yanıt alınamadı"""
+
+    __slots__ = ('name', 'rcode', 'addresses')
+
+    def __init__(self, name, rcode, addresses=()):
+        self.name = name
+        self.rcode = rcode
+        self.addresses = list(addresses)
+
+    @property
+    def exists(self):
+        return self.rcode == RCODE_NOERROR and bool(self.addresses)
+
+    @property
+    def nxdomain(self):
+        return self.rcode == RCODE_NXDOMAIN
+
+    def __repr__(self):
+        return f"DnsAnswer({self.name!r}, rcode={self.rcode}, addresses={self.addresses})"
+
+
+def canonical_ip(address):
+    """Karşılaştırma için IP nesnesi; IPv6 kapsam kimliği (%eth0) atılır
+
+    Adres IP değilse ValueError yükseltir.
+    """
+    return ipaddress.ip_address(address.split('%', 1)[0])
+
+
+class Nameserver:
+    """Havuzdaki bir DNS sunucusu ve sağlık sayaçları
+
+    address gönderimde yazıldığı gibi kullanılır; yanıtların kaynağı ise
+    kanonik biçimdeki ip ile karşılaştırılır (2001:db8:0:0::1 gibi uzun
+    yazımlar ve kapsam kimlikleri de eşleşir).
+    """
+
+    __slots__ = ('address', 'ip', 'port', 'family', 'sent', 'answered', 'failures',
+                 'consecutive_failures', 'down_until', 'srtt')
+
+    def __init__(self, address, port=53):
+        self.address = address
+        self.ip = canonical_ip(address)
+        self.port = port
+        self.family = socket.AF_INET6 if self.ip.version == 6 else socket.AF_INET
+        self.sent = 0
+        self.answered = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.down_until = 0.0
+        self.srtt = None
+
+    def available(self, now):
+        return now >= self.down_until
+
+    def record_success(self, rtt):
+        self.answered += 1
+        self.consecutive_failures = 0
+        self.down_until = 0.0
+        self.srtt = rtt if self.srtt is None else 0.875 * self.srtt + 0.125 * rtt
+
+    def record_failure(self, now):
+        """Zaman aşımı ya da SERVFAIL/REFUSED; ardışık hatalarda üstel dinlenme"""
+        self.failures += 1
+        self.consecutive_failures += 1
+        overflow = self.consecutive_failures - MAX_CONSECUTIVE_FAILURES
+        if overflow >= 0:
+            backoff = min(NAMESERVER_BACKOFF * (2 ** min(overflow, MAX_BACKOFF_DOUBLINGS)),
+                          MAX_NAMESERVER_BACKOFF)
+            self.down_until = now + backoff
+
+    def summary(self):
+        return {
+            'nameserver': f"{self.address}:{self.port}",
+            'sent': self.sent,
+            'answered': self.answered,
+            'failures': self.failures,
+            'healthy': self.consecutive_failures < MAX_CONSECUTIVE_FAILURES,
+            'srtt_ms': round(self.srtt * 1000, 1) if self.srtt is not None else None,
+        }
+
+
+def parse_nameserver(entry):
+    """'1.1.1.1', '1.1.1.1:5353', '[2606:4700::1111]:53' → Nameserver"""
+    entry = entry.strip()
+    if entry.startswith('['):
+        host, _, rest = entry[1:].partition(']')
+        port = int(rest[1:]) if rest.startswith(':') else 53
+        return Nameserver(host, port)
+    if entry.count(':') == 1:
+        host, port = entry.split(':')
+        return Nameserver(host, int(port))
+    return Nameserver(entry)
+
+
+def system_nameservers(path=RESOLV_CONF):
+    """resolv.conf içindeki nameserver satırları (okunamazsa boş liste)"""
+    servers = []
+    try:
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) >= 2 and parts[0] == 'nameserver':
+                    servers.append(parts[1].split('%')[0])
+    except OSError:
+        pass
+    return servers
+
+
+class _DatagramProtocol(asyncio.DatagramProtocol):
+    def __init__(self, resolver):
+        self.resolver = resolver
+
+    def datagram_received(self, data, addr):
+        self.resolver._on_datagram(data, addr)
+
+    def error_received(self, exc):
+        pass
+
+
+class UdpResolver:
+    """Ham UDP üzerinden toplu DNS çözücü
+
+    Tüm sorgular aile başına tek bir bloklamayan UDP soketinden çıkar;
+    yanıtlar işlem kimliği, kaynak adres ve soru adıyla eşleştirilir. Yanıt
+    gelmezse sorgu bir sonraki sağlıklı sunucuya artan zaman aşımıyla
+    yeniden gönderilir. Sağlık sayaçları çalıştırmalar arasında korunur.
+    """
+
+    def __init__(self, nameservers, timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES,
+                 concurrency=DEFAULT_CONCURRENCY):
+        self.nameservers = [ns if isinstance(ns, Nameserver) else parse_nameserver(ns)
+                            for ns in nameservers]
+        if not self.nameservers:
+            raise ValueError("En az bir DNS sunucusu gerekli")
+        self.timeout = timeout
+        self.retries = max(1, retries)
+        self.concurrency = max(1, concurrency)
+        self.stats = {'queries': 0, 'retransmits': 0, 'timeouts': 0, 'tcp_fallbacks': 0}
+        self._next_server = 0
+        self._pending = {}
+        self._transports = {}
+
+    @classmethod
+    def from_settings(cls, nameservers=None):
+        """Ayarlardaki 'dns' bölümünden (sunucu yoksa resolv.conf'tan) oluştur"""
+        config = get_setting_section('dns') if get_setting_section else {}
+        servers = nameservers or config.get('nameservers') or system_nameservers()
+        return cls(
+            servers,
+            timeout=config.get('timeout', DEFAULT_TIMEOUT),
+            retries=config.get('retries', DEFAULT_RETRIES),
+            concurrency=config.get('concurrency', DEFAULT_CONCURRENCY),
+        )
+
+    # -- soket yaşam döngüsü --------------------------------------------
+
+    async def _open(self):
+        loop = asyncio.get_running_loop()
+        for family in {ns.family for ns in self.nameservers}:
+            local = ('::', 0) if family == socket.AF_INET6 else ('0.0.0.0', 0)
+            transport, _ = await loop.create_datagram_endpoint(
+                lambda: _DatagramProtocol(self), local_addr=local, family=family)
+            try:
+                # Varsayılan tampon (~200 KB) 500 uçuştaki sorgunun yanıtlarını
+                # sığdıramaz; taşan yanıtlar sessizce düşer ve zaman aşımı sayılır
+                transport.get_extra_info('socket').setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF,
+                                                              RECV_BUFFER)
+            except OSError:
+                pass
+            self._transports[family] = transport
+
+    def _close(self):
+        for transport in self._transports.values():
+            transport.close()
+        self._transports.clear()
+        for future, _, _ in self._pending.values():
+            if not future.done():
+                future.cancel()
+        self._pending.clear()
+
+    def _on_datagram(self, data, addr):
+        if len(data) < 12:
+            return
+        txid = struct.unpack_from('!H', data)[0]
+        pending = self._pending.get(txid)
+        if pending is None:
+            return
+        future, server, name = pending
+        if addr[1] != server.port:
+            return
+        try:
+            if canonical_ip(addr[0]) != server.ip:
+                return
+        except ValueError:
+            return
+        try:
+            parsed = parse_response(data)
+        except DnsError:
+            return
+        if not parsed[1] & FLAG_QR or parsed[2] != name:
+            return
+        del self._pending[txid]
+        if not future.done():
+            future.set_result(parsed)
+
+    # -- sunucu seçimi ----------------------------------------------------
+
+    def _pick_server(self, tried):
+        """Denenmemiş sağlıklı sunucular arasında sırayla seç
+
+        Hepsi dinlenmedeyse en erken uyanacak olan denenir; havuz tek
+        sunucuysa aynı sunucuya yeniden gönderilir.
+        """
+        now = time.monotonic()
+        count = len(self.nameservers)
+        for step in range(count):
+            server = self.nameservers[(self._next_server + step) % count]
+            if server not in tried and server.available(now):
+                self._next_server = (self._next_server + step + 1) % count
+                return server
+        candidates = [ns for ns in self.nameservers if ns not in tried] or self.nameservers
+        return min(candidates, key=lambda ns: ns.down_until)
+
+    def _new_txid(self):
+        while True:
+            txid = random.getrandbits(16)
+            if txid not in self._pending:
+                return txid
+
+    # -- sorgular ---------------------------------------------------------
+
+    async def _query_udp(self, server, name, qtype, timeout):
+        txid = self._new_txid()
+        future = asyncio.get_running_loop().create_future()
+        self._pending[txid] = (future, server, name)
+        server.sent += 1
+        self.stats['queries'] += 1
+        try:
+            self._transports[server.family].sendto(build_query(txid, name, qtype),
+                                                   (server.address, server.port))
+            return await asyncio.wait_for(future, timeout)
+        except (asyncio.TimeoutError, OSError):
+            return None
+        finally:
+            self._pending.pop(txid, None)
+
+    async def _query_tcp(self, server, name, qtype, timeout):
+        self.stats['tcp_fallbacks'] += 1
+        writer = None
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(server.address, server.port), timeout)
+            txid = self._new_txid()
+            query = build_query(txid, name, qtype)
+            writer.write(struct.pack('!H', len(query)) + query)
+            await writer.drain()
+            length = struct.unpack('!H', await asyncio.wait_for(reader.readexactly(2), timeout))[0]
+            parsed = parse_response(await asyncio.wait_for(reader.readexactly(length), timeout))
+            # UDP yolundaki gibi: txid ve soru sorguyla aynı olmalı
+            if parsed[0] != txid or not parsed[1] & FLAG_QR or parsed[2] != name:
+                return None
+            return parsed
+        except (asyncio.TimeoutError, OSError, asyncio.IncompleteReadError, DnsError):
+            return None
+        finally:
+            if writer is not None:
+                writer.close()
+
+    async def resolve(self, name, qtype=QTYPE_A):
+        """Tek bir ismi çöz (açık bir çalıştırma içinde çağrılmalı) → DnsAnswer"""
+        name = name.rstrip('.').lower()
+        try:
+            query_name = wire_name(name)
+        except DnsError:
+            return DnsAnswer(name, None)
+        tried = set()
+        last = None
+        for attempt in range(self.retries):
+            if attempt:
+                self.stats['retransmits'] += 1
+            server = self._pick_server(tried)
+            tried.add(server)
+            timeout = min(self.timeout * (2 ** attempt), MAX_RETRANSMIT_TIMEOUT)
+            started = time.monotonic()
+            parsed = await self._query_udp(server, query_name, qtype, timeout)
+            if parsed is None:
+                self.stats['timeouts'] += 1
+                server.record_failure(time.monotonic())
+                continue
+            if parsed[1] & FLAG_TC:
+                parsed = await self._query_tcp(server, query_name, qtype, timeout) or parsed
+            rcode = parsed[1] & 0x000F
+            if rcode in (RCODE_SERVFAIL, RCODE_REFUSED):
+                server.record_failure(time.monotonic())
+                last = DnsAnswer(name, rcode)
+                continue
+            server.record_success(time.monotonic() - started)
+            return DnsAnswer(name, rcode, [address for rtype, address in parsed[3] if rtype == qtype])
+        return last or DnsAnswer(name, None)
+
+    async def _resolve_stream(self, names, on_result, qtype):
+        await self._open()
+        try:
+            names = iter(names)
+
+            async def worker():
+                for name in names:
+                    on_result(await self.resolve(name, qtype))
+
+            await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+        finally:
+            self._close()
+
+    def resolve_many(self, names, on_result, qtype='A'):
+        """İsimleri en fazla `concurrency` sorgu uçuşta olacak şekilde çöz
+
+        names tembel tüketilir (üreteç olabilir); her sonuç tamamlandığı
+        sırayla on_result(DnsAnswer) ile bildirilir.
+        """
+        asyncio.run(self._resolve_stream(names, on_result, QTYPES.get(qtype, qtype)))
+
+    def lookup(self, names, qtype='A'):
+        """Küçük isim listeleri için kolaylık: {isim: DnsAnswer}"""
+        results = {}
+        self.resolve_many(names, lambda answer: results.__setitem__(answer.name, answer), qtype)
+        return results
+
+    def health(self):
+        return [ns.summary() for ns in self.nameservers]
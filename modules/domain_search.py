@@ -7,11 +7,8 @@ Gelişmiş domain analizi, WHOIS, DNS, SSL, subdomain, teknoloji tespiti
 """
 
 import os
-import sys
 import json
 import socket
-import ssl
-import requests
 import dns.resolver
 import dns.zone
 import dns.query
@@ -24,23 +21,44 @@ import base64
 from urllib.parse import urlparse, urljoin
 import threading
 from queue import Queue
+from concurrent.futures import ThreadPoolExecutor
 import time
+import secrets
 
 try:
-    import whois
+    from modules.http_client import http_get, PageMemo
 except ImportError:
-    print("[!] python-whois modülü yükleniyor...")
-    import subprocess
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "python-whois", "--break-system-packages"])
-    import whois
+    from http_client import http_get, PageMemo
 
 try:
-    from bs4 import BeautifulSoup
+    from modules.wordlists import stream_wordlist, resolve_wordlist, list_wordlists
 except ImportError:
-    print("[!] beautifulsoup4 modülü yükleniyor...")
-    import subprocess
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "beautifulsoup4", "--break-system-packages"])
-    from bs4 import BeautifulSoup
+    from wordlists import stream_wordlist, resolve_wordlist, list_wordlists
+
+try:
+    from modules.task_graph import Stage, run_graph, STATUS_OK
+except ImportError:
+    from task_graph import Stage, run_graph, STATUS_OK
+
+try:
+    from modules.dns_resolver import DnsError, UdpResolver
+except ImportError:
+    from dns_resolver import DnsError, UdpResolver
+
+try:
+    from modules.tls_probe import TlsProber, san_names, capability_warnings
+except ImportError:
+    from tls_probe import TlsProber, san_names, capability_warnings
+
+try:
+    from modules.whois_client import WhoisClient
+except ImportError:
+    from whois_client import WhoisClient
+
+try:
+    from modules.fingerprints import TECH_FINGERPRINTS_FILE, load_tech_fingerprints
+except ImportError:
+    from fingerprints import TECH_FINGERPRINTS_FILE, load_tech_fingerprints
 
 class Colors:
     HEADER = Fore.CYAN + Style.BRIGHT
@@ -52,6 +70,20 @@ class Colors:
     INPUT = Fore.WHITE + Style.BRIGHT
     RESET = Style.RESET_ALL
 
+# Web teknolojisi imzaları (data/tech_fingerprints.json)
+try:
+    TECH_DB = load_tech_fingerprints()
+except Exception as e:
+    print(f"{Colors.ERROR}[!] Teknoloji imza veritabanı yüklenemedi ({TECH_FINGERPRINTS_FILE}): {e}{Colors.RESET}")
+    TECH_DB = None
+
+# İmzaya uymayan bu alanların ham değerleri yine de rapora eklenir
+UNMATCHED_TECH_FIELDS = {
+    'server': 'web_servers',
+    'x-powered-by': 'programming_languages',
+    'meta:generator': 'cms'
+}
+
 def clear_screen():
     os.system('cls' if os.name == 'nt' else 'clear')
 
@@ -78,141 +110,229 @@ def save_result(filename, data):
         print(f"{Colors.ERROR}[-] Kayıt hatası: {e}{Colors.RESET}")
         return None
 
-def whois_lookup(domain):
-    """Detaylı WHOIS sorgusu"""
-    print(f"\n{Colors.INFO}[*] WHOIS sorgusu yapılıyor: {domain}{Colors.RESET}")
+_whois_client = None
+_whois_client_lock = threading.Lock()
+
+def get_whois_client():
+    """Modül genelinde paylaşılan WHOIS istemcisi (sunucu başı hız sınırı ortak)"""
+    global _whois_client
+    if _whois_client is None:
+        with _whois_client_lock:
+            if _whois_client is None:
+                _whois_client = WhoisClient.from_settings()
+    return _whois_client
+
+def whois_lookup(domain, refresh=False, out=print):
+    """Detaylı WHOIS sorgusu
+    
+    Sorgu doğrudan TCP/43 üzerinden yapılır; sonuç data/whois_cache.db'de
+    saklanır ve süresi dolana kadar (varsayılan 7 gün) ağa çıkılmaz.
+    """
+    out(f"\n{Colors.INFO}[*] WHOIS sorgusu yapılıyor: {domain}{Colors.RESET}")
     try:
-        w = whois.whois(domain)
+        entry = get_whois_client().lookup(domain, refresh=refresh)
+        if not entry['found']:
+            out(f"{Colors.WARNING}[!] {entry['domain']} için WHOIS kaydı bulunamadı ({entry['whois_server']}){Colors.RESET}")
+            return None
+        w = entry['record']
+        scalar = lambda field: str(w[field]) if w.get(field) else 'N/A'
         result = {
-            'domain_name': str(w.domain_name) if w.domain_name else 'N/A',
-            'registrar': str(w.registrar) if w.registrar else 'N/A',
-            'whois_server': str(w.whois_server) if hasattr(w, 'whois_server') and w.whois_server else 'N/A',
-            'creation_date': str(w.creation_date) if w.creation_date else 'N/A',
-            'expiration_date': str(w.expiration_date) if w.expiration_date else 'N/A',
-            'updated_date': str(w.updated_date) if w.updated_date else 'N/A',
-            'name_servers': [str(ns) for ns in w.name_servers] if w.name_servers else [],
-            'status': [str(s) for s in w.status] if w.status else [],
-            'emails': [str(e) for e in w.emails] if w.emails else [],
-            'org': str(w.org) if hasattr(w, 'org') and w.org else 'N/A',
-            'country': str(w.country) if hasattr(w, 'country') and w.country else 'N/A',
-            'state': str(w.state) if hasattr(w, 'state') and w.state else 'N/A',
-            'city': str(w.city) if hasattr(w, 'city') and w.city else 'N/A',
-            'address': str(w.address) if hasattr(w, 'address') and w.address else 'N/A',
-            'zipcode': str(w.zipcode) if hasattr(w, 'zipcode') and w.zipcode else 'N/A',
-            'registrant_name': str(w.name) if hasattr(w, 'name') and w.name else 'N/A'
+            'domain_name': scalar('domain_name'),
+            'registrar': scalar('registrar'),
+            'whois_server': entry['whois_server'] or scalar('whois_server'),
+            'creation_date': scalar('creation_date'),
+            'expiration_date': scalar('expiration_date'),
+            'updated_date': scalar('updated_date'),
+            'name_servers': w.get('name_servers', []),
+            'status': w.get('status', []),
+            'emails': w.get('emails', []),
+            'org': scalar('org'),
+            'country': scalar('country'),
+            'state': scalar('state'),
+            'city': scalar('city'),
+            'address': scalar('address'),
+            'zipcode': scalar('zipcode'),
+            'registrant_name': scalar('registrant_name'),
+            'referral_chain': entry['referral_chain'],
+            'queried_at': entry['queried_at']
         }
         
-        print(f"{Colors.SUCCESS}[+] WHOIS Bilgileri:{Colors.RESET}")
-        print(f"  - Domain: {result['domain_name']}")
-        print(f"  - Kayıt Şirketi: {result['registrar']}")
-        print(f"  - Oluşturma: {result['creation_date']}")
-        print(f"  - Son Kullanma: {result['expiration_date']}")
-        print(f"  - Güncelleme: {result['updated_date']}")
-        print(f"  - Organizasyon: {result['org']}")
-        print(f"  - Ülke: {result['country']}")
-        print(f"  - Name Servers: {len(result['name_servers'])} adet")
+        if entry['cached']:
+            out(f"{Colors.INFO}[*] Önbellekten ({entry['queried_at']} tarihli sorgu){Colors.RESET}")
+        out(f"{Colors.SUCCESS}[+] WHOIS Bilgileri:{Colors.RESET}")
+        out(f"  - Domain: {result['domain_name']}")
+        out(f"  - Kayıt Şirketi: {result['registrar']}")
+        out(f"  - Oluşturma: {result['creation_date']}")
+        out(f"  - Son Kullanma: {result['expiration_date']}")
+        out(f"  - Güncelleme: {result['updated_date']}")
+        out(f"  - Organizasyon: {result['org']}")
+        out(f"  - Ülke: {result['country']}")
+        out(f"  - Name Servers: {len(result['name_servers'])} adet")
         for ns in result['name_servers']:
-            print(f"    • {ns}")
-        print(f"  - E-postalar: {', '.join(result['emails']) if result['emails'] else 'Yok'}")
-        print(f"  - Durum: {', '.join(result['status'][:3]) if result['status'] else 'Yok'}")
+            out(f"    • {ns}")
+        out(f"  - E-postalar: {', '.join(result['emails']) if result['emails'] else 'Yok'}")
+        out(f"  - Durum: {', '.join(result['status'][:3]) if result['status'] else 'Yok'}")
         
         return result
     except Exception as e:
-        print(f"{Colors.ERROR}[-] WHOIS hatası: {e}{Colors.RESET}")
+        out(f"{Colors.ERROR}[-] WHOIS hatası: {e}{Colors.RESET}")
         return None
 
-def dns_enumeration(domain):
-    """Kapsamlı DNS kayıt sorgulaması"""
-    print(f"\n{Colors.INFO}[*] DNS kayıtları sorgulanıyor: {domain}{Colors.RESET}")
-    record_types = ['A', 'AAAA', 'MX', 'NS', 'TXT', 'SOA', 'CNAME', 'PTR', 'SRV', 'CAA']
+DNS_RECORD_TYPES = ['A', 'AAAA', 'MX', 'NS', 'TXT', 'SOA', 'CNAME', 'PTR', 'SRV', 'CAA']
+
+_resolver = None
+_resolver_lock = threading.Lock()
+
+def get_resolver():
+    """Modüldeki tüm DNS sorgularının paylaştığı resolver (sistem ayarlarıyla)"""
+    global _resolver
+    if _resolver is None:
+        with _resolver_lock:
+            if _resolver is None:
+                resolver = dns.resolver.Resolver()
+                resolver.cache = dns.resolver.LRUCache()
+                _resolver = resolver
+    return _resolver
+
+def parse_dns_answer(record_type, answers):
+    """DNS yanıtını rapor biçimine çevir"""
+    records = []
+    for rdata in answers:
+        if record_type == 'MX':
+            records.append({
+                'priority': rdata.preference,
+                'exchange': str(rdata.exchange)
+            })
+        elif record_type == 'SOA':
+            records.append({
+                'mname': str(rdata.mname),
+                'rname': str(rdata.rname),
+                'serial': rdata.serial,
+                'refresh': rdata.refresh,
+                'retry': rdata.retry,
+                'expire': rdata.expire,
+                'minimum': rdata.minimum
+            })
+        elif record_type == 'SRV':
+            records.append({
+                'priority': rdata.priority,
+                'weight': rdata.weight,
+                'port': rdata.port,
+                'target': str(rdata.target)
+            })
+        else:
+            records.append(str(rdata))
+    return records
+
+def query_records(resolver, domain, record_type):
+    """Tek kayıt türünü sorgula; NXDOMAIN dışındaki hatalarda boş liste döner"""
+    try:
+        return parse_dns_answer(record_type, resolver.resolve(domain, record_type))
+    except dns.resolver.NXDOMAIN:
+        raise
+    except Exception:
+        return []
+
+def dns_enumeration(domain, out=print):
+    """Kapsamlı DNS kayıt sorgulaması
+    
+    Tüm kayıt türleri ortak resolver üzerinden aynı anda sorgulanır; toplam
+    süre sorguların toplamı yerine en yavaş sorguya yaklaşır.
+    """
+    out(f"\n{Colors.INFO}[*] DNS kayıtları sorgulanıyor: {domain}{Colors.RESET}")
+    resolver = get_resolver()
     results = {}
     
-    for record_type in record_types:
+    with ThreadPoolExecutor(max_workers=len(DNS_RECORD_TYPES)) as pool:
+        futures = {
+            record_type: pool.submit(query_records, resolver, domain, record_type)
+            for record_type in DNS_RECORD_TYPES
+        }
+    
+    for record_type in DNS_RECORD_TYPES:
         try:
-            answers = dns.resolver.resolve(domain, record_type)
-            results[record_type] = []
-            for rdata in answers:
-                if record_type == 'MX':
-                    results[record_type].append({
-                        'priority': rdata.preference,
-                        'exchange': str(rdata.exchange)
-                    })
-                elif record_type == 'SOA':
-                    results[record_type].append({
-                        'mname': str(rdata.mname),
-                        'rname': str(rdata.rname),
-                        'serial': rdata.serial,
-                        'refresh': rdata.refresh,
-                        'retry': rdata.retry,
-                        'expire': rdata.expire,
-                        'minimum': rdata.minimum
-                    })
-                elif record_type == 'SRV':
-                    results[record_type].append({
-                        'priority': rdata.priority,
-                        'weight': rdata.weight,
-                        'port': rdata.port,
-                        'target': str(rdata.target)
-                    })
-                else:
-                    results[record_type].append(str(rdata))
-            
-            print(f"{Colors.SUCCESS}[+] {record_type}: {len(results[record_type])} kayıt{Colors.RESET}")
-            for record in results[record_type][:5]:
-                if isinstance(record, dict):
-                    print(f"    • {record}")
-                else:
-                    print(f"    • {record}")
-        except dns.resolver.NoAnswer:
-            results[record_type] = []
+            results[record_type] = futures[record_type].result()
         except dns.resolver.NXDOMAIN:
-            print(f"{Colors.ERROR}[-] Domain bulunamadı!{Colors.RESET}")
+            out(f"{Colors.ERROR}[-] Domain bulunamadı!{Colors.RESET}")
             return None
-        except Exception as e:
-            results[record_type] = []
+        
+        if results[record_type]:
+            out(f"{Colors.SUCCESS}[+] {record_type}: {len(results[record_type])} kayıt{Colors.RESET}")
+            for record in results[record_type][:5]:
+                out(f"    • {record}")
     
     return results
 
-def ssl_certificate_info(domain):
+_tls_prober = None
+_tls_prober_lock = threading.Lock()
+
+def get_tls_prober(out=print):
+    """Modül genelinde paylaşılan TLS prob motoru (SSLContext bir kez kurulur)"""
+    global _tls_prober
+    if _tls_prober is None:
+        with _tls_prober_lock:
+            if _tls_prober is None:
+                for warning in capability_warnings():
+                    out(f"{Colors.WARNING}[!] TLS: {warning}{Colors.RESET}")
+                _tls_prober = TlsProber.from_settings()
+    return _tls_prober
+
+def ssl_certificate_info(domain, out=print):
     """Detaylı SSL sertifika analizi"""
-    print(f"\n{Colors.INFO}[*] SSL sertifikası analiz ediliyor: {domain}{Colors.RESET}")
-    try:
-        context = ssl.create_default_context()
-        with socket.create_connection((domain, 443), timeout=10) as sock:
-            with context.wrap_socket(sock, server_hostname=domain) as ssock:
-                cert = ssock.getpeercert()
-                
-                result = {
-                    'version': cert.get('version', 'N/A'),
-                    'serial_number': cert.get('serialNumber', 'N/A'),
-                    'issuer': dict(x[0] for x in cert.get('issuer', [])),
-                    'subject': dict(x[0] for x in cert.get('subject', [])),
-                    'not_before': cert.get('notBefore', 'N/A'),
-                    'not_after': cert.get('notAfter', 'N/A'),
-                    'san': [x[1] for x in cert.get('subjectAltName', [])],
-                    'signature_algorithm': cert.get('signatureAlgorithm', 'N/A'),
-                    'cipher': ssock.cipher(),
-                    'tls_version': ssock.version()
-                }
-                
-                print(f"{Colors.SUCCESS}[+] SSL/TLS Bilgileri:{Colors.RESET}")
-                print(f"  - Sertifika Veren: {result['issuer'].get('organizationName', 'N/A')}")
-                print(f"  - Konu CN: {result['subject'].get('commonName', 'N/A')}")
-                print(f"  - Geçerlilik: {result['not_before']} → {result['not_after']}")
-                print(f"  - TLS Versiyon: {result['tls_version']}")
-                print(f"  - Cipher: {result['cipher']}")
-                print(f"  - SAN Domains: {len(result['san'])} adet")
-                for san in result['san'][:10]:
-                    print(f"    • {san}")
-                
-                return result
-    except Exception as e:
-        print(f"{Colors.ERROR}[-] SSL hatası: {e}{Colors.RESET}")
+    out(f"\n{Colors.INFO}[*] SSL sertifikası analiz ediliyor: {domain}{Colors.RESET}")
+    probe = get_tls_prober(out).probe_one(domain)
+    if probe.error or not probe.certificate:
+        out(f"{Colors.ERROR}[-] SSL hatası: {probe.error or 'sertifika alınamadı'}{Colors.RESET}")
         return None
+    
+    cert = probe.certificate
+    result = dict(cert)
+    result.update({
+        'cipher': probe.cipher,
+        'tls_version': probe.tls_version,
+        'verified': probe.verified,
+        'verify_error': probe.verify_error,
+        'chain': [
+            {'subject': c['subject'].get('commonName', 'N/A'), 'issuer': c['issuer'].get('commonName', 'N/A'),
+             'not_after': c['not_after'], 'sha256': c['sha256']}
+            for c in probe.certificates
+        ]
+    })
+    
+    out(f"{Colors.SUCCESS}[+] SSL/TLS Bilgileri:{Colors.RESET}")
+    if not probe.verified:
+        out(f"{Colors.WARNING}[!] Sertifika doğrulanamadı: {probe.verify_error}{Colors.RESET}")
+    out(f"  - Sertifika Veren: {result['issuer'].get('organizationName', 'N/A')}")
+    out(f"  - Konu CN: {result['subject'].get('commonName', 'N/A')}")
+    out(f"  - Geçerlilik: {result['not_before']} → {result['not_after']}")
+    out(f"  - İmza Algoritması: {result['signature_algorithm']}")
+    out(f"  - TLS Versiyon: {result['tls_version']}")
+    out(f"  - Cipher: {result['cipher']}")
+    out(f"  - Zincir: {len(result['chain'])} sertifika")
+    out(f"  - SAN Domains: {len(result['san'])} adet")
+    for san in result['san'][:10]:
+        out(f"    • {san}")
+    
+    return result
 
-def web_technology_detection(url):
-    """Web teknolojisi ve framework tespiti"""
-    print(f"\n{Colors.INFO}[*] Web teknolojileri tespit ediliyor: {url}{Colors.RESET}")
+def fetch_page(url, memo=None):
+    """Sayfayı indir ve paylaşılan PageSnapshot döndür
+    
+    memo (tarama başına PageMemo) verilirse aynı URL için tüm analizciler
+    tek indirmeyi paylaşır.
+    """
+    memo = memo if memo is not None else PageMemo()
+    return memo.get(url, timeout=10, verify=False, allow_redirects=True)
+
+def web_technology_detection(url, page=None, out=print):
+    """Web teknolojisi ve framework tespiti
+    
+    page verilirse (fetch_page sonucu) sayfa yeniden indirilmez. Tespit
+    data/tech_fingerprints.json'daki imzalarla yapılır: başlık, çerez, URL,
+    <meta>/<script src> etiketleri ve gövde literal'leri sayfa üzerinden
+    tek geçişte eşleştirilir.
+    """
+    out(f"\n{Colors.INFO}[*] Web teknolojileri tespit ediliyor: {url}{Colors.RESET}")
     
     technologies = {
         'cms': [],
@@ -223,90 +343,50 @@ def web_technology_detection(url):
         'programming_languages': []
     }
     
+    if TECH_DB is None:
+        out(f"{Colors.ERROR}[-] Teknoloji imza veritabanı yok{Colors.RESET}")
+        return technologies
+    
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10, verify=False, allow_redirects=True)
-        
-        # Response headers analizi
-        server = response.headers.get('Server', '')
-        if server:
-            technologies['web_servers'].append(server)
+        response = page if page is not None else fetch_page(url)
         
-        powered_by = response.headers.get('X-Powered-By', '')
-        if powered_by:
-            technologies['programming_languages'].append(powered_by)
+        unmatched = {}
+        matches = TECH_DB.analyze(
+            headers=response.headers,
+            cookies=response.cookies,
+            url=response.url,
+            html=response.text,
+            unmatched=unmatched
+        )
         
-        # HTML içerik analizi
-        soup = BeautifulSoup(response.text, 'html.parser')
+        for match in matches:
+            label = f"{match['name']} {match['version']}" if match['version'] else match['name']
+            entries = technologies.setdefault(match['category'], [])
+            if label not in entries:
+                entries.append(label)
         
-        # Meta tag'ler
-        meta_generator = soup.find('meta', attrs={'name': 'generator'})
-        if meta_generator:
-            technologies['cms'].append(meta_generator.get('content', ''))
+        for field, category in UNMATCHED_TECH_FIELDS.items():
+            value = unmatched.get(field)
+            if value and value not in technologies[category]:
+                technologies[category].append(value)
         
-        # WordPress tespiti
-        if 'wp-content' in response.text or 'wp-includes' in response.text:
-            technologies['cms'].append('WordPress')
-        
-        # Joomla tespiti
-        if 'joomla' in response.text.lower() or '/components/com_' in response.text:
-            technologies['cms'].append('Joomla')
-        
-        # Drupal tespiti
-        if 'Drupal' in response.text or '/sites/default/' in response.text:
-            technologies['cms'].append('Drupal')
-        
-        # JavaScript kütüphaneleri
-        scripts = soup.find_all('script', src=True)
-        for script in scripts:
-            src = script.get('src', '').lower()
-            if 'jquery' in src:
-                technologies['javascript_libraries'].append('jQuery')
-            elif 'angular' in src:
-                technologies['javascript_libraries'].append('AngularJS')
-            elif 'react' in src:
-                technologies['javascript_libraries'].append('React')
-            elif 'vue' in src:
-                technologies['javascript_libraries'].append('Vue.js')
-            elif 'bootstrap' in src:
-                technologies['javascript_libraries'].append('Bootstrap')
-        
-        # Analytics tespiti
-        if 'google-analytics.com' in response.text or 'gtag' in response.text:
-            technologies['analytics'].append('Google Analytics')
-        if 'googletagmanager.com' in response.text:
-            technologies['analytics'].append('Google Tag Manager')
-        if 'facebook.com/tr' in response.text:
-            technologies['analytics'].append('Facebook Pixel')
-        
-        # PHP tespiti
-        if '.php' in response.url or 'PHPSESSID' in response.cookies:
-            technologies['programming_languages'].append('PHP')
-        
-        # ASP.NET tespiti
-        if '.aspx' in response.url or 'ASP.NET' in response.headers.get('X-Powered-By', ''):
-            technologies['programming_languages'].append('ASP.NET')
-        
-        # Tekrarları kaldır
-        for key in technologies:
-            technologies[key] = list(set(technologies[key]))
-        
-        print(f"{Colors.SUCCESS}[+] Tespit Edilen Teknolojiler:{Colors.RESET}")
+        out(f"{Colors.SUCCESS}[+] Tespit Edilen Teknolojiler:{Colors.RESET}")
         for tech_type, tech_list in technologies.items():
             if tech_list:
-                print(f"  - {tech_type.replace('_', ' ').title()}: {', '.join(tech_list)}")
+                out(f"  - {tech_type.replace('_', ' ').title()}: {', '.join(tech_list)}")
         
         return technologies
         
     except Exception as e:
-        print(f"{Colors.ERROR}[-] Teknoloji tespit hatası: {e}{Colors.RESET}")
+        out(f"{Colors.ERROR}[-] Teknoloji tespit hatası: {e}{Colors.RESET}")
         return technologies
 
-def http_security_headers(url):
-    """HTTP güvenlik başlıkları analizi"""
-    print(f"\n{Colors.INFO}[*] Güvenlik başlıkları analiz ediliyor: {url}{Colors.RESET}")
+def http_security_headers(url, page=None, out=print):
+    """HTTP güvenlik başlıkları analizi
+    
+    page verilirse (fetch_page sonucu) sayfa yeniden indirilmez.
+    """
+    out(f"\n{Colors.INFO}[*] Güvenlik başlıkları analiz ediliyor: {url}{Colors.RESET}")
     
     security_headers = {
         'Strict-Transport-Security': 'HSTS - HTTPS zorlaması',
@@ -322,10 +402,7 @@ def http_security_headers(url):
     }
     
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10, verify=False)
+        response = page if page is not None else fetch_page(url)
         
         results = {
             'present': {},
@@ -334,7 +411,7 @@ def http_security_headers(url):
             'total': len(security_headers)
         }
         
-        print(f"\n{Colors.SUCCESS}[+] Güvenlik Başlıkları:{Colors.RESET}")
+        out(f"\n{Colors.SUCCESS}[+] Güvenlik Başlıkları:{Colors.RESET}")
         for header, description in security_headers.items():
             if header in response.headers:
                 results['present'][header] = {
@@ -342,123 +419,308 @@ def http_security_headers(url):
                     'description': description
                 }
                 results['score'] += 1
-                print(f"  {Colors.SUCCESS}✓ {header}{Colors.RESET}")
-                print(f"    {description}")
-                print(f"    Değer: {response.headers[header][:80]}")
+                out(f"  {Colors.SUCCESS}✓ {header}{Colors.RESET}")
+                out(f"    {description}")
+                out(f"    Değer: {response.headers[header][:80]}")
             else:
                 results['missing'].append({
                     'header': header,
                     'description': description
                 })
-                print(f"  {Colors.ERROR}✗ {header}{Colors.RESET}")
-                print(f"    {description} - EKSİK")
+                out(f"  {Colors.ERROR}✗ {header}{Colors.RESET}")
+                out(f"    {description} - EKSİK")
         
         percentage = (results['score'] / results['total']) * 100
-        print(f"\n{Colors.INFO}[*] Güvenlik Skoru: {results['score']}/{results['total']} ({percentage:.1f}%){Colors.RESET}")
+        out(f"\n{Colors.INFO}[*] Güvenlik Skoru: {results['score']}/{results['total']} ({percentage:.1f}%){Colors.RESET}")
         
         return results
         
     except Exception as e:
-        print(f"{Colors.ERROR}[-] HTTP analiz hatası: {e}{Colors.RESET}")
+        out(f"{Colors.ERROR}[-] HTTP analiz hatası: {e}{Colors.RESET}")
         return None
 
-def subdomain_enumeration(domain, wordlist=None):
-    """Subdomain keşfi"""
-    print(f"\n{Colors.INFO}[*] Subdomain keşfi yapılıyor: {domain}{Colors.RESET}")
-    
-    # Varsayılan subdomain listesi
-    default_subdomains = [
-        'www', 'mail', 'ftp', 'localhost', 'webmail', 'smtp', 'pop', 'ns1', 'ns2',
-        'webdisk', 'ns', 'cpanel', 'whm', 'autodiscover', 'autoconfig', 'm', 'mobile',
-        'dev', 'test', 'staging', 'beta', 'admin', 'api', 'blog', 'shop', 'forum',
-        'news', 'help', 'support', 'portal', 'secure', 'vpn', 'remote', 'cloud',
-        'cdn', 'assets', 'static', 'media', 'files', 'download', 'upload', 'img',
-        'images', 'video', 'chat', 'gitlab', 'git', 'svn', 'demo', 'app', 'apps'
-    ]
+DEFAULT_SUBDOMAIN_WORKERS = 50   # Aynı anda bekleyen DNS sorgusu
+
+WILDCARD_PROBES = 3   # Wildcard tespiti için sorgulanan rastgele etiket sayısı
+
+def detect_wildcard(domain, resolver=None, probes=WILDCARD_PROBES):
+    """Wildcard DNS tespiti
+    
+    Var olması imkânsız rastgele etiketleri çözer; yanıt gelirse dönen
+    IP'lerin birleşimi wildcard parmak izidir. Wildcard yoksa boş küme döner.
+    resolver bir UdpResolver ise problar tek turda birlikte gönderilir;
+    hiçbir sunucu yanıt vermezse DnsError fırlatılır.
+    """
+    labels = [f"{secrets.token_hex(8)}.{domain}" for _ in range(probes)]
+    if isinstance(resolver, UdpResolver):
+        answers = resolver.lookup(labels).values()
+        if all(answer.rcode is None for answer in answers):
+            raise DnsError("DNS sunucu havuzundan yanıt alınamadı")
+        return frozenset(ip for answer in answers for ip in answer.addresses)
+    resolver = resolver or get_resolver()
+    wildcard_ips = set()
+    for name in labels:
+        try:
+            answers = resolver.resolve(name, 'A')
+        except Exception:
+            continue
+        wildcard_ips.update(str(rdata) for rdata in answers)
+    return frozenset(wildcard_ips)
+
+def parent_names(subdomain, domain):
+    """a.b.example.com için b.example.com gibi ara ebeveynleri üret"""
+    labels = subdomain[:-len(domain) - 1].split('.')
+    for i in range(1, len(labels)):
+        yield '.'.join(labels[i:]) + '.' + domain
+
+def open_udp_resolver(nameservers=None, out=print):
+    """Ayarlardaki DNS sunucu havuzuyla UdpResolver kur; kurulamazsa None"""
+    try:
+        return UdpResolver.from_settings(nameservers)
+    except (ValueError, OSError) as e:
+        out(f"{Colors.WARNING}[!] DNS sunucu havuzu kurulamadı ({e}), sistem çözücüsü kullanılacak{Colors.RESET}")
+        return None
+
+def tls_san_discovery(domain, hosts, out=print):
+    """Hostların TLS sertifikalarındaki SAN adlarından kapsam içi isimleri topla
+    
+    Tüm hostlar paylaşılan prob motoruyla eşzamanlı el sıkışır; aynı
+    joker sertifikayı sunan hostların sertifikası yalnızca bir kez çözülür.
+    """
+    results = get_tls_prober(out).probe_many(hosts)
+    reachable = sum(1 for result in results if result.ok)
+    names = san_names(results, domain)
+    out(f"{Colors.INFO}[*] TLS: {reachable}/{len(results)} host yanıt verdi, {len(names)} SAN adı{Colors.RESET}")
+    return names
+
+def subdomain_enumeration(domain, wordlist=None, workers=DEFAULT_SUBDOMAIN_WORKERS, permute=False,
+                          san_discovery=False, use_udp=True, nameservers=None, out=print, cancel=None):
+    """Subdomain keşfi
+    
+    wordlist bir liste, data/wordlists/ altındaki bir liste adı ya da dosya
+    yolu olabilir (boşsa varsayılan liste); dosyalar mmap ile akıtılır ve
+    tekrarlar elenir. permute=True ise her kelimenin önek/sonek/numara
+    türevleri de tembel olarak üretilir.
+    
+    use_udp açıksa isimler ayarlardaki (ya da nameservers ile verilen) DNS
+    sunucu havuzuna ham UDP ile gönderilir (UdpResolver). Havuz
+    kurulamazsa ya da hiçbir sunucu yanıt vermezse dnspython ile çalışan
+    sabit sayıda işçi thread'e geri dönülür; bu yolda aynı anda en fazla
+    `workers` sorgu bekler.
+    
+    Tarama öncesi wildcard DNS tespit edilir ve yalnızca wildcard IP'lerine
+    çözülen isimler sonuçlardan elenir. NXDOMAIN dönen isimler saklanır;
+    altındaki daha derin isimler (dev.api → api ölü ise) hiç sorgulanmaz.
+    
+    san_discovery açıksa (varsayılan kapalı; her hosta TLS bağlantısı
+    açar) domain ve bulunan tüm subdomainler 443'te tek
+    eşzamanlı TLS turunda problanır; sertifikaların SAN listesinde geçen
+    yeni isimler de aynı filtrelerle çözülüp sonuçlara eklenir.
+    
+    Çıktı out ile yazılır (kapsamlı taramada aşamanın StageLog'u); cancel
+    (threading.Event) set edilince yeni isim sorgulanmaz, tarama elindeki
+    sonuçlarla döner.
+    """
+    out(f"\n{Colors.INFO}[*] Subdomain keşfi yapılıyor: {domain}{Colors.RESET}")
     
-    subdomains = wordlist if wordlist else default_subdomains
     found = []
+    found_lock = threading.Lock()
+    udp = open_udp_resolver(nameservers, out) if use_udp else None
+    resolver = get_resolver()
     
-    def check_subdomain(sub):
-        subdomain = f"{sub}.{domain}"
+    if udp is not None:
         try:
-            answers = dns.resolver.resolve(subdomain, 'A')
-            ips = [str(rdata) for rdata in answers]
+            wildcard_ips = detect_wildcard(domain, udp)
+        except DnsError as e:
+            out(f"{Colors.WARNING}[!] {e}, sistem çözücüsü kullanılacak{Colors.RESET}")
+            udp = None
+    if udp is None:
+        wildcard_ips = detect_wildcard(domain, resolver)
+    if wildcard_ips:
+        out(f"{Colors.WARNING}[!] Wildcard DNS tespit edildi → {', '.join(sorted(wildcard_ips))}{Colors.RESET}")
+    dead_names = set()
+    stats = {'wildcard': 0, 'skipped': 0}
+    
+    def under_dead_parent(subdomain):
+        if dead_names and any(parent in dead_names for parent in parent_names(subdomain, domain)):
+            with found_lock:
+                stats['skipped'] += 1
+            return True
+        return False
+    
+    def record(subdomain, ips, source):
+        if wildcard_ips and wildcard_ips.issuperset(ips):
+            with found_lock:
+                stats['wildcard'] += 1
+            return
+        with found_lock:
             found.append({
                 'subdomain': subdomain,
-                'ips': ips
+                'ips': ips,
+                'source': source
             })
-            print(f"{Colors.SUCCESS}[+] Bulundu: {subdomain} → {', '.join(ips)}{Colors.RESET}")
-        except:
-            pass
+        out(f"{Colors.SUCCESS}[+] Bulundu: {subdomain} → {', '.join(ips)}{Colors.RESET}")
+    
+    def check_subdomain(subdomain, source='wordlist'):
+        if under_dead_parent(subdomain):
+            return
+        try:
+            answers = resolver.resolve(subdomain, 'A')
+        except dns.resolver.NXDOMAIN:
+            dead_names.add(subdomain)
+            return
+        except Exception:
+            return
+        record(subdomain, [str(rdata) for rdata in answers], source)
+    
+    def resolve_threaded(names, source):
+        names_lock = threading.Lock()
+        
+        def worker():
+            while True:
+                with names_lock:
+                    name = next(names, None)
+                if name is None:
+                    return
+                check_subdomain(name, source)
+        
+        threads = [threading.Thread(target=worker, daemon=True) for _ in range(workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    
+    def resolve_udp(names, source):
+        """UDP havuzuyla çöz; hiçbir sunucu yanıt vermediyse False"""
+        answered = [0]
+        
+        def pending():
+            for name in names:
+                if not under_dead_parent(name):
+                    yield name
+        
+        def on_result(answer):
+            if answer.rcode is not None:
+                answered[0] += 1
+            if answer.nxdomain:
+                dead_names.add(answer.name)
+            elif answer.exists:
+                record(answer.name, answer.addresses, source)
+        
+        udp.resolve_many(pending(), on_result)
+        return answered[0] > 0
+    
+    def until_cancelled(names):
+        for name in names:
+            if cancel is not None and cancel.is_set():
+                return
+            yield name
+    
+    def resolve_names(make_names, source):
+        nonlocal udp
+        if udp is not None:
+            if resolve_udp(until_cancelled(make_names()), source):
+                return
+            out(f"{Colors.WARNING}[!] DNS havuzundan yanıt alınamadı, sistem çözücüsüyle tekrar deneniyor{Colors.RESET}")
+            udp = None
+        resolve_threaded(until_cancelled(make_names()), source)
     
-    threads = []
-    for sub in subdomains:
-        thread = threading.Thread(target=check_subdomain, args=(sub,))
-        thread.start()
-        threads.append(thread)
-        time.sleep(0.01)
+    resolve_names(lambda: (f"{sub}.{domain}" for sub in stream_wordlist(wordlist or None, permute=permute)),
+                  'wordlist')
     
-    for thread in threads:
-        thread.join()
+    if san_discovery and not (cancel is not None and cancel.is_set()):
+        known = {entry['subdomain'] for entry in found}
+        candidates = tls_san_discovery(domain, [domain, *sorted(known)], out) - known - {domain}
+        if candidates:
+            out(f"{Colors.INFO}[*] Sertifikalardan {len(candidates)} yeni isim çözülüyor{Colors.RESET}")
+            resolve_names(lambda: iter(sorted(candidates)), 'tls_san')
     
-    print(f"\n{Colors.INFO}[*] Toplam {len(found)} subdomain bulundu{Colors.RESET}")
+    if stats['wildcard']:
+        out(f"{Colors.INFO}[*] {stats['wildcard']} isim wildcard yanıtı olduğu için elendi{Colors.RESET}")
+    if stats['skipped']:
+        out(f"{Colors.INFO}[*] {stats['skipped']} isim NXDOMAIN ebeveyn nedeniyle atlandı{Colors.RESET}")
+    if udp is not None:
+        for health in udp.health():
+            state = 'sağlıklı' if health['healthy'] else 'sorunlu'
+            out(f"{Colors.INFO}    • {health['nameserver']}: {health['answered']}/{health['sent']} yanıt ({state}){Colors.RESET}")
+    out(f"\n{Colors.INFO}[*] Toplam {len(found)} subdomain bulundu{Colors.RESET}")
     return found
 
-def reverse_ip_lookup(domain):
-    """Aynı IP'deki diğer domainler"""
-    print(f"\n{Colors.INFO}[*] Reverse IP lookup yapılıyor: {domain}{Colors.RESET}")
+def reverse_ip_lookup(domain, ip=None, out=print):
+    """Aynı IP'deki diğer domainler (ip verilmezse domain çözülür)"""
+    out(f"\n{Colors.INFO}[*] Reverse IP lookup yapılıyor: {domain}{Colors.RESET}")
     
     try:
         # Domain'in IP'sini al
-        ip = socket.gethostbyname(domain)
-        print(f"{Colors.INFO}[*] IP Adresi: {ip}{Colors.RESET}")
+        if ip is None:
+            ip = socket.gethostbyname(domain)
+        out(f"{Colors.INFO}[*] IP Adresi: {ip}{Colors.RESET}")
         
         # HackerTarget API
         url = f"https://api.hackertarget.com/reverseiplookup/?q={ip}"
-        response = requests.get(url, timeout=10)
+        response = http_get(url, timeout=10)
         
         if response.status_code == 200 and "error" not in response.text.lower():
             domains = [d.strip() for d in response.text.strip().split('\n')]
-            print(f"{Colors.SUCCESS}[+] Aynı IP'de {len(domains)} domain bulundu:{Colors.RESET}")
+            out(f"{Colors.SUCCESS}[+] Aynı IP'de {len(domains)} domain bulundu:{Colors.RESET}")
             for d in domains[:20]:
-                print(f"    • {d}")
+                out(f"    • {d}")
             return {'ip': ip, 'domains': domains}
         else:
-            print(f"{Colors.WARNING}[!] API'den sonuç alınamadı{Colors.RESET}")
+            out(f"{Colors.WARNING}[!] API'den sonuç alınamadı{Colors.RESET}")
             return {'ip': ip, 'domains': []}
             
     except Exception as e:
-        print(f"{Colors.ERROR}[-] Reverse IP hatası: {e}{Colors.RESET}")
+        out(f"{Colors.ERROR}[-] Reverse IP hatası: {e}{Colors.RESET}")
         return None
 
-def wayback_machine_check(domain):
+def wayback_machine_check(domain, out=print):
     """Wayback Machine arşiv kontrolü"""
-    print(f"\n{Colors.INFO}[*] Wayback Machine arşivi kontrol ediliyor: {domain}{Colors.RESET}")
+    out(f"\n{Colors.INFO}[*] Wayback Machine arşivi kontrol ediliyor: {domain}{Colors.RESET}")
     
     try:
         url = f"http://archive.org/wayback/available?url={domain}"
-        response = requests.get(url, timeout=10)
+        response = http_get(url, timeout=10)
         data = response.json()
         
         if 'archived_snapshots' in data and data['archived_snapshots']:
             closest = data['archived_snapshots'].get('closest', {})
             if closest:
-                print(f"{Colors.SUCCESS}[+] Arşiv bulundu:{Colors.RESET}")
-                print(f"    URL: {closest.get('url', 'N/A')}")
-                print(f"    Tarih: {closest.get('timestamp', 'N/A')}")
-                print(f"    Durum: {closest.get('status', 'N/A')}")
+                out(f"{Colors.SUCCESS}[+] Arşiv bulundu:{Colors.RESET}")
+                out(f"    URL: {closest.get('url', 'N/A')}")
+                out(f"    Tarih: {closest.get('timestamp', 'N/A')}")
+                out(f"    Durum: {closest.get('status', 'N/A')}")
                 return closest
         
-        print(f"{Colors.WARNING}[!] Arşiv bulunamadı{Colors.RESET}")
+        out(f"{Colors.WARNING}[!] Arşiv bulunamadı{Colors.RESET}")
         return None
         
     except Exception as e:
-        print(f"{Colors.ERROR}[-] Wayback Machine hatası: {e}{Colors.RESET}")
+        out(f"{Colors.ERROR}[-] Wayback Machine hatası: {e}{Colors.RESET}")
         return None
 
+# Kapsamlı taramanın aşama süre sınırları (saniye)
+STAGE_TIMEOUTS = {
+    'whois': 30,
+    'dns': 20,
+    'ssl': 20,
+    'fetch': 20,
+    'security_headers': 10,
+    'technologies': 10,
+    'subdomains': 180,
+    'reverse_ip': 20,
+    'wayback': 20
+}
+
 def comprehensive_domain_scan(domain):
-    """Kapsamlı domain taraması - tüm analizler"""
+    """Kapsamlı domain taraması - tüm analizler
+    
+    Aşamalar bir bağımlılık grafiği olarak tanımlanır ve bağımsız olanlar
+    eşzamanlı çalışır: güvenlik başlıkları ile teknoloji tespiti tek bir
+    sayfa indirmesini paylaşır, reverse IP DNS aşamasının A kaydını
+    kullanır. Her aşamanın STAGE_TIMEOUTS'ta bir süre sınırı vardır;
+    sonuçlar aşamalar bittikçe results['scans'] altına eklenir.
+    """
     print(f"\n{Colors.HEADER}{'='*70}")
     print(f"  KAPSAMLI DOMAIN ANALİZİ BAŞLIYOR: {domain}")
     print(f"{'='*70}{Colors.RESET}\n")
@@ -466,46 +728,62 @@ def comprehensive_domain_scan(domain):
     results = {
         'domain': domain,
         'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-        'scans': {}
+        'scans': {},
+        'timing': {}
     }
+    url = f"https://{domain}"
+    pages = PageMemo()
     
-    # 1. WHOIS
-    print(f"\n{Colors.MENU}[1/9] WHOIS Analizi{Colors.RESET}")
-    results['scans']['whois'] = whois_lookup(domain)
-    
-    # 2. DNS
-    print(f"\n{Colors.MENU}[2/9] DNS Analizi{Colors.RESET}")
-    results['scans']['dns'] = dns_enumeration(domain)
-    
-    # 3. SSL/TLS
-    print(f"\n{Colors.MENU}[3/9] SSL/TLS Analizi{Colors.RESET}")
-    results['scans']['ssl'] = ssl_certificate_info(domain)
+    def fetch(out):
+        try:
+            return fetch_page(url, pages)
+        except Exception as e:
+            out(f"{Colors.ERROR}[-] Sayfa indirilemedi: {e}{Colors.RESET}")
+            return None
     
-    # 4. HTTP/HTTPS
-    url = f"https://{domain}"
-    print(f"\n{Colors.MENU}[4/9] HTTP Güvenlik Başlıkları{Colors.RESET}")
-    results['scans']['security_headers'] = http_security_headers(url)
+    def with_page(analyze):
+        def run(page, out):
+            if page is None:
+                out(f"{Colors.WARNING}[!] Sayfa alınamadığı için atlandı{Colors.RESET}")
+                return None
+            return analyze(url, page, out=out)
+        return run
     
-    # 5. Web Teknolojileri
-    print(f"\n{Colors.MENU}[5/9] Web Teknoloji Tespiti{Colors.RESET}")
-    results['scans']['technologies'] = web_technology_detection(url)
+    def reverse_ip(dns_records, out):
+        a_records = (dns_records or {}).get('A') or []
+        return reverse_ip_lookup(domain, a_records[0] if a_records else None, out=out)
     
-    # 6. Subdomain Keşfi
-    print(f"\n{Colors.MENU}[6/9] Subdomain Keşfi{Colors.RESET}")
-    results['scans']['subdomains'] = subdomain_enumeration(domain)
+    stages = [
+        Stage('whois', lambda out: whois_lookup(domain, out=out), label='WHOIS Analizi'),
+        Stage('dns', lambda out: dns_enumeration(domain, out=out), label='DNS Analizi'),
+        Stage('ssl', lambda out: ssl_certificate_info(domain, out=out), label='SSL/TLS Analizi'),
+        Stage('fetch', fetch, label='Sayfa İndirme'),
+        Stage('security_headers', with_page(http_security_headers), deps=['fetch'], label='HTTP Güvenlik Başlıkları'),
+        Stage('technologies', with_page(web_technology_detection), deps=['fetch'], label='Web Teknoloji Tespiti'),
+        Stage('subdomains', lambda out: subdomain_enumeration(domain, out=out, cancel=out.cancelled),
+              label='Subdomain Keşfi'),
+        Stage('reverse_ip', reverse_ip, deps=['dns'], label='Reverse IP Lookup'),
+        Stage('wayback', lambda out: wayback_machine_check(domain, out=out), label='Wayback Machine Kontrolü')
+    ]
+    for stage in stages:
+        stage.timeout = STAGE_TIMEOUTS.get(stage.name)
+    reported = [stage for stage in stages if stage.name != 'fetch']
     
-    # 7. Reverse IP
-    print(f"\n{Colors.MENU}[7/9] Reverse IP Lookup{Colors.RESET}")
-    results['scans']['reverse_ip'] = reverse_ip_lookup(domain)
+    def on_done(stage, status, result, elapsed):
+        results['timing'][stage.name] = {'status': status, 'elapsed': round(elapsed, 2)}
+        if stage.name == 'fetch':
+            return
+        results['scans'][stage.name] = result
+        position = len(results['scans'])
+        color = Colors.SUCCESS if status == STATUS_OK else Colors.ERROR
+        print(f"{color}[{position}/{len(reported)}] {stage.label} → {status} ({elapsed:.1f} sn){Colors.RESET}")
     
-    # 8. Wayback Machine
-    print(f"\n{Colors.MENU}[8/9] Wayback Machine Kontrolü{Colors.RESET}")
-    results['scans']['wayback'] = wayback_machine_check(domain)
+    started = time.monotonic()
+    run_graph(stages, on_done=on_done)
+    total = time.monotonic() - started
     
-    # 9. Özet
-    print(f"\n{Colors.MENU}[9/9] Özet Rapor Oluşturuluyor{Colors.RESET}")
     print(f"\n{Colors.HEADER}{'='*70}")
-    print(f"  ANALİZ TAMAMLANDI!")
+    print(f"  ANALİZ TAMAMLANDI! ({total:.1f} sn)")
     print(f"{'='*70}{Colors.RESET}\n")
     
     return results
@@ -573,10 +851,22 @@ def domain_search_menu():
                     save_result(f"tech_{domain}", result)
         elif choice == '6':
             domain = input(f"\n{Colors.INPUT}Domain adı: {Colors.RESET}").strip()
-            if domain:
-                result = subdomain_enumeration(domain)
-                if result:
-                    save_result(f"subdomains_{domain}", result)
+            available = ', '.join(list_wordlists()) or '-'
+            wordlist = input(f"{Colors.INPUT}Kelime listesi adı ya da dosyası [{available}] (boş = varsayılan): {Colors.RESET}").strip()
+            permute = input(f"{Colors.INPUT}Permütasyon üretilsin mi? (E/H): {Colors.RESET}").strip().upper() in ['E', 'Y', 'EVET', 'YES']
+            servers = input(f"{Colors.INPUT}DNS sunucuları (virgülle, boş = ayarlar/sistem): {Colors.RESET}").strip()
+            nameservers = [server.strip() for server in servers.split(',') if server.strip()] or None
+            san_discovery = input(f"{Colors.INPUT}Bulunan hostların TLS sertifikalarından (SAN) yeni isim aransın mı? (E/H): {Colors.RESET}").strip().upper() in ['E', 'Y', 'EVET', 'YES']
+            try:
+                resolve_wordlist(wordlist or None)
+            except FileNotFoundError as e:
+                print(f"{Colors.ERROR}[-] {e}{Colors.RESET}")
+            else:
+                if domain:
+                    result = subdomain_enumeration(domain, wordlist or None, permute=permute,
+                                                   nameservers=nameservers, san_discovery=san_discovery)
+                    if result:
+                        save_result(f"subdomains_{domain}", result)
         elif choice == '7':
             domain = input(f"\n{Colors.INPUT}Domain adı: {Colors.RESET}").strip()
             if domain:
@@ -12,7 +12,6 @@ import json
 import re
 import socket
 import dns.resolver
-import requests
 import hashlib
 from datetime import datetime
 from pathlib import Path
@@ -23,6 +22,11 @@ import threading
 from queue import Queue
 import time
 
+try:
+    from modules.http_client import http_get
+except ImportError:
+    from http_client import http_get
+
 try:
     import phonenumbers
 except ImportError:
@@ -211,7 +215,7 @@ def check_disposable_email(domain):
     # DisposableEmailChecker API
     try:
         url = f"https://open.kickbox.com/v1/disposable/{domain}"
-        response = requests.get(url, timeout=5)
+        response = http_get(url, timeout=5)
         if response.status_code == 200:
             data = response.json()
             is_disposable = data.get('disposable', is_disposable)
@@ -243,7 +247,7 @@ def haveibeenpwned_check(email):
             'hibp-api-key': ''  # API key gerekli
         }
         
-        response = requests.get(url, headers=headers, timeout=10)
+        response = http_get(url, headers=headers, timeout=10)
         
         if response.status_code == 200:
             breaches = response.json()
@@ -332,7 +336,7 @@ def email_reputation_check(email):
     
     try:
         # StopForumSpam API
-        response = requests.get(spam_databases[0], timeout=5)
+        response = http_get(spam_databases[0], timeout=5)
         if response.status_code == 200:
             data = response.json()
             if 'email' in data and 'appears' in data['email']:
@@ -414,7 +418,7 @@ def social_media_search(email):
     # Gravatar kontrolü
     try:
         gravatar_url = platforms['Gravatar']
-        response = requests.get(gravatar_url, timeout=5)
+        response = http_get(gravatar_url, timeout=5)
         if response.status_code == 200:
             print(f"\n{Colors.SUCCESS}[+] Gravatar profili bulundu!{Colors.RESET}")
     except:
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Fingerprints Module - Servis ve Web Teknolojisi Parmak İzi Eşleştirici
+data/service_fingerprints.json (banner) ve data/tech_fingerprints.json
+(web sayfası) imzalarını bir kez derleyip metinlerde imza sayısından
+bağımsız, tek geçişte eşleştirir
+"""
+
+import json
+import re
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+FINGERPRINTS_FILE = BASE_DIR / 'data' / 'service_fingerprints.json'
+TECH_FINGERPRINTS_FILE = BASE_DIR / 'data' / 'tech_fingerprints.json'
+
+# <meta ...> ve <script ...> açılış etiketleri ile etiket içindeki nitelikler
+TAG_PATTERN = re.compile(r'<(meta|script)\b([^>]*)>', re.IGNORECASE)
+ATTR_PATTERN = re.compile(r'([a-zA-Z_:][-\w:.]*)\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'=<>`]+))')
+
+
+class LiteralMatcher:
+    """Çok desenli literal eşleştirici: tüm literal'leri metinde tek geçişte bulur
+
+    Literal'ler bir önek ağacına (trie) dizilip tek bir regex'e derlenir;
+    arama C'deki regex motorunda tek geçişte yapılır ve her konumda yalnızca
+    ağacın derinliği kadar karşılaştırma gerekir, böylece literal sayısı
+    arttıkça süre doğrusal büyümez. Lookahead sayesinde iç içe/örtüşen
+    literal'ler de bulunur. Eşleşme büyük/küçük harf duyarsızdır.
+    """
+
+    def __init__(self, literals):
+        self.literals = [literal.lower() for literal in literals]
+        self._owners = {}
+        for index, literal in enumerate(self.literals):
+            self._owners.setdefault(literal, []).append(index)
+        # Bir konumda en uzun literal eşleşir; onun önekleri olan literal'ler
+        # de aynı konumda vardır
+        self._prefixes = {
+            literal: [index for end in range(1, len(literal) + 1)
+                      for index in self._owners.get(literal[:end], ())]
+            for literal in self._owners
+        }
+        pattern = self._compile(self._owners)
+        self._regex = re.compile(f"(?=({pattern}))") if pattern else None
+
+    @staticmethod
+    def _compile(literals):
+        root = {}
+        for literal in literals:
+            node = root
+            for char in literal:
+                node = node.setdefault(char, {})
+            node[''] = True
+
+        def emit(node):
+            branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+            if not branches:
+                return ''
+            body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+            return f"(?:{body})?" if '' in node else body
+
+        return emit(root)
+
+    def search(self, text):
+        """Metinde geçen literal'lerin indekslerini (sıralı) döndür"""
+        if self._regex is None:
+            return []
+        found = set()
+        seen = set()
+        for match in self._regex.finditer(text.lower()):
+            literal = match.group(1)
+            if literal not in seen:
+                seen.add(literal)
+                found.update(self._prefixes[literal])
+        return sorted(found)
+
+
+def iter_tags(html):
+    """HTML'deki <meta> ve <script> etiketlerini (ad, nitelik sözlüğü) olarak akıt
+
+    Ağaç kurulmaz; etiketler tek bir regex taramasıyla sırayla üretilir.
+    Nitelik adları küçük harfe çevrilir, değerler olduğu gibi bırakılır.
+    """
+    for tag in TAG_PATTERN.finditer(html):
+        attrs = {}
+        for attr in ATTR_PATTERN.finditer(tag.group(2)):
+            value = attr.group(2)
+            if value is None:
+                value = attr.group(3) if attr.group(3) is not None else attr.group(4)
+            attrs[attr.group(1).lower()] = value
+        yield tag.group(1).lower(), attrs
+
+
+class Signature:
+    """Tek bir servis imzası: zorunlu literal + isteğe bağlı sürüm regex'i"""
+
+    __slots__ = ('service', 'product', 'literal', 'regex')
+
+    def __init__(self, entry):
+        self.service = entry['service']
+        self.product = entry.get('product')
+        self.literal = entry['literal']
+        if not self.literal:
+            raise ValueError(f"{self.service}: literal boş olamaz")
+        pattern = entry.get('regex')
+        self.regex = re.compile(pattern, re.IGNORECASE) if pattern else None
+
+    def match(self, text):
+        """Eşleşirse {'service', 'product', 'version'} döndür"""
+        version = None
+        if self.regex is not None:
+            found = self.regex.search(text)
+            if not found:
+                return None
+            version = found.group(1) if found.groups() else None
+        return {'service': self.service, 'product': self.product, 'version': version}
+
+
+class VulnerabilityRule:
+    """Port, servis ya da ürün/sürüm koşuluna bağlı güvenlik uyarısı"""
+
+    __slots__ = ('port', 'service', 'product', 'version', 'severity', 'issue')
+
+    def __init__(self, entry):
+        self.port = entry.get('port')
+        self.service = entry.get('service')
+        self.product = entry.get('product')
+        version = entry.get('version')
+        self.version = re.compile(version) if version else None
+        self.severity = entry['severity']
+        self.issue = entry['issue']
+
+    def applies(self, port_info):
+        if self.port is not None and port_info.get('port') != self.port:
+            return False
+        if self.service is not None and port_info.get('service') != self.service:
+            return False
+        if self.product is not None and port_info.get('product') != self.product:
+            return False
+        if self.version is not None and not self.version.search(port_info.get('version') or ''):
+            return False
+        return True
+
+
+class FingerprintDB:
+    """Derlenmiş port adları, servis imzaları ve güvenlik kuralları"""
+
+    def __init__(self, data):
+        self.ports = {int(port): name for port, name in data.get('ports', {}).items()}
+        self.signatures = [Signature(entry) for entry in data.get('signatures', [])]
+        self.matcher = LiteralMatcher([signature.literal for signature in self.signatures])
+        self.rules = [VulnerabilityRule(entry) for entry in data.get('vulnerabilities', [])]
+        self._port_rules = {}
+        self._other_rules = []
+        for rule in self.rules:
+            if rule.port is not None:
+                self._port_rules.setdefault(rule.port, []).append(rule)
+            else:
+                self._other_rules.append(rule)
+
+    def identify(self, banner):
+        """Banner'a uyan ilk (dosya sırasına göre) imzanın sonucunu döndür"""
+        if not banner:
+            return None
+        for index in self.matcher.search(banner):
+            result = self.signatures[index].match(banner)
+            if result is not None:
+                return result
+        return None
+
+    def service_name(self, port):
+        """Port numarasına karşılık gelen servis adı (yoksa None)"""
+        return self.ports.get(port)
+
+    def vulnerabilities(self, port_info):
+        """Açık port kaydına uyan güvenlik kuralları"""
+        candidates = self._port_rules.get(port_info.get('port'), []) + self._other_rules
+        return [rule for rule in candidates if rule.applies(port_info)]
+
+
+def load_fingerprint_db(path=FINGERPRINTS_FILE):
+    """Parmak izi veritabanını yükle ve derle"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return FingerprintDB(json.load(f))
+
+
+class Technology:
+    """Tek bir web teknolojisi imzası
+
+    headers/meta: {ad: regex} (boş regex = yalnızca varlık); regex'in ilk
+    grubu varsa sürüm olarak alınır. cookies: çerez adları. scripts, body,
+    url: küçük harf duyarsız literal'ler.
+    """
+
+    __slots__ = ('name', 'category', 'headers', 'meta', 'cookies', 'scripts', 'body', 'url')
+
+    def __init__(self, entry):
+        self.name = entry['name']
+        self.category = entry['category']
+        self.headers = {name.lower(): self._compile(pattern) for name, pattern in entry.get('headers', {}).items()}
+        self.meta = {name.lower(): self._compile(pattern) for name, pattern in entry.get('meta', {}).items()}
+        self.cookies = [cookie.lower() for cookie in entry.get('cookies', [])]
+        self.scripts = [literal.lower() for literal in entry.get('scripts', [])]
+        self.body = [literal.lower() for literal in entry.get('body', [])]
+        self.url = [literal.lower() for literal in entry.get('url', [])]
+
+    @staticmethod
+    def _compile(pattern):
+        return re.compile(pattern, re.IGNORECASE) if pattern else None
+
+
+class TechFingerprintDB:
+    """Derlenmiş web teknolojisi imzaları
+
+    Gövde ve script src literal'leri birer LiteralMatcher'da toplanır; başlık,
+    çerez ve meta imzaları ada göre indekslenir. Bir sayfanın analizi imza
+    sayısına değil sayfadaki başlık/etiket sayısına ve gövde uzunluğuna
+    bağlıdır.
+    """
+
+    def __init__(self, data):
+        self.technologies = [Technology(entry) for entry in data.get('technologies', [])]
+        self._headers = {}
+        self._meta = {}
+        self._cookies = {}
+        body_literals, body_owners = [], []
+        script_literals, script_owners = [], []
+        self._url = []
+        for index, tech in enumerate(self.technologies):
+            for name, regex in tech.headers.items():
+                self._headers.setdefault(name, []).append((index, regex))
+            for name, regex in tech.meta.items():
+                self._meta.setdefault(name, []).append((index, regex))
+            for cookie in tech.cookies:
+                self._cookies.setdefault(cookie, []).append(index)
+            for literal in tech.body:
+                body_literals.append(literal)
+                body_owners.append(index)
+            for literal in tech.scripts:
+                script_literals.append(literal)
+                script_owners.append(index)
+            for literal in tech.url:
+                self._url.append((literal, index))
+        self._body = LiteralMatcher(body_literals)
+        self._body_owners = body_owners
+        self._scripts = LiteralMatcher(script_literals)
+        self._script_owners = script_owners
+
+    @staticmethod
+    def _hit(found, index, regex, value):
+        """regex uyarsa (varsa sürümüyle) found'a ekle; eşleşme olduysa True"""
+        if regex is None:
+            found.setdefault(index, None)
+            return True
+        match = regex.search(value)
+        if not match:
+            return False
+        version = match.group(1) if match.groups() else None
+        if version or index not in found:
+            found[index] = version
+        return True
+
+    def _match_field(self, found, candidates, value):
+        matched = False
+        for index, regex in candidates:
+            matched = self._hit(found, index, regex, value) or matched
+        return matched
+
+    def analyze(self, headers=None, cookies=None, url='', html='', unmatched=None):
+        """Sayfada bulunan teknolojiler → [{'name', 'category', 'version'}]
+
+        Sonuç imza dosyasındaki sırayı izler. unmatched sözlüğü verilirse
+        imzası olan ama hiçbir imzaya uymayan başlık ve meta değerleri
+        ('server', 'meta:generator' gibi anahtarlarla) ham haliyle eklenir.
+        """
+        found = {}
+        for name, value in (headers or {}).items():
+            candidates = self._headers.get(name.lower())
+            if candidates and not self._match_field(found, candidates, value) and unmatched is not None:
+                unmatched[name.lower()] = value
+        for cookie in (cookies or {}):
+            for index in self._cookies.get(cookie.lower(), ()):
+                found.setdefault(index, None)
+        lowered_url = (url or '').lower()
+        for literal, index in self._url:
+            if literal in lowered_url:
+                found.setdefault(index, None)
+
+        sources = []
+        for tag, attrs in iter_tags(html):
+            if tag == 'meta':
+                name = (attrs.get('name') or attrs.get('property') or '').lower()
+                candidates = self._meta.get(name)
+                content = attrs.get('content') or ''
+                if candidates and not self._match_field(found, candidates, content) and unmatched is not None:
+                    unmatched[f"meta:{name}"] = content
+            elif attrs.get('src'):
+                sources.append(attrs['src'])
+        if sources:
+            for literal_index in self._scripts.search('\n'.join(sources)):
+                found.setdefault(self._script_owners[literal_index], None)
+        for literal_index in self._body.search(html):
+            found.setdefault(self._body_owners[literal_index], None)
+
+        return [
+            {'name': self.technologies[index].name,
+             'category': self.technologies[index].category,
+             'version': found[index]}
+            for index in sorted(found)
+        ]
+
+
+def load_tech_fingerprints(path=TECH_FINGERPRINTS_FILE):
+    """Web teknolojisi imza veritabanını yükle ve derle"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return TechFingerprintDB(json.load(f))
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+HTTP Client Module - Ortak HTTP İstemci Katmanı
+settings.json'a göre yapılandırılmış, bağlantıları yeniden kullanan
+requests.Session (senkron) ve aiohttp.ClientSession (asenkron) fabrikası
+"""
+
+import asyncio
+import concurrent.futures
+import inspect
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    from modules.rate_limiter import limited_request, limited_session_request
+    from modules.settings import get_setting_section
+except ImportError:
+    from rate_limiter import limited_request, limited_session_request
+    from settings import get_setting_section
+
+POOL_CONNECTIONS = 32   # Havuzda tutulan farklı host sayısı
+POOL_MAXSIZE = 32       # Host başına açık tutulan bağlantı
+MAX_PAGE_BYTES = 2 * 1024 * 1024   # PageSnapshot'ta saklanan en büyük gövde
+
+_session = None
+_session_timeout = None
+_session_lock = threading.Lock()
+
+
+def load_http_config():
+    """settings.json'dan HTTP ayarlarını topla"""
+    security = get_setting_section('security')
+    scanning = get_setting_section('scanning')
+    proxy = get_setting_section('proxy')
+
+    proxies = {}
+    if proxy.get('enabled'):
+        socks = proxy.get('socks_proxy')
+        http_proxy = proxy.get('http_proxy') or socks
+        https_proxy = proxy.get('https_proxy') or socks
+        if http_proxy:
+            proxies['http'] = http_proxy
+        if https_proxy:
+            proxies['https'] = https_proxy
+
+    return {
+        'timeout': scanning.get('default_timeout', 5),
+        'verify_ssl': security.get('verify_ssl', True),
+        'user_agent': security.get('user_agent', 'HIG-OSINT/3.0'),
+        'proxies': proxies,
+    }
+
+
+def default_headers(config=None):
+    """Tüm isteklerde kullanılan varsayılan başlıklar"""
+    config = config or load_http_config()
+    return {'User-Agent': config['user_agent']}
+
+
+def get_session():
+    """Keep-alive bağlantı havuzlu ortak requests.Session"""
+    global _session, _session_timeout
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                config = load_http_config()
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                session.headers.update(default_headers(config))
+                session.verify = config['verify_ssl']
+                session.proxies.update(config['proxies'])
+                _session_timeout = config['timeout']
+                _session = session
+    return _session
+
+
+def http_request(method, url, **kwargs):
+    """Ortak oturum ve hız sınırlayıcı üzerinden istek yap"""
+    session = get_session()
+    kwargs.setdefault('timeout', _session_timeout)
+    return limited_request(method, url, session=session, **kwargs)
+
+
+def http_get(url, **kwargs):
+    """requests.get yerine kullanılacak ortak GET"""
+    return http_request('GET', url, **kwargs)
+
+
+def create_async_session(limit=100, limit_per_host=30, timeout=None, connect_timeout=None, headers=None):
+    """settings.json'a göre yapılandırılmış aiohttp.ClientSession oluştur
+
+    Oturum çağıran tarafından `async with` ile kapatılmalıdır.
+    """
+    config = load_http_config()
+    connector = aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=limit_per_host,
+        ttl_dns_cache=300,
+        ssl=None if config['verify_ssl'] else False,
+    )
+    client_timeout = aiohttp.ClientTimeout(
+        total=timeout if timeout is not None else config['timeout'],
+        connect=connect_timeout,
+    )
+    session_headers = default_headers(config)
+    if headers:
+        session_headers.update(headers)
+
+    kwargs = {'connector': connector, 'timeout': client_timeout, 'headers': session_headers}
+    proxy = config['proxies'].get('https') or config['proxies'].get('http')
+    # aiohttp < 3.10 oturum düzeyinde proxy desteklemiyor
+    if proxy and 'proxy' in inspect.signature(aiohttp.ClientSession).parameters:
+        kwargs['proxy'] = proxy
+    return aiohttp.ClientSession(**kwargs)
+
+
+class PageSnapshot:
+    """Bir kez indirilmiş sayfanın analizciler arasında paylaşılan görüntüsü
+
+    requests.Response'un analizcilerin kullandığı kısmını (url, status_code,
+    headers, cookies, text) taşır; gövde en fazla max_bytes kadar okunur,
+    fazlası atılır ve truncated işaretlenir.
+    """
+
+    __slots__ = ('url', 'status_code', 'headers', 'cookies', 'text', 'truncated')
+
+    def __init__(self, url, status_code, headers, cookies, body, encoding, truncated):
+        self.url = url
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers)
+        self.cookies = dict(cookies)
+        self.text = body.decode(encoding or 'utf-8', errors='replace')
+        self.truncated = truncated
+
+    @classmethod
+    def from_response(cls, response, max_bytes=MAX_PAGE_BYTES):
+        """stream=True ile açılmış requests yanıtından oku ve bağlantıyı bırak"""
+        chunks = []
+        size = 0
+        try:
+            for chunk in response.iter_content(chunk_size=65536):
+                chunks.append(chunk)
+                size += len(chunk)
+                if size > max_bytes:
+                    break
+        finally:
+            response.close()
+        body = b''.join(chunks)[:max_bytes]
+        return cls(response.url, response.status_code, response.headers,
+                   response.cookies.get_dict(), body, response.encoding, size > max_bytes)
+
+    @classmethod
+    async def from_aiohttp(cls, response, max_bytes=MAX_PAGE_BYTES):
+        """aiohttp yanıtından EOF'a ya da max_bytes'a kadar oku"""
+        chunks = []
+        size = 0
+        async for chunk in response.content.iter_chunked(65536):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > max_bytes:
+                break
+        body = b''.join(chunks)[:max_bytes]
+        cookies = {name: morsel.value for name, morsel in response.cookies.items()}
+        return cls(str(response.url), response.status, response.headers, cookies,
+                   body, response.charset, size > max_bytes)
+
+
+class PageFetchError(Exception):
+    """PageMemo'daki sayfa indirilemedi; özgün hata __cause__ içindedir"""
+
+
+class PageMemo:
+    """Tarama başına URL → PageSnapshot önbelleği
+
+    Aynı URL'yi isteyen tüm analizciler tek indirmeyi paylaşır. Her URL
+    için thread-güvenli tek bir Future tutulur: ilk çağıran (senkron ya da
+    asenkron) indirir, diğerleri aynı Future'ı bekler; böylece senkron ve
+    asenkron çağıranlar da birleşir. Başarısız indirme de saklanır; her
+    çağırana özgün hataya bağlı yeni bir PageFetchError fırlatılır.
+    """
+
+    def __init__(self, max_bytes=MAX_PAGE_BYTES):
+        self.max_bytes = max_bytes
+        self.fetches = 0
+        self._pages = {}
+        self._lock = threading.Lock()
+
+    def _claim(self, url):
+        """(future, sahip) — sahip True ise indirmeyi çağıran yapar"""
+        with self._lock:
+            future = self._pages.get(url)
+            if future is not None:
+                return future, False
+            future = self._pages[url] = concurrent.futures.Future()
+            self.fetches += 1
+            return future, True
+
+    def _release(self, url, future):
+        """İptal edilen indirmeyi bırak; sonraki çağıran yeniden dener"""
+        with self._lock:
+            if self._pages.get(url) is future:
+                del self._pages[url]
+        future.set_exception(PageFetchError(f"{url}: indirme iptal edildi"))
+
+    @staticmethod
+    def _unwrap(url, future):
+        error = future.exception()
+        if error is not None:
+            raise PageFetchError(f"{url}: {error}") from error
+        return future.result()
+
+    def get(self, url, **kwargs):
+        """Sayfayı ortak oturumla (ilk çağrıda) indir ve snapshot döndür"""
+        future, owner = self._claim(url)
+        if owner:
+            try:
+                response = http_request('GET', url, stream=True, **kwargs)
+                future.set_result(PageSnapshot.from_response(response, self.max_bytes))
+            except Exception as e:
+                future.set_exception(e)
+            except BaseException:
+                self._release(url, future)
+                raise
+        return self._unwrap(url, future)
+
+    async def get_async(self, session, url, **kwargs):
+        """aiohttp oturumu ile get(); bekleyenin iptali paylaşılan indirmeyi iptal etmez"""
+        future, owner = self._claim(url)
+        if owner:
+            try:
+                async with limited_session_request(session, 'GET', url, **kwargs) as response:
+                    future.set_result(await PageSnapshot.from_aiohttp(response, self.max_bytes))
+            except Exception as e:
+                future.set_exception(e)
+            except BaseException:
+                self._release(url, future)
+                raise
+        else:
+            try:
+                await asyncio.shield(asyncio.wrap_future(future))
+            except Exception:
+                pass   # Hata, sahip ve get() ile aynı biçimde _unwrap'tan fırlatılır
+        return self._unwrap(url, future)
@@ -9,11 +9,27 @@ import os
 import sys
 import socket
 import json
+import re
+import asyncio
+import errno
+import ssl
+import time
 from datetime import datetime
 from pathlib import Path
 from colorama import Fore, Style
 import threading
-from queue import Queue
+from collections import deque
+
+try:
+    from netaddr import IPNetwork, IPRange, IPSet, AddrFormatError
+    NETADDR_AVAILABLE = True
+except ImportError:
+    NETADDR_AVAILABLE = False
+
+try:
+    from modules.fingerprints import FINGERPRINTS_FILE, load_fingerprint_db
+except ImportError:
+    from fingerprints import FINGERPRINTS_FILE, load_fingerprint_db
 
 class Colors:
     """Renk tanımlamaları"""
@@ -59,6 +75,28 @@ COMMON_PORTS = {
     27017: 'MongoDB'
 }
 
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+# Servis imzaları ve güvenlik kuralları (data/service_fingerprints.json)
+try:
+    FINGERPRINT_DB = load_fingerprint_db()
+except (OSError, ValueError, KeyError, re.error) as e:
+    print(f"{Colors.ERROR}[!] Parmak izi veritabanı yüklenemedi ({FINGERPRINTS_FILE}): {e}{Colors.RESET}")
+    FINGERPRINT_DB = None
+
+# Asenkron motor varsayılanları
+DEFAULT_ASYNC_CONCURRENCY = 500   # Aynı anda bekleyen bağlantı denemesi (dosya tanımlayıcı sınırı!)
+
+# Çoklu hedef taraması
+DEFAULT_ACTIVE_HOSTS = 64          # Aynı anda taranan host sayısı
+MAX_SCOPE_TARGETS = 65536          # Tek çalıştırmada taranabilecek en fazla adres
+
+# Hedef çözümleme önbelleği: host -> (son kullanma, [(family, ip), ...])
+RESOLVE_TTL = 300            # Başarılı A/AAAA sonucu geçerlilik süresi (saniye)
+RESOLVE_NEGATIVE_TTL = 30    # Çözümlenemeyen host için bekleme süresi (saniye)
+_resolve_cache = {}
+_resolve_lock = threading.Lock()
+
 def clear_screen():
     """Ekranı temizle"""
     os.system('cls' if os.name == 'nt' else 'clear')
@@ -91,41 +129,999 @@ def save_result(filename, data):
         print(f"{Colors.ERROR}[-] Kayıt hatası: {e}{Colors.RESET}")
         return False
 
-def scan_port(target, port, timeout=1):
-    """Tek bir portu tara"""
+def resolve_target(target, refresh=False):
+    """Hedefi bir kez çözümle ve [(family, ip), ...] listesini döndür
+    
+    A ve AAAA kayıtları getaddrinfo'nun tercih sırasıyla döner; IP adresi
+    verilirse DNS'e gidilmez. Sonuçlar RESOLVE_TTL boyunca önbellekte
+    tutulur, böylece taranan port sayısı DNS sorgusu sayısını etkilemez.
+    """
+    host = target.strip().strip('[]')
+    key = host.lower()
+    now = time.monotonic()
+    with _resolve_lock:
+        entry = _resolve_cache.get(key)
+        if entry and not refresh and entry[0] > now:
+            return entry[1]
+    
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(timeout)
-        result = sock.connect_ex((target, port))
-        sock.close()
-        
-        if result == 0:
-            return True
-        return False
-    except socket.gaierror:
+        infos = socket.getaddrinfo(host, None, socket.AF_UNSPEC, socket.SOCK_STREAM)
+    except (socket.gaierror, UnicodeError):
+        infos = []
+    
+    addresses = []
+    for family, _, _, _, sockaddr in infos:
+        address = (family, sockaddr[0])
+        if family in (socket.AF_INET, socket.AF_INET6) and address not in addresses:
+            addresses.append(address)
+    
+    ttl = RESOLVE_TTL if addresses else RESOLVE_NEGATIVE_TTL
+    with _resolve_lock:
+        _resolve_cache[key] = (now + ttl, addresses)
+    return addresses
+
+def connect_port(address, port, timeout=1):
+    """Çözümlenmiş (family, ip) adresinde tek portu bloklayan connect ile dene"""
+    family, ip = address
+    try:
+        with socket.socket(family, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            return sock.connect_ex((ip, port)) == 0
+    except OSError:
         return False
-    except socket.error:
+
+def scan_port(target, port, timeout=1):
+    """Tek bir portu tara"""
+    addresses = resolve_target(target)
+    if not addresses:
         return False
+    return connect_port(addresses[0], port, timeout)
 
-def get_service_name(port):
-    """Port numarasından servis adını al"""
+def get_service_name(port, banner=None):
+    """Servis adını banner parmak izinden, yoksa port numarasından al"""
+    if FINGERPRINT_DB is not None:
+        fingerprint = FINGERPRINT_DB.identify(banner)
+        if fingerprint is not None:
+            return fingerprint['service']
+        name = FINGERPRINT_DB.service_name(port)
+        if name:
+            return name
     return COMMON_PORTS.get(port, 'Unknown')
 
-def scan_worker(target, port_queue, open_ports, timeout):
+class PortBitmap:
+    """0-65535 port kümesi: port başına 1 bit, toplam 8 KB bytearray
+    
+    Tarama sırasında port başına nesne tutmak yerine kullanılır; kayıtlar
+    yalnızca rapor anında üretilir.
+    """
+    
+    SIZE = 65536 // 8
+    __slots__ = ('bits',)
+    
+    def __init__(self, data=None):
+        self.bits = bytearray(data) if data is not None else bytearray(self.SIZE)
+        if len(self.bits) != self.SIZE:
+            raise ValueError("bitmap boyutu hatalı")
+    
+    def add(self, port):
+        self.bits[port >> 3] |= 1 << (port & 7)
+    
+    def __contains__(self, port):
+        return bool(self.bits[port >> 3] & (1 << (port & 7)))
+    
+    def __iter__(self):
+        for index, byte in enumerate(self.bits):
+            if byte:
+                for bit in range(8):
+                    if byte & (1 << bit):
+                        yield (index << 3) | bit
+    
+    def __len__(self):
+        return bin(int.from_bytes(self.bits, 'big')).count('1')
+    
+    def to_bytes(self):
+        return bytes(self.bits)
+
+def port_dispenser(ports):
+    """Port iteratörünü thread'ler arasında paylaştıran fonksiyon döndür
+    
+    Kuyruğu önceden doldurmak yerine her çağrıda sıradaki portu üretir;
+    portlar bitince None döner.
+    """
+    port_iter = iter(ports)
+    lock = threading.Lock()
+    
+    def next_port():
+        with lock:
+            return next(port_iter, None)
+    return next_port
+
+def open_port_records(address, open_ports, banners=None):
+    """Açık port bitmap'ini rapor kayıtlarına çevir
+    
+    banners (port → banner bilgisi) verilirse her kayda o portun banner
+    alanları eklenir; banner parmak izi servis adını da günceller.
+    """
+    records = []
+    for port in open_ports:
+        record = {
+            'port': port,
+            'address': address[1],
+            'service': get_service_name(port),
+            'state': 'open'
+        }
+        if banners and port in banners:
+            record.update(banners[port])
+        records.append(record)
+    return records
+
+def scan_worker(address, next_port, open_ports, lock, timeout):
     """Thread worker fonksiyonu"""
-    while not port_queue.empty():
-        port = port_queue.get()
+    while True:
+        port = next_port()
+        if port is None:
+            return
         
-        if scan_port(target, port, timeout):
-            service = get_service_name(port)
-            open_ports.append({
-                'port': port,
-                'service': service,
-                'state': 'open'
+        if connect_port(address, port, timeout):
+            with lock:
+                open_ports.add(port)
+            print(f"{Colors.SUCCESS}[+] Port {port} açık - {get_service_name(port)}{Colors.RESET}")
+
+def threaded_scan(address, ports, threads, timeout):
+    """Eski thread tabanlı motor: her thread sıradaki portu çekip bloklayan connect yapar"""
+    next_port = port_dispenser(ports)
+    open_ports = PortBitmap()
+    lock = threading.Lock()
+    
+    # Thread'leri başlat
+    thread_list = []
+    for _ in range(threads):
+        thread = threading.Thread(target=scan_worker, args=(address, next_port, open_ports, lock, timeout))
+        thread.daemon = True
+        thread.start()
+        thread_list.append(thread)
+    
+    # Tüm thread'lerin bitmesini bekle
+    for thread in thread_list:
+        thread.join()
+    return open_port_records(address, open_ports)
+
+CONNECT_IN_PROGRESS = {errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY, 10035}  # 10035: WSAEWOULDBLOCK
+
+# Deneme sonuçları: açık, kapalı (RST/refused), filtreli (yanıt yok)
+PROBE_OPEN = 'open'
+PROBE_CLOSED = 'closed'
+PROBE_FILTERED = 'filtered'
+
+# RTT ölçümü için taramadan önce denenen portlar
+CALIBRATION_PORTS = (80, 443, 22, 21, 25, 3389, 8080, 1)
+RTT_MULTIPLIER = 4          # timeout = SRTT x k (en az SRTT + 4 x RTTVAR)
+MIN_PROBE_TIMEOUT = 0.05    # Uyarlanan timeout alt sınırı (saniye)
+MAX_PROBE_TIMEOUT = 3.0     # Uyarlanan timeout üst sınırı (saniye)
+
+class RttEstimator:
+    """Hedefe olan gidiş-dönüş süresinden deneme zaman aşımı hesaplar
+    
+    TCP'nin SRTT/RTTVAR yumuşatmasını (RFC 6298) kullanır; yalnızca yanıt
+    alınan (açık ya da reddedilen) denemeler örnek sayılır. Örnek yokken
+    başlangıç timeout'u kullanılır.
+    """
+    
+    def __init__(self, initial, floor=MIN_PROBE_TIMEOUT, ceiling=MAX_PROBE_TIMEOUT,
+                 multiplier=RTT_MULTIPLIER):
+        self.initial = initial
+        self.floor = floor
+        self.ceiling = max(ceiling, initial)
+        self.multiplier = multiplier
+        self.srtt = None
+        self.rttvar = None
+        self.samples = 0
+        self.retries = 0
+    
+    def sample(self, rtt):
+        """Yeni RTT ölçümünü ekle"""
+        if self.srtt is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            self.rttvar = 0.75 * self.rttvar + 0.25 * abs(self.srtt - rtt)
+            self.srtt = 0.875 * self.srtt + 0.125 * rtt
+        self.samples += 1
+    
+    def timeout(self):
+        """Şu anki deneme zaman aşımı (saniye)"""
+        if self.srtt is None:
+            return self.initial
+        estimate = max(self.srtt * self.multiplier, self.srtt + 4 * self.rttvar)
+        return min(self.ceiling, max(self.floor, estimate))
+    
+    def retry_timeout(self, timeout):
+        """Yanıtsız kalan port için ikinci denemenin timeout'u"""
+        return min(self.ceiling, timeout * 2)
+    
+    def summary(self):
+        """Rapora eklenecek zamanlama bilgisi"""
+        return {
+            'srtt_ms': round(self.srtt * 1000, 2) if self.srtt is not None else None,
+            'rttvar_ms': round(self.rttvar * 1000, 2) if self.rttvar is not None else None,
+            'timeout_ms': round(self.timeout() * 1000, 1),
+            'samples': self.samples,
+            'retries': self.retries
+        }
+
+def probe_port_future(loop, address, port, timeout):
+    """Bloklamayan connect başlat; sonucu (durum, rtt) taşıyan future döndür
+    
+    Görev (Task) oluşturmadan yalnızca soket yazılabilir olunca ya da süre
+    dolunca çalışan geri çağırmalar kullanır; binlerce eşzamanlı denemede
+    wait_for'a göre çok daha hafiftir. rtt yalnızca yanıt alınınca doludur.
+    """
+    family, ip = address
+    future = loop.create_future()
+    started = loop.time()
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setblocking(False)
+    err = sock.connect_ex((ip, port))
+    if err == 0 or err not in CONNECT_IN_PROGRESS:
+        sock.close()
+        rtt = loop.time() - started
+        if err == 0:
+            future.set_result((PROBE_OPEN, rtt))
+        elif err == errno.ECONNREFUSED:
+            future.set_result((PROBE_CLOSED, rtt))
+        else:
+            future.set_result((PROBE_FILTERED, None))
+        return future
+    
+    fd = sock.fileno()
+    
+    def finish(state, rtt):
+        loop.remove_writer(fd)
+        sock.close()
+        if not future.done():
+            future.set_result((state, rtt))
+    
+    def on_writable():
+        timer.cancel()
+        rtt = loop.time() - started
+        err = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+        if err == 0:
+            finish(PROBE_OPEN, rtt)
+        elif err == errno.ECONNREFUSED:
+            finish(PROBE_CLOSED, rtt)
+        else:
+            finish(PROBE_FILTERED, None)
+    
+    try:
+        loop.add_writer(fd, on_writable)
+    except NotImplementedError:
+        # Windows Proactor döngüsü add_writer desteklemez
+        sock.close()
+        raise
+    timer = loop.call_later(timeout, finish, PROBE_FILTERED, None)
+    return future
+
+async def probe_port_async(loop, address, port, timeout):
+    """Tek portu bloklamayan connect ile dene; (durum, rtt) döndürür"""
+    try:
+        return await probe_port_future(loop, address, port, timeout)
+    except NotImplementedError:
+        pass
+    except OSError:
+        return PROBE_FILTERED, None
+    family, ip = address
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setblocking(False)
+    started = loop.time()
+    try:
+        await asyncio.wait_for(loop.sock_connect(sock, (ip, port)), timeout)
+        return PROBE_OPEN, loop.time() - started
+    except ConnectionRefusedError:
+        return PROBE_CLOSED, loop.time() - started
+    except (asyncio.TimeoutError, OSError):
+        return PROBE_FILTERED, None
+    finally:
+        sock.close()
+
+async def adaptive_probe(loop, address, port, estimator, timeout):
+    """Portu tahmin edilen timeout ile dene ve durumunu döndür
+    
+    estimator None ise sabit timeout kullanılır. Kısa timeout'ta yanıtsız
+    kalan port bir kez daha, iki kat süreyle denenir; yanıt gelen her deneme
+    tahmini günceller.
+    """
+    if estimator is None:
+        state, _ = await probe_port_async(loop, address, port, timeout)
+        return state
+    probe_timeout = estimator.timeout()
+    state, rtt = await probe_port_async(loop, address, port, probe_timeout)
+    if state == PROBE_FILTERED and probe_timeout < estimator.ceiling:
+        estimator.retries += 1
+        state, rtt = await probe_port_async(loop, address, port, estimator.retry_timeout(probe_timeout))
+    if rtt is not None:
+        estimator.sample(rtt)
+    return state
+
+async def calibrate_rtt(loop, address, estimator, ports=CALIBRATION_PORTS):
+    """Taramadan önce birkaç yaygın porta bağlanıp ilk RTT örneklerini topla"""
+    results = await asyncio.gather(
+        *(probe_port_async(loop, address, port, estimator.initial) for port in ports)
+    )
+    for _, rtt in results:
+        if rtt is not None:
+            estimator.sample(rtt)
+    return results
+
+def limit_concurrency(requested):
+    """Eşzamanlı deneme sayısını açık dosya sınırının altında tut"""
+    try:
+        import resource
+        soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+    except (ImportError, ValueError, OSError):
+        return requested
+    if soft == resource.RLIM_INFINITY:
+        return requested
+    return max(1, min(requested, soft - 64))
+
+# Banner toplama aşaması
+BANNER_READ_LIMIT = 1024      # Tek okumada alınacak en fazla bayt
+BANNER_TIMEOUT = 3            # Bağlantı ve her okuma için süre (saniye)
+BANNER_PASSIVE_WAIT = 1.0     # Bilinmeyen portta sunucunun ilk konuşmasını bekleme süresi
+DEFAULT_BANNER_WORKERS = 50   # Aynı anda banner alınan bağlantı sayısı
+
+# Port -> (protokol, TLS kullanılır mı)
+BANNER_PROTOCOLS = {
+    21: ('ftp', False),
+    22: ('ssh', False),
+    25: ('smtp', False),
+    80: ('http', False),
+    110: ('pop3', False),
+    143: ('imap', False),
+    443: ('http', True),
+    465: ('smtp', True),
+    587: ('smtp', False),
+    993: ('imap', True),
+    995: ('pop3', True),
+    8000: ('http', False),
+    8008: ('http', False),
+    8080: ('http', False),
+    8443: ('http', True),
+    8888: ('http', False)
+}
+
+_banner_ssl_context = None
+
+def banner_ssl_context():
+    """Banner için sertifika doğrulamayan ortak TLS bağlamı"""
+    global _banner_ssl_context
+    if _banner_ssl_context is None:
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+        _banner_ssl_context = context
+    return _banner_ssl_context
+
+async def read_bounded(reader, timeout, limit=BANNER_READ_LIMIT):
+    """En fazla limit bayt oku; süre dolarsa boş döndür"""
+    try:
+        return await asyncio.wait_for(reader.read(limit), timeout)
+    except asyncio.TimeoutError:
+        return b''
+
+def http_probe(server_name):
+    """Yalnızca başlıkları döndüren küçük HTTP isteği"""
+    return (f"HEAD / HTTP/1.0\r\nHost: {server_name}\r\n"
+            f"User-Agent: HIG-OSINT/3.0\r\nConnection: close\r\n\r\n").encode('ascii', 'ignore')
+
+async def exchange_banner(protocol, reader, writer, server_name, timeout):
+    """Protokole uygun sorguyu gönder ve ham yanıtı döndür"""
+    if protocol == 'http':
+        writer.write(http_probe(server_name))
+        await writer.drain()
+        return await read_bounded(reader, timeout)
+    
+    if protocol in ('ssh', 'ftp', 'pop3', 'imap', 'smtp'):
+        # Sunucu önce konuşur; SMTP'de EHLO ile yetenekler de alınır
+        greeting = await read_bounded(reader, timeout)
+        if protocol == 'smtp' and greeting.startswith(b'220'):
+            writer.write(b"EHLO hig-osint.local\r\n")
+            await writer.drain()
+            greeting += await read_bounded(reader, timeout)
+        return greeting
+    
+    # Bilinmeyen port: önce sessizce bekle, konuşmazsa kalan sürede HTTP dene
+    passive_wait = min(BANNER_PASSIVE_WAIT, timeout / 2)
+    data = await read_bounded(reader, passive_wait)
+    if data:
+        return data
+    writer.write(http_probe(server_name))
+    await writer.drain()
+    return await read_bounded(reader, timeout - passive_wait)
+
+def summarize_banner(protocol, raw):
+    """Ham yanıttan banner metni ve ürün bilgisini çıkar"""
+    text = raw.decode('utf-8', errors='ignore').strip()
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    product = None
+    if lines and lines[0].startswith('HTTP/'):
+        protocol = 'http'
+        for line in lines[1:]:
+            name, _, value = line.partition(':')
+            if name.lower() == 'server':
+                product = value.strip()
+                break
+    elif lines and lines[0].startswith('SSH-'):
+        protocol = 'ssh'
+        product = lines[0]
+    elif lines:
+        # FTP/SMTP/POP3/IMAP karşılamaları: durum kodundan sonraki kısım
+        product = lines[0].lstrip('0123456789-+* ').strip() or None
+    return {
+        'protocol': protocol,
+        'banner': text[:500] if text else None,
+        'product': product[:200] if product else None
+    }
+
+async def grab_banner(address, port, timeout=BANNER_TIMEOUT, server_name=None):
+    """Açık porta bağlanıp protokole uygun banner topla
+    
+    Okumalar BANNER_READ_LIMIT ile sınırlıdır; bağlantı her durumda kapatılır.
+    """
+    family, ip = address
+    protocol, use_tls = BANNER_PROTOCOLS.get(port, ('unknown', False))
+    server_name = server_name or ip
+    try:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(
+                ip, port, family=family, limit=BANNER_READ_LIMIT * 4,
+                ssl=banner_ssl_context() if use_tls else None,
+                server_hostname=server_name if use_tls else None
+            ),
+            timeout
+        )
+    except (OSError, asyncio.TimeoutError, ssl.SSLError) as e:
+        return {'protocol': protocol, 'banner': None, 'product': None,
+                'error': str(e) or type(e).__name__}
+    
+    try:
+        raw = await exchange_banner(protocol, reader, writer, server_name, timeout)
+    except (OSError, ssl.SSLError):
+        raw = b''
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except (OSError, ssl.SSLError):
+            pass
+    
+    result = summarize_banner(protocol, raw)
+    if use_tls:
+        result['tls'] = True
+    if FINGERPRINT_DB is not None:
+        fingerprint = FINGERPRINT_DB.identify(result['banner'])
+        if fingerprint is not None:
+            result.update(fingerprint)
+    return result
+
+class BannerStage:
+    """Keşif aşamasının bulduğu açık portlardan eşzamanlı banner toplayan ikinci aşama
+    
+    submit() ile gelen her açık port sabit sayıda işçi tarafından işlenir
+    ve banner bilgisi verilen port → bilgi tablosuna yazılır; keşif
+    beklemeden sürer. Rapor kayıtları open_port_records() ile sonradan
+    üretilir.
+    """
+    
+    def __init__(self, workers=DEFAULT_BANNER_WORKERS, timeout=BANNER_TIMEOUT, server_name=None):
+        self.timeout = timeout
+        self.server_name = server_name
+        self.queue = asyncio.Queue()
+        self.tasks = [asyncio.create_task(self._worker()) for _ in range(workers)]
+    
+    def submit(self, address, port, banners, on_done=None):
+        """Açık portu banner kuyruğuna ekle; sonuç banners[port]'a yazılır"""
+        self.queue.put_nowait((address, port, banners, on_done))
+    
+    async def _worker(self):
+        while True:
+            address, port, banners, on_done = await self.queue.get()
+            try:
+                info = await grab_banner(address, port, self.timeout, self.server_name)
+                banners[port] = info
+                if info.get('banner'):
+                    summary = info.get('product') or info['banner'].splitlines()[0]
+                    if info.get('version'):
+                        summary = f"{summary} {info['version']}"
+                    print(f"{Colors.INFO}[~] {address[1]} port {port} banner: {summary[:120]}{Colors.RESET}")
+            except Exception as e:
+                # İşçi ölürse kuyruk boşalmaz ve close() sonsuza dek bekler
+                banners[port] = {'banner_error': str(e) or type(e).__name__}
+            finally:
+                self.queue.task_done()
+                if on_done is not None:
+                    on_done()
+    
+    async def close(self):
+        """Kuyruktaki tüm işler bitince işçileri durdur"""
+        await self.queue.join()
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+
+# Sürdürülebilir tarama durumu
+SCANS_DIR = BASE_DIR / 'data' / 'scans'
+STATE_MAGIC = b'HIGSCAN1'
+CHECKPOINT_INTERVAL = 2.0           # Durumun diske yazılma aralığı (saniye)
+
+class ScanState:
+    """Kaldığı yerden sürdürülebilir tarama durumu (data/scans/<id>.state)
+    
+    Tamamlanan ve açık bulunan portlar iki PortBitmap'te (8'er KB),
+    açık portların banner bilgileri ise küçük bir JSON başlığında tutulur. Dosya her seferinde
+    geçici dosyaya yazılıp yerine taşınır; yazma yarıda kesilse de eski
+    durum bozulmaz.
+    """
+    
+    def __init__(self, scan_id, target, address, options, done=None, open_ports=None,
+                 banners=None, created=None, complete=False):
+        self.scan_id = scan_id
+        self.target = target
+        self.address = address
+        self.options = options
+        self.done = done if done is not None else PortBitmap()
+        self.open_ports = open_ports if open_ports is not None else PortBitmap()
+        self.banners = banners if banners is not None else {}
+        self.created = created or datetime.now().isoformat()
+        self.complete = complete
+    
+    @classmethod
+    def create(cls, target, address, options):
+        """Yeni tarama için benzersiz kimlikli durum oluştur"""
+        label = re.sub(r'[^\w.-]', '_', f"{target}_{address[1]}")
+        scan_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{label}"
+        return cls(scan_id, target, address, options)
+    
+    @staticmethod
+    def path_for(scan_id):
+        return SCANS_DIR / f"{scan_id}.state"
+    
+    @property
+    def path(self):
+        return self.path_for(self.scan_id)
+    
+    def save(self):
+        """Durumu atomik olarak diske yaz"""
+        header = json.dumps({
+            'id': self.scan_id,
+            'target': self.target,
+            'family': int(self.address[0]),
+            'address': self.address[1],
+            'options': self.options,
+            'open_ports': list(self.open_ports),
+            'banners': {str(port): info for port, info in self.banners.items()},
+            'created': self.created,
+            'updated': datetime.now().isoformat(),
+            'complete': self.complete
+        }, ensure_ascii=False).encode('utf-8')
+        SCANS_DIR.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix('.tmp')
+        with open(temp_path, 'wb') as f:
+            f.write(STATE_MAGIC + len(header).to_bytes(4, 'big') + header + self.done.to_bytes())
+        os.replace(temp_path, self.path)
+    
+    @classmethod
+    def load(cls, scan_id):
+        """Kayıtlı durumu oku; dosya bozuksa ValueError yükseltir"""
+        data = cls.path_for(scan_id).read_bytes()
+        if not data.startswith(STATE_MAGIC):
+            raise ValueError("geçersiz durum dosyası")
+        offset = len(STATE_MAGIC)
+        length = int.from_bytes(data[offset:offset + 4], 'big')
+        header = json.loads(data[offset + 4:offset + 4 + length].decode('utf-8'))
+        done = PortBitmap(data[offset + 4 + length:])
+        open_ports = PortBitmap()
+        for port in header['open_ports']:
+            open_ports.add(port)
+        banners = {int(port): info for port, info in header.get('banners', {}).items()}
+        address = (socket.AddressFamily(header['family']), header['address'])
+        return cls(header['id'], header['target'], address, header['options'], done,
+                   open_ports, banners, header['created'], header['complete'])
+    
+    def records(self):
+        """Kaydedilen açık portların rapor kayıtları"""
+        return open_port_records(self.address, self.open_ports, self.banners)
+
+def list_scan_states(include_complete=False):
+    """Kayıtlı tarama durumlarını (yeniden eskiye) döndür"""
+    states = []
+    for path in sorted(SCANS_DIR.glob('*.state'), reverse=True):
+        try:
+            state = ScanState.load(path.stem)
+        except (OSError, ValueError, KeyError):
+            continue
+        if include_complete or not state.complete:
+            states.append(state)
+    return states
+
+async def checkpoint_loop(state, interval=CHECKPOINT_INTERVAL):
+    """Tarama sürerken durumu düzenli aralıklarla kaydet"""
+    while True:
+        await asyncio.sleep(interval)
+        state.save()
+
+async def async_scan_ports(address, ports, concurrency=DEFAULT_ASYNC_CONCURRENCY, timeout=1,
+                           adaptive=True, timing=None, banners=True, server_name=None, state=None):
+    """Çözümlenmiş (family, ip) adresinde portları sabit sayıda asenkron işçiyle tara
+    
+    İşçiler aynı port iteratöründen sırayla port çeker; bellekte aynı anda en
+    fazla `concurrency` deneme bulunur, port listesi önceden doldurulmaz.
+    
+    adaptive=True iken timeout yalnızca başlangıç değeridir: önce RTT ölçülür,
+    her deneme o anki tahmine göre süre alır ve yanıt gelen her deneme tahmini
+    günceller. Kısa timeout'ta yanıtsız kalan port bir kez daha, iki kat
+    süreyle denenir. `timing` sözlüğü verilirse zamanlama özeti içine yazılır.
+    
+    banners=True iken bulunan her açık port aynı anda BannerStage'e verilir.
+    Tarama sürerken açık portlar PortBitmap'te, banner'lar port anahtarlı
+    bir tabloda tutulur; rapor kayıtları tarama bitince üretilir ve banner
+    bilgisini de içerir.
+    
+    state (ScanState) verilirse daha önce tamamlanan portlar atlanır, her
+    sonuç (açık portlarda banner'ı da alındıktan sonra) bitmap'e işlenir ve durum CHECKPOINT_INTERVAL'de bir, ayrıca
+    tarama bitince ya da kesilince diske yazılır.
+    """
+    loop = asyncio.get_running_loop()
+    if state is None:
+        port_iter = iter(ports)
+        open_ports = PortBitmap()
+        banner_info = {}
+    else:
+        port_iter = (port for port in ports if port not in state.done)
+        open_ports = state.open_ports
+        banner_info = state.banners
+    concurrency = limit_concurrency(concurrency)
+    estimator = RttEstimator(timeout) if adaptive else None
+    stage = BannerStage(server_name=server_name) if banners else None
+    checkpointer = asyncio.create_task(checkpoint_loop(state)) if state is not None else None
+    
+    if estimator is not None:
+        await calibrate_rtt(loop, address, estimator)
+        print(f"{Colors.INFO}[*] Ölçülen timeout: {estimator.timeout() * 1000:.0f} ms "
+              f"({estimator.samples} RTT örneği){Colors.RESET}")
+    
+    async def worker():
+        for port in port_iter:
+            probe_state = await adaptive_probe(loop, address, port, estimator, timeout)
+            if probe_state == PROBE_OPEN:
+                open_ports.add(port)
+                print(f"{Colors.SUCCESS}[+] Port {port} açık - {get_service_name(port)}{Colors.RESET}")
+                if stage is not None:
+                    # Açık port, banner'ı alınınca tamamlanmış sayılır; arada
+                    # kesilen tarama sürdürülürken port yeniden denenir
+                    stage.submit(address, port, banner_info,
+                                 (lambda port=port: state.done.add(port)) if state is not None else None)
+                    continue
+            if state is not None:
+                state.done.add(port)
+    
+    try:
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        if stage is not None:
+            await stage.close()
+        if state is not None:
+            state.complete = True
+    finally:
+        if checkpointer is not None:
+            checkpointer.cancel()
+            state.save()
+    if estimator is not None and timing is not None:
+        timing.update(estimator.summary())
+    return open_port_records(address, open_ports, banner_info)
+
+def run_scan(address, ports, engine, threads, concurrency, timeout, adaptive=True, timing=None,
+             banners=True, server_name=None, state=None):
+    """Seçilen motorla tek adresi tara ve açık port listesini döndür
+    
+    Banner aşaması ve durum kaydı (state) yalnızca asenkron motorda çalışır.
+    """
+    if engine == 'async':
+        return asyncio.run(async_scan_ports(address, ports, concurrency, timeout, adaptive, timing,
+                                            banners, server_name, state))
+    return threaded_scan(address, ports, threads, timeout)
+
+def scan_target(target, ports, engine, threads, concurrency, timeout, adaptive=True,
+                timing=None, all_addresses=False, banners=True, states=None):
+    """Hedefi bir kez çözümleyip adres(ler)ini tara
+    
+    (adresler, açık portlar) döndürür; hedef çözümlenemezse adresler boştur.
+    all_addresses=False iken yalnızca tercih edilen ilk adres taranır.
+    states bir liste ise (asenkron motorda) her adres için sürdürülebilir
+    ScanState oluşturulur ve listeye eklenir.
+    """
+    addresses = resolve_target(target)
+    if not addresses:
+        print(f"{Colors.ERROR}[-] Hedef çözümlenemedi: {target}{Colors.RESET}")
+        return [], []
+    
+    print(f"{Colors.INFO}[*] Çözümlenen adresler: {', '.join(ip for _, ip in addresses)}{Colors.RESET}")
+    selected = addresses if all_addresses else addresses[:1]
+    if len(selected) > 1 and not isinstance(ports, (range, list, tuple)):
+        ports = list(ports)
+    
+    open_ports = []
+    for address in selected:
+        state = None
+        if states is not None and engine == 'async':
+            state = ScanState.create(target, address, {
+                'ports': f"{min(ports)}-{max(ports)}",
+                'concurrency': concurrency,
+                'timeout': timeout,
+                'adaptive': adaptive,
+                'banners': banners
             })
-            print(f"{Colors.SUCCESS}[+] Port {port} açık - {service}{Colors.RESET}")
+            states.append(state)
+            print(f"{Colors.INFO}[*] Tarama kimliği: {state.scan_id} "
+                  f"(kesilirse: resume {state.scan_id}){Colors.RESET}")
+        open_ports.extend(run_scan(address, ports, engine, threads, concurrency, timeout, adaptive, timing,
+                                   banners, target.strip().strip('[]'), state))
+    return [ip for _, ip in addresses], open_ports
+
+def parse_scope_entry(entry):
+    """Tek bir IP / CIDR / 'başlangıç-bitiş' aralığı / host adı girdisini IPSet'e çevir"""
+    entry = entry.strip().strip('[]')
+    try:
+        return IPSet([IPNetwork(entry)])
+    except (AddrFormatError, ValueError, TypeError):
+        pass
+    if '-' in entry:
+        start, _, end = entry.partition('-')
+        try:
+            return IPSet(IPRange(start.strip(), end.strip()))
+        except (AddrFormatError, ValueError, TypeError):
+            pass
+    addresses = resolve_target(entry)
+    if not addresses:
+        raise ValueError(f"çözümlenemedi: {entry}")
+    return IPSet(ip for _, ip in addresses)
+
+def load_scope(path):
+    """Kapsam (allowlist) dosyasını IPSet olarak yükle
+    
+    Her satır bir IP, CIDR, 'başlangıç-bitiş' aralığı ya da host adıdır;
+    '#' sonrası yorum sayılır. Hatalı satırda ValueError yükseltir.
+    """
+    if not NETADDR_AVAILABLE:
+        raise RuntimeError("netaddr kurulu değil (pip install netaddr)")
+    scope = IPSet()
+    with open(path, encoding='utf-8') as f:
+        for lineno, line in enumerate(f, 1):
+            entry = line.split('#', 1)[0].strip()
+            if not entry:
+                continue
+            try:
+                scope.update(parse_scope_entry(entry))
+            except ValueError as e:
+                raise ValueError(f"{path}:{lineno}: geçersiz kapsam girdisi '{entry}' ({e})") from e
+    return scope
+
+def select_targets(scope, targets=None):
+    """İstenen hedeflerin kapsam içindeki kısmını IPSet olarak döndür
+    
+    targets verilmezse kapsamın tamamı seçilir; kapsam dışı adresler uyarıyla
+    atlanır. Seçim MAX_SCOPE_TARGETS adresi aşarsa ValueError yükseltir.
+    """
+    if targets is None:
+        selected = IPSet(scope)
+    else:
+        selected = IPSet()
+        for target in targets:
+            requested = parse_scope_entry(target)
+            outside = requested - scope
+            if outside.size:
+                print(f"{Colors.WARNING}[!] Kapsam dışı, atlandı: {target} "
+                      f"({outside.size} adres){Colors.RESET}")
+            selected.update(requested & scope)
+    if selected.size > MAX_SCOPE_TARGETS:
+        raise ValueError(f"{selected.size} adres seçildi, sınır {MAX_SCOPE_TARGETS}")
+    return selected
+
+def iter_scope_addresses(selected):
+    """IPSet içindeki adresleri (family, ip) olarak sırayla üret"""
+    for ip in selected:
+        family = socket.AF_INET if ip.version == 4 else socket.AF_INET6
+        yield family, str(ip)
+
+class HostScan:
+    """Çoklu hedef taramasında tek host'un durumu"""
+    
+    __slots__ = ('address', 'ports', 'estimator', 'inflight', 'banners', 'exhausted', 'open_ports',
+                 'banner_info', 'started')
+    
+    def __init__(self, address, ports, estimator):
+        self.address = address
+        self.ports = iter(ports)
+        self.estimator = estimator
+        self.inflight = 0
+        self.banners = 0
+        self.exhausted = False
+        self.open_ports = PortBitmap()
+        self.banner_info = {}
+        self.started = time.monotonic()
+    
+    def records(self):
+        """Açık portların rapor kayıtları (yalnızca host bitince üretilir)"""
+        return open_port_records(self.address, self.open_ports, self.banner_info)
+
+async def async_scan_targets(addresses, ports, on_host_done, concurrency=DEFAULT_ASYNC_CONCURRENCY,
+                             per_host=None, active_hosts=DEFAULT_ACTIVE_HOSTS,
+                             timeout=1, adaptive=True, banners=True):
+    """Birden çok adresi tek olay döngüsünde, denemeleri araya serpiştirerek tara
+    
+    En fazla active_hosts host aynı anda açıktır; işçiler bu hostlar arasında
+    sırayla (round-robin) dolaşarak port çeker. Toplam bekleyen deneme
+    concurrency ile sınırlıdır; tek host'taki deneme ise açık hostlar
+    arasındaki adil payı (concurrency / açık host) ya da verilirse per_host'u
+    aşamaz. Böylece yavaş ya da filtreli bir host diğerlerini aç bırakmaz,
+    son kalan hostlar ise boşalan kapasiteyi kullanır. Bir host'un tüm
+    portları (banners=True iken banner'ları da) bitince on_host_done(HostScan)
+    hemen çağrılır ve yerine sıradaki adres alınır. ports her host için
+    baştan dolaşılabilir olmalıdır.
+    """
+    loop = asyncio.get_running_loop()
+    address_iter = iter(addresses)
+    active = deque()
+    wakeup = asyncio.Event()
+    concurrency = limit_concurrency(concurrency)
+    stage = BannerStage() if banners else None
+    
+    def admit():
+        while len(active) < active_hosts:
+            address = next(address_iter, None)
+            if address is None:
+                return
+            estimator = RttEstimator(timeout) if adaptive else None
+            active.append(HostScan(address, ports, estimator))
+    
+    def maybe_finish(host):
+        if host.exhausted and host.inflight == 0 and host.banners == 0:
+            active.remove(host)
+            on_host_done(host)
+    
+    def banner_done(host):
+        host.banners -= 1
+        maybe_finish(host)
+        wakeup.set()
+    
+    def take():
+        admit()
+        cap = per_host or max(1, concurrency // max(1, len(active)))
+        for _ in range(len(active)):
+            host = active[0]
+            active.rotate(-1)
+            if host.exhausted or host.inflight >= cap:
+                continue
+            port = next(host.ports, None)
+            if port is None:
+                host.exhausted = True
+                maybe_finish(host)
+                continue
+            host.inflight += 1
+            return host, port
+        return None
+    
+    async def worker():
+        while True:
+            item = take()
+            if item is None:
+                if not active:
+                    return
+                wakeup.clear()
+                await wakeup.wait()
+                continue
+            host, port = item
+            try:
+                state = await adaptive_probe(loop, host.address, port, host.estimator, timeout)
+            finally:
+                host.inflight -= 1
+                wakeup.set()
+            if state == PROBE_OPEN:
+                host.open_ports.add(port)
+                print(f"{Colors.SUCCESS}[+] {host.address[1]} port {port} açık - "
+                      f"{get_service_name(port)}{Colors.RESET}")
+                if stage is not None:
+                    host.banners += 1
+                    stage.submit(host.address, port, host.banner_info, lambda host=host: banner_done(host))
+            maybe_finish(host)
+    
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    if stage is not None:
+        await stage.close()
+
+def parse_port_spec(spec):
+    """'22,80,8000-8100' biçimindeki port listesini sıralı listeye çevir"""
+    ports = set()
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        start, _, end = part.partition('-')
+        first, last = int(start), int(end or start)
+        if not 1 <= first <= last <= 65535:
+            raise ValueError(f"geçersiz port aralığı: {part}")
+        ports.update(range(first, last + 1))
+    return sorted(ports)
+
+def multi_target_scan(scope_file, targets=None, ports=None, concurrency=DEFAULT_ASYNC_CONCURRENCY,
+                      per_host=None, active_hosts=DEFAULT_ACTIVE_HOSTS,
+                      timeout=1, adaptive=True, banners=True):
+    """Kapsam dosyasıyla sınırlı çoklu hedef taraması
+    
+    scope_file zorunludur: yalnızca dosyada listelenen host/CIDR'lar taranır.
+    targets verilmezse kapsamın tamamı, ports verilmezse yaygın portlar
+    taranır. Her host bitince sonucu reports/ altındaki JSONL dosyasına eklenir.
+    """
+    if not scope_file:
+        print(f"{Colors.ERROR}[-] Çoklu hedef taraması için kapsam dosyası zorunludur{Colors.RESET}")
+        return None
+    try:
+        scope = load_scope(scope_file)
+        selected = select_targets(scope, targets)
+    except (OSError, ValueError, RuntimeError) as e:
+        print(f"{Colors.ERROR}[-] Kapsam hatası: {e}{Colors.RESET}")
+        return None
+    if not selected.size:
+        print(f"{Colors.WARNING}[!] Kapsam içinde taranacak adres yok{Colors.RESET}")
+        return None
+    
+    ports = sorted(COMMON_PORTS) if ports is None else list(ports)
+    print(f"\n{Colors.INFO}[*] Çoklu hedef taraması: {selected.size} adres x {len(ports)} port{Colors.RESET}")
+    print(f"{Colors.INFO}[*] Eşzamanlı deneme: {concurrency}, host başına: {per_host or 'adil pay'}, "
+          f"aynı anda host: {active_hosts}{Colors.RESET}\n")
+    
+    reports_dir = Path('reports')
+    reports_dir.mkdir(exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    stream_path = reports_dir / f"port_scan_multi_{timestamp}.jsonl"
+    hosts = []
+    
+    with open(stream_path, 'a', encoding='utf-8') as stream:
+        def on_host_done(host):
+            record = {
+                'address': host.address[1],
+                'open_ports': host.records(),
+                'duration_seconds': round(time.monotonic() - host.started, 2),
+                'timing': host.estimator.summary() if host.estimator is not None else None,
+                'finished_at': datetime.now().isoformat()
+            }
+            stream.write(json.dumps(record, ensure_ascii=False) + '\n')
+            stream.flush()
+            hosts.append(record)
+            print(f"{Colors.INFO}[*] {record['address']} tamamlandı: "
+                  f"{len(record['open_ports'])} açık port{Colors.RESET}")
         
-        port_queue.task_done()
+        started = time.monotonic()
+        asyncio.run(async_scan_targets(iter_scope_addresses(selected), ports, on_host_done,
+                                       concurrency, per_host, active_hosts, timeout, adaptive, banners))
+        elapsed = time.monotonic() - started
+    
+    result = {
+        'scope_file': str(scope_file),
+        'targets': targets,
+        'scan_type': 'multi',
+        'total_hosts_scanned': len(hosts),
+        'ports_per_host': len(ports),
+        'hosts': hosts,
+        'stream_file': str(stream_path),
+        'duration_seconds': round(elapsed, 2),
+        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    }
+    
+    total_open = sum(len(host['open_ports']) for host in hosts)
+    print(f"\n{Colors.SUCCESS}[+] Tarama tamamlandı!{Colors.RESET}")
+    print(f"{Colors.INFO}[*] {len(hosts)} host, toplam açık port: {total_open}{Colors.RESET}")
+    print(f"{Colors.INFO}[*] Süre: {elapsed:.1f} sn, akış dosyası: {stream_path}{Colors.RESET}")
+    
+    return result
 
 def quick_scan(target):
     """Hızlı tarama - Yaygın portlar"""
@@ -157,46 +1153,59 @@ def quick_scan(target):
     
     return result
 
-def range_scan(target, start_port, end_port, threads=50):
-    """Port aralığı tarama"""
+def range_scan(target, start_port, end_port, threads=50, engine='async',
+               concurrency=DEFAULT_ASYNC_CONCURRENCY, timeout=1, adaptive=True, all_addresses=False,
+               banners=True):
+    """Port aralığı tarama
+    
+    engine='async' bloklamayan connect'lerle binlerce denemeyi aynı anda
+    yürütür; engine='thread' eski thread havuzunu kullanır. adaptive=True
+    iken asenkron motor timeout'u ölçülen RTT'ye göre ayarlar. Hedef bir kez
+    çözümlenir; all_addresses=True tüm A/AAAA adreslerini tarar. banners=True
+    iken açık portların banner'ları tarama sürerken toplanır.
+    """
     print(f"\n{Colors.INFO}[*] Aralık taraması başlatılıyor: {target}{Colors.RESET}")
     print(f"{Colors.INFO}[*] Port aralığı: {start_port}-{end_port}{Colors.RESET}")
-    print(f"{Colors.INFO}[*] Thread sayısı: {threads}{Colors.RESET}\n")
-    
-    port_queue = Queue()
-    open_ports = []
-    
-    # Port kuyruğunu doldur
-    for port in range(start_port, end_port + 1):
-        port_queue.put(port)
-    
-    # Thread'leri başlat
-    thread_list = []
-    for _ in range(threads):
-        thread = threading.Thread(target=scan_worker, args=(target, port_queue, open_ports, 1))
-        thread.daemon = True
-        thread.start()
-        thread_list.append(thread)
+    if engine == 'async':
+        print(f"{Colors.INFO}[*] Asenkron motor, eşzamanlı deneme: {concurrency}{Colors.RESET}\n")
+    else:
+        print(f"{Colors.INFO}[*] Thread sayısı: {threads}{Colors.RESET}\n")
     
-    # Tüm thread'lerin bitmesini bekle
-    port_queue.join()
+    timing = {}
+    started = time.monotonic()
+    ports = range(start_port, end_port + 1)
+    addresses, open_ports = scan_target(target, ports, engine, threads, concurrency, timeout,
+                                        adaptive, timing, all_addresses, banners)
+    elapsed = time.monotonic() - started
+    if not addresses:
+        return None
     
     result = {
         'target': target,
+        'addresses': addresses,
         'scan_type': 'range',
+        'engine': engine,
         'port_range': f"{start_port}-{end_port}",
         'total_ports_scanned': end_port - start_port + 1,
-        'open_ports': sorted(open_ports, key=lambda x: x['port']),
+        'open_ports': sorted(open_ports, key=lambda x: (x['port'], x['address'])),
+        'duration_seconds': round(elapsed, 2),
+        'timing': timing or None,
         'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     }
     
     print(f"\n{Colors.SUCCESS}[+] Tarama tamamlandı!{Colors.RESET}")
     print(f"{Colors.INFO}[*] Açık port sayısı: {len(open_ports)}{Colors.RESET}")
+    print(f"{Colors.INFO}[*] Süre: {elapsed:.1f} sn{Colors.RESET}")
     
     return result
 
-def full_scan(target, threads=100):
-    """Tam tarama - Tüm portlar (1-65535)"""
+def full_scan(target, threads=100, engine='async', concurrency=DEFAULT_ASYNC_CONCURRENCY, timeout=0.5,
+              adaptive=True, all_addresses=False, banners=True, checkpoint=True):
+    """Tam tarama - Tüm portlar (1-65535)
+    
+    checkpoint=True iken (asenkron motor) ilerleme data/scans/<id>.state
+    dosyasına düzenli kaydedilir; kesilen tarama resume_scan(<id>) ile sürer.
+    """
     print(f"\n{Colors.WARNING}[!] UYARI: Tam port taraması uzun sürebilir!{Colors.RESET}")
     confirm = input(f"{Colors.INPUT}Devam etmek istiyor musunuz? (E/H): {Colors.RESET}").strip().upper()
     
@@ -206,40 +1215,108 @@ def full_scan(target, threads=100):
     
     print(f"\n{Colors.INFO}[*] Tam tarama başlatılıyor: {target}{Colors.RESET}")
     print(f"{Colors.INFO}[*] Port aralığı: 1-65535{Colors.RESET}")
-    print(f"{Colors.INFO}[*] Thread sayısı: {threads}{Colors.RESET}\n")
-    
-    port_queue = Queue()
-    open_ports = []
-    
-    # Port kuyruğunu doldur
-    for port in range(1, 65536):
-        port_queue.put(port)
-    
-    # Thread'leri başlat
-    thread_list = []
-    for _ in range(threads):
-        thread = threading.Thread(target=scan_worker, args=(target, port_queue, open_ports, 0.5))
-        thread.daemon = True
-        thread.start()
-        thread_list.append(thread)
+    if engine == 'async':
+        print(f"{Colors.INFO}[*] Asenkron motor, eşzamanlı deneme: {concurrency}{Colors.RESET}\n")
+    else:
+        print(f"{Colors.INFO}[*] Thread sayısı: {threads}{Colors.RESET}\n")
     
-    # Tüm thread'lerin bitmesini bekle
-    port_queue.join()
+    timing = {}
+    states = [] if checkpoint else None
+    started = time.monotonic()
+    addresses, open_ports = scan_target(target, range(1, 65536), engine, threads, concurrency, timeout,
+                                        adaptive, timing, all_addresses, banners, states)
+    elapsed = time.monotonic() - started
+    if not addresses:
+        return None
     
     result = {
         'target': target,
+        'addresses': addresses,
         'scan_type': 'full',
+        'engine': engine,
+        'scan_ids': [state.scan_id for state in states or []],
         'port_range': '1-65535',
         'total_ports_scanned': 65535,
+        'open_ports': sorted(open_ports, key=lambda x: (x['port'], x['address'])),
+        'duration_seconds': round(elapsed, 2),
+        'timing': timing or None,
+        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    }
+    
+    print(f"\n{Colors.SUCCESS}[+] Tarama tamamlandı!{Colors.RESET}")
+    print(f"{Colors.INFO}[*] Açık port sayısı: {len(open_ports)}{Colors.RESET}")
+    print(f"{Colors.INFO}[*] Süre: {elapsed:.1f} sn{Colors.RESET}")
+    
+    return result
+
+def resume_scan(scan_id):
+    """data/scans/<id>.state'ten kesilen taramayı kaldığı yerden sürdür
+    
+    Yalnızca bitmap'te tamamlanmamış portlar taranır; daha önce bulunan açık
+    portlar sonuca eklenir.
+    """
+    try:
+        state = ScanState.load(scan_id)
+    except FileNotFoundError:
+        print(f"{Colors.ERROR}[-] Tarama durumu bulunamadı: {scan_id}{Colors.RESET}")
+        return None
+    except (OSError, ValueError, KeyError) as e:
+        print(f"{Colors.ERROR}[-] Tarama durumu okunamadı ({scan_id}): {e}{Colors.RESET}")
+        return None
+    
+    options = state.options
+    ports = parse_port_spec(options['ports'])
+    remaining = sum(1 for port in ports if port not in state.done)
+    print(f"\n{Colors.INFO}[*] Tarama sürdürülüyor: {state.target} ({state.address[1]}){Colors.RESET}")
+    print(f"{Colors.INFO}[*] Kalan port: {remaining}/{len(ports)}, "
+          f"bulunan açık port: {len(state.open_ports)}{Colors.RESET}\n")
+    
+    timing = {}
+    started = time.monotonic()
+    if state.complete:
+        print(f"{Colors.WARNING}[!] Bu tarama zaten tamamlanmış{Colors.RESET}")
+        open_ports = state.records()
+    else:
+        open_ports = run_scan(state.address, ports, 'async', 0, options['concurrency'], options['timeout'],
+                              options['adaptive'], timing, options['banners'],
+                              state.target.strip().strip('[]'), state)
+    elapsed = time.monotonic() - started
+    
+    result = {
+        'target': state.target,
+        'addresses': [state.address[1]],
+        'scan_type': 'full' if options['ports'] == '1-65535' else 'range',
+        'engine': 'async',
+        'scan_ids': [state.scan_id],
+        'resumed': True,
+        'port_range': options['ports'],
+        'total_ports_scanned': len(ports),
+        'ports_scanned_this_run': remaining,
         'open_ports': sorted(open_ports, key=lambda x: x['port']),
+        'duration_seconds': round(elapsed, 2),
+        'timing': timing or None,
         'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     }
     
     print(f"\n{Colors.SUCCESS}[+] Tarama tamamlandı!{Colors.RESET}")
     print(f"{Colors.INFO}[*] Açık port sayısı: {len(open_ports)}{Colors.RESET}")
+    print(f"{Colors.INFO}[*] Süre: {elapsed:.1f} sn{Colors.RESET}")
     
     return result
 
+def print_scan_states():
+    """Yarım kalan taramaları listele"""
+    states = list_scan_states()
+    if not states:
+        print(f"{Colors.WARNING}[!] Yarım kalan tarama yok{Colors.RESET}")
+        return states
+    print(f"\n{Colors.INFO}[*] Yarım kalan taramalar:{Colors.RESET}")
+    for state in states:
+        total = len(parse_port_spec(state.options['ports']))
+        print(f"  {Colors.INPUT}{state.scan_id}{Colors.RESET} - {state.target}: "
+              f"{len(state.done)}/{total} port, {len(state.open_ports)} açık")
+    return states
+
 def custom_ports_scan(target, ports):
     """Özel port listesi tarama"""
     print(f"\n{Colors.INFO}[*] Özel port taraması başlatılıyor: {target}{Colors.RESET}")
@@ -274,67 +1351,44 @@ def service_detection(target, port):
     """Servis versiyonu tespiti (banner grabbing)"""
     print(f"\n{Colors.INFO}[*] Servis tespiti yapılıyor: {target}:{port}{Colors.RESET}")
     
-    try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(3)
-        sock.connect((target, port))
-        
-        # Banner al
-        try:
-            banner = sock.recv(1024).decode('utf-8', errors='ignore').strip()
-            if banner:
-                print(f"{Colors.SUCCESS}[+] Banner: {banner}{Colors.RESET}")
-                return {'port': port, 'banner': banner}
-        except:
-            pass
-        
-        # HTTP request dene
-        if port in [80, 443, 8080, 8443]:
-            sock.send(b"GET / HTTP/1.1\r\nHost: " + target.encode() + b"\r\n\r\n")
-            response = sock.recv(1024).decode('utf-8', errors='ignore')
-            print(f"{Colors.SUCCESS}[+] HTTP Response: {response[:200]}...{Colors.RESET}")
-            return {'port': port, 'response': response[:500]}
-        
-        sock.close()
+    addresses = resolve_target(target)
+    if not addresses:
+        print(f"{Colors.ERROR}[-] Hedef çözümlenemedi: {target}{Colors.RESET}")
         return None
-        
-    except Exception as e:
-        print(f"{Colors.ERROR}[-] Servis tespit hatası: {e}{Colors.RESET}")
+    
+    info = asyncio.run(grab_banner(addresses[0], port, server_name=target.strip().strip('[]')))
+    if info.get('error'):
+        print(f"{Colors.ERROR}[-] Servis tespit hatası: {info['error']}{Colors.RESET}")
         return None
+    if not info.get('banner'):
+        print(f"{Colors.WARNING}[!] Banner alınamadı{Colors.RESET}")
+        return None
+    
+    print(f"{Colors.SUCCESS}[+] Protokol: {info['protocol']}{Colors.RESET}")
+    if info.get('product'):
+        print(f"{Colors.SUCCESS}[+] Ürün: {info['product']}{Colors.RESET}")
+    print(f"{Colors.SUCCESS}[+] Banner: {info['banner'][:200]}{Colors.RESET}")
+    return {'port': port, **info}
 
 def vulnerability_check(open_ports):
-    """Temel güvenlik açığı kontrolü"""
+    """Temel güvenlik açığı kontrolü
+    
+    Kurallar data/service_fingerprints.json'dan gelir; port, servis ya da
+    banner'dan çıkarılan ürün/sürüm koşuluna göre eşleşir.
+    """
     print(f"\n{Colors.INFO}[*] Güvenlik açığı kontrolü yapılıyor...{Colors.RESET}")
     
     vulnerabilities = []
+    if FINGERPRINT_DB is None:
+        print(f"{Colors.WARNING}[!] Parmak izi veritabanı yok, kontrol atlandı{Colors.RESET}")
+        return vulnerabilities
     
     for port_info in open_ports:
-        port = port_info['port']
-        
-        # Tehlikeli portlar
-        if port == 23:  # Telnet
+        for rule in FINGERPRINT_DB.vulnerabilities(port_info):
             vulnerabilities.append({
-                'port': port,
-                'severity': 'HIGH',
-                'issue': 'Telnet servisi aktif - Şifrelenmemiş bağlantı'
-            })
-        elif port == 21:  # FTP
-            vulnerabilities.append({
-                'port': port,
-                'severity': 'MEDIUM',
-                'issue': 'FTP servisi aktif - Şifrelenmemiş veri transferi'
-            })
-        elif port == 445:  # SMB
-            vulnerabilities.append({
-                'port': port,
-                'severity': 'MEDIUM',
-                'issue': 'SMB servisi açık - EternalBlue ve benzeri saldırılara açık olabilir'
-            })
-        elif port == 3389:  # RDP
-            vulnerabilities.append({
-                'port': port,
-                'severity': 'MEDIUM',
-                'issue': 'RDP servisi açık - Brute force saldırılarına karşı savunmasız olabilir'
+                'port': port_info['port'],
+                'severity': rule.severity,
+                'issue': rule.issue
             })
     
     if vulnerabilities:
@@ -364,6 +1418,8 @@ def port_scanner_menu():
   {Colors.INPUT}[4]{Colors.RESET} 🎯 Özel Port Listesi
   {Colors.INPUT}[5]{Colors.RESET} 🔎 Servis Tespiti (Banner)
   {Colors.INPUT}[6]{Colors.RESET} 🛡️  Güvenlik Kontrolü
+  {Colors.INPUT}[7]{Colors.RESET} 🌐 Çoklu Hedef (Kapsam Dosyası)
+  {Colors.INPUT}[8]{Colors.RESET} ⏯️  Yarım Kalan Taramayı Sürdür
   {Colors.INPUT}[0]{Colors.RESET} 🔙 Ana Menüye Dön
 
 {Colors.WARNING}[!] UYARI: Port tarama sadece kendi sistemlerinizde veya izniniz 
@@ -423,6 +1479,26 @@ def port_scanner_menu():
                     vulnerabilities = vulnerability_check(result['open_ports'])
                     result['vulnerabilities'] = vulnerabilities
                     save_result(f"security_{target}", result)
+        elif choice == '7':
+            scope_file = input(f"\n{Colors.INPUT}Kapsam dosyası (izinli host/CIDR listesi): {Colors.RESET}").strip()
+            targets_str = input(f"{Colors.INPUT}Hedefler (virgülle, boş = tüm kapsam): {Colors.RESET}").strip()
+            ports_str = input(f"{Colors.INPUT}Portlar (örn: 22,80,8000-8100, boş = yaygın): {Colors.RESET}").strip()
+            
+            if scope_file:
+                try:
+                    ports = parse_port_spec(ports_str) if ports_str else None
+                except ValueError:
+                    print(f"{Colors.ERROR}[-] Geçersiz port listesi!{Colors.RESET}")
+                else:
+                    targets = [t.strip() for t in targets_str.split(',') if t.strip()] or None
+                    multi_target_scan(scope_file, targets, ports)
+        elif choice == '8':
+            if print_scan_states():
+                scan_id = input(f"\n{Colors.INPUT}Tarama kimliği: {Colors.RESET}").strip()
+                if scan_id:
+                    result = resume_scan(scan_id)
+                    if result:
+                        save_result(f"resume_{scan_id}", result)
         else:
             print(f"{Colors.ERROR}[-] Geçersiz seçim!{Colors.RESET}")
         
@@ -438,4 +1514,24 @@ def main():
         print(f"\n{Colors.ERROR}[-] Beklenmeyen hata: {e}{Colors.RESET}")
 
 if __name__ == "__main__":
-    main()
+    import argparse
+    parser = argparse.ArgumentParser(description="HIG-Osint port tarayıcı")
+    parser.add_argument('command', nargs='?', choices=['resume', 'list'],
+                        help="resume <id>: kesilen taramayı sürdür, list: yarım kalanları göster")
+    parser.add_argument('scan_id', nargs='?', help="data/scans/ altındaki tarama kimliği")
+    args = parser.parse_args()
+    
+    if args.command == 'list':
+        print_scan_states()
+    elif args.command == 'resume':
+        if not args.scan_id:
+            parser.error("resume için tarama kimliği gerekli")
+        try:
+            result = resume_scan(args.scan_id)
+        except KeyboardInterrupt:
+            print(f"\n{Colors.WARNING}[!] İşlem iptal edildi, durum kaydedildi{Colors.RESET}")
+            result = None
+        if result:
+            save_result(f"resume_{args.scan_id}", result)
+    else:
+        main()
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Rate Limiter Module - Host Bazlı Uyarlanabilir Hız Sınırlayıcı
+Tüm HTTP isteği yapan modüllerin ortak kullandığı token-bucket zamanlayıcı
+"""
+
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+try:
+    import requests
+except ImportError:
+    requests = None
+
+try:
+    from modules.settings import get_setting_section
+except ImportError:
+    from settings import get_setting_section
+
+THROTTLE_STATUSES = (429, 503)
+MAX_RETRY_AFTER = 300  # Sunucu ne derse desin en fazla bu kadar bekle (saniye)
+
+
+def parse_retry_after(value):
+    """Retry-After başlığını saniyeye çevir (sayı ya da HTTP tarihi)"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return min(int(value), MAX_RETRY_AFTER)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    delay = (when - datetime.now(timezone.utc)).total_seconds()
+    return min(max(delay, 0), MAX_RETRY_AFTER)
+
+
+def host_of(url_or_host):
+    """URL ya da host adından anahtar olarak kullanılacak host'u çıkar"""
+    if '://' in url_or_host:
+        return (urlparse(url_or_host).hostname or url_or_host).lower()
+    return url_or_host.lower()
+
+
+class HostBucket:
+    """Tek bir host'un token-bucket durumu"""
+
+    __slots__ = ('rate', 'tokens', 'updated', 'blocked_until')
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+
+
+class RateLimiter:
+    """Host bazlı token-bucket; 429/503'te hızı yarıya indirir (AIMD),
+    başarılı yanıtlarda yavaşça artırır ve Retry-After'a uyar.
+
+    Senkron (acquire) ve asenkron (acquire_async) kullanım aynı durumu paylaşır.
+    """
+
+    def __init__(self, rate=5.0, burst=10, min_rate=0.2, max_rate=50.0,
+                 increase=1.0, decrease=0.5, enabled=True):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.enabled = enabled
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, host):
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = HostBucket(self.rate, self.burst)
+        return bucket
+
+    def reserve(self, url_or_host):
+        """Bir token ayır ve isteğe başlamadan önce beklenecek süreyi döndür"""
+        if not self.enabled:
+            return 0.0
+        host = host_of(url_or_host)
+        with self._lock:
+            bucket = self._bucket(host)
+            now = time.monotonic()
+            bucket.tokens = min(self.burst, bucket.tokens + (now - bucket.updated) * bucket.rate)
+            bucket.updated = now
+            bucket.tokens -= 1
+            wait = -bucket.tokens / bucket.rate if bucket.tokens < 0 else 0.0
+            return max(wait, bucket.blocked_until - now)
+
+    def acquire(self, url_or_host):
+        """Host için sıra gelene kadar bekle (senkron)"""
+        delay = self.reserve(url_or_host)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, url_or_host):
+        """Host için sıra gelene kadar bekle (asenkron)"""
+        delay = self.reserve(url_or_host)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def feedback(self, url_or_host, status, retry_after=None):
+        """Yanıt durumuna göre host hızını uyarla"""
+        if not self.enabled:
+            return
+        host = host_of(url_or_host)
+        with self._lock:
+            bucket = self._bucket(host)
+            now = time.monotonic()
+            if status in THROTTLE_STATUSES:
+                bucket.rate = max(self.min_rate, bucket.rate * self.decrease)
+                bucket.tokens = min(bucket.tokens, 0)
+                delay = parse_retry_after(retry_after)
+                if delay is None:
+                    delay = 1.0 / bucket.rate
+                bucket.blocked_until = max(bucket.blocked_until, now + delay)
+            elif status < 500:
+                bucket.rate = min(self.max_rate, bucket.rate + self.increase / bucket.rate)
+
+    def current_rate(self, url_or_host):
+        """Host için şu anki istek/saniye değeri"""
+        with self._lock:
+            bucket = self._buckets.get(host_of(url_or_host))
+            return bucket.rate if bucket else self.rate
+
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+
+def get_limiter():
+    """Ayarlardan yapılandırılmış ortak sınırlayıcıyı döndür"""
+    global _limiter
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                config = get_setting_section('security')
+                _limiter = RateLimiter(
+                    rate=float(config.get('rate_limit_per_host', 5)),
+                    burst=int(config.get('rate_limit_burst', 10)),
+                    enabled=bool(config.get('rate_limit', True)),
+                )
+    return _limiter
+
+
+def limited_request(method, url, retries=2, session=None, **kwargs):
+    """requests ile sınırlayıcıdan geçen istek; 429/503'te Retry-After'a uyarak tekrar dener
+
+    session verilirse (ör. http_client.get_session()) istek onun bağlantı
+    havuzu üzerinden yapılır.
+    """
+    limiter = get_limiter()
+    client = session if session is not None else requests
+    for attempt in range(retries + 1):
+        limiter.acquire(url)
+        response = client.request(method, url, **kwargs)
+        limiter.feedback(url, response.status_code, response.headers.get('Retry-After'))
+        if response.status_code not in THROTTLE_STATUSES or attempt == retries:
+            return response
+        response.close()
+    return response
+
+
+def limited_get(url, **kwargs):
+    """requests.get yerine kullanılacak sınırlı GET"""
+    return limited_request('GET', url, **kwargs)
+
+
+@asynccontextmanager
+async def limited_session_request(session, method, url, retries=2, slot=None, **kwargs):
+    """aiohttp oturumu için sınırlayıcıdan geçen istek (async with ile kullanılır)
+
+    limited_request gibi 429/503'te Retry-After'a (yoksa düşürülen host
+    hızına) uyarak en fazla `retries` kez tekrar dener; son yanıt ne olursa
+    olsun çağırana verilir. slot (ör. asyncio.Semaphore) verilirse yalnızca
+    sınırlayıcı izin verdikten sonra alınır ve yanıt bırakılınca geri
+    verilir; hız beklemesi ya da Retry-After geri çekilmesi eşzamanlılık
+    yuvası tutmaz.
+    """
+    limiter = get_limiter()
+    for attempt in range(retries + 1):
+        await limiter.acquire_async(url)
+        if slot is not None:
+            await slot.acquire()
+        try:
+            response = await session.request(method, url, **kwargs)
+        except BaseException:
+            if slot is not None:
+                slot.release()
+            raise
+        limiter.feedback(url, response.status, response.headers.get('Retry-After'))
+        if response.status not in THROTTLE_STATUSES or attempt == retries:
+            break
+        response.release()
+        if slot is not None:
+            slot.release()
+    try:
+        yield response
+    finally:
+        response.release()
+        if slot is not None:
+            slot.release()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Result Cache Module - Kalıcı Sonuç Önbelleği
+data/ altında SQLite tabanlı, TTL'li ve boyut sınırlı (LRU) önbellek
+"""
+
+import json
+import sqlite3
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+DATA_DIR = BASE_DIR / 'data'
+
+DEFAULT_MAX_ENTRIES = 50000
+EVICT_CHECK_INTERVAL = 100  # Kaç yazmada bir boyut kontrolü yapılacağı
+ACCESS_FLUSH_INTERVAL = 500  # Kaç okuma zamanı birikince diske toplu yazılacağı
+
+
+class ResultCache:
+    """(namespace, key) -> JSON değer eşlemesi tutan kalıcı önbellek.
+
+    Her kaydın kendi son kullanma zamanı vardır; kayıt sayısı max_entries'i
+    aşınca en uzun süredir okunmayan kayıtlar silinir. Okuma zamanları
+    her isabette yazılmaz; bellekte biriktirilip tahliyeden önce, kapanışta
+    ya da ACCESS_FLUSH_INTERVAL dolunca tek işlemde diske aktarılır.
+    """
+
+    def __init__(self, path, max_entries=DEFAULT_MAX_ENTRIES):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self._writes = 0
+        self._accessed = {}
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS entries ('
+            ' namespace TEXT NOT NULL,'
+            ' key TEXT NOT NULL,'
+            ' value TEXT NOT NULL,'
+            ' stored_at REAL NOT NULL,'
+            ' expires_at REAL NOT NULL,'
+            ' last_access REAL NOT NULL,'
+            ' PRIMARY KEY (namespace, key))'
+        )
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_last_access ON entries (last_access)')
+        self._conn.commit()
+
+    def get(self, namespace, key, default=None):
+        """Süresi dolmamış kaydı döndür, yoksa default"""
+        now = time.time()
+        row = self._conn.execute(
+            'SELECT value, expires_at FROM entries WHERE namespace = ? AND key = ?',
+            (namespace, key)
+        ).fetchone()
+        if row is None:
+            return default
+        value, expires_at = row
+        if expires_at <= now:
+            self.delete(namespace, key)
+            return default
+        self._accessed[(namespace, key)] = now
+        if len(self._accessed) >= ACCESS_FLUSH_INTERVAL:
+            self.flush_access()
+        return json.loads(value)
+
+    def flush_access(self):
+        """Biriken okuma zamanlarını tek işlemde diske yaz"""
+        if not self._accessed:
+            return
+        self._conn.executemany(
+            'UPDATE entries SET last_access = ? WHERE namespace = ? AND key = ?',
+            [(when, namespace, key) for (namespace, key), when in self._accessed.items()]
+        )
+        self._conn.commit()
+        self._accessed.clear()
+
+    def set(self, namespace, key, value, ttl):
+        """Kaydı ttl saniye geçerli olacak şekilde yaz"""
+        if ttl <= 0:
+            return
+        now = time.time()
+        self._accessed.pop((namespace, key), None)
+        self._conn.execute(
+            'INSERT OR REPLACE INTO entries (namespace, key, value, stored_at, expires_at, last_access) '
+            'VALUES (?, ?, ?, ?, ?, ?)',
+            (namespace, key, json.dumps(value, ensure_ascii=False), now, now + ttl, now)
+        )
+        self._conn.commit()
+        self._writes += 1
+        if self._writes % EVICT_CHECK_INTERVAL == 0:
+            self.evict()
+
+    def delete(self, namespace, key):
+        """Tek bir kaydı sil"""
+        self._accessed.pop((namespace, key), None)
+        self._conn.execute('DELETE FROM entries WHERE namespace = ? AND key = ?', (namespace, key))
+        self._conn.commit()
+
+    def evict(self):
+        """Süresi dolanları sil, ardından boyut sınırını LRU sırasıyla uygula"""
+        self.flush_access()
+        self._conn.execute('DELETE FROM entries WHERE expires_at <= ?', (time.time(),))
+        count = self._conn.execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                'DELETE FROM entries WHERE rowid IN '
+                '(SELECT rowid FROM entries ORDER BY last_access ASC LIMIT ?)',
+                (overflow,)
+            )
+        self._conn.commit()
+
+    def __len__(self):
+        return self._conn.execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+
+    def close(self):
+        self.evict()
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
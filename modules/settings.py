@@ -59,7 +59,36 @@ DEFAULT_SETTINGS = {
     'security': {
         'verify_ssl': True,
         'user_agent': 'HIG-OSINT/3.0',
-        'rate_limit': True
+        'rate_limit': True,
+        'rate_limit_per_host': 5,
+        'rate_limit_burst': 10
+    },
+    'cache': {
+        'enabled': True,
+        'positive_ttl': 86400,
+        'negative_ttl': 21600,
+        'error_ttl': 600,
+        'max_entries': 50000
+    },
+    'dns': {
+        'nameservers': [],
+        'timeout': 1.0,
+        'retries': 3,
+        'concurrency': 500
+    },
+    'tls': {
+        'timeout': 5.0,
+        'concurrency': 100
+    },
+    'whois': {
+        'timeout': 10.0,
+        'record_ttl': 604800,
+        'negative_ttl': 86400,
+        'server_ttl': 2592000,
+        'rate_per_server': 1.0
+    },
+    'wordlists': {
+        'bloom_threshold': 5000000
     }
 }
 
@@ -91,6 +120,17 @@ def load_settings():
         print(f"{Colors.ERROR}[-] Ayarlar yüklenemedi: {e}{Colors.RESET}")
         return DEFAULT_SETTINGS
 
+def get_setting_section(section):
+    """Tek bir ayar bölümünü varsayılanlarla birleştirerek oku (dosyaya yazmaz)"""
+    values = dict(DEFAULT_SETTINGS.get(section, {}))
+    try:
+        if CONFIG_FILE.exists():
+            with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
+                values.update(json.load(f).get(section, {}))
+    except Exception:
+        pass
+    return values
+
 def save_settings(settings):
     """Ayarları kaydet"""
     try:
@@ -133,6 +173,26 @@ def view_settings():
     print(f"\n{Colors.INFO}[Güvenlik Ayarları]{Colors.RESET}")
     for key, value in settings['security'].items():
         print(f"  - {key}: {value}")
+    
+    print(f"\n{Colors.INFO}[Önbellek Ayarları]{Colors.RESET}")
+    for key, value in settings.get('cache', DEFAULT_SETTINGS['cache']).items():
+        print(f"  - {key}: {value}")
+    
+    print(f"\n{Colors.INFO}[DNS Ayarları]{Colors.RESET}")
+    for key, value in settings.get('dns', DEFAULT_SETTINGS['dns']).items():
+        print(f"  - {key}: {value}")
+    
+    print(f"\n{Colors.INFO}[TLS Ayarları]{Colors.RESET}")
+    for key, value in settings.get('tls', DEFAULT_SETTINGS['tls']).items():
+        print(f"  - {key}: {value}")
+    
+    print(f"\n{Colors.INFO}[WHOIS Ayarları]{Colors.RESET}")
+    for key, value in settings.get('whois', DEFAULT_SETTINGS['whois']).items():
+        print(f"  - {key}: {value}")
+    
+    print(f"\n{Colors.INFO}[Kelime Listesi Ayarları]{Colors.RESET}")
+    for key, value in settings.get('wordlists', DEFAULT_SETTINGS['wordlists']).items():
+        print(f"  - {key}: {value}")
 
 def edit_general_settings():
     """Genel ayarları düzenle"""
@@ -272,6 +332,14 @@ def edit_security_settings():
     if rate_limit:
         settings['security']['rate_limit'] = rate_limit.lower() == 'true'
     
+    per_host = settings['security'].get('rate_limit_per_host', DEFAULT_SETTINGS['security']['rate_limit_per_host'])
+    rate = input(f"{Colors.INPUT}Host başına istek/saniye [{per_host}]: {Colors.RESET}").strip()
+    if rate:
+        try:
+            settings['security']['rate_limit_per_host'] = float(rate)
+        except ValueError:
+            print(f"{Colors.ERROR}[-] Geçersiz değer!{Colors.RESET}")
+    
     save_settings(settings)
 
 def reset_settings():
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Task Graph Module - Bağımlılık Grafiği Yürütücüsü
+Birbirine bağımlı aşamaları (stage) bir DAG olarak çalıştırır: bağımlılığı
+kalmayan her aşama hemen ayrı bir thread'de başlar, her aşamanın kendi
+süre sınırı vardır ve sonuçlar aşamalar bittikçe bildirilir. Toplam süre
+aşama sürelerinin toplamı yerine kritik yola yaklaşır.
+"""
+
+import sys
+import threading
+import time
+from concurrent.futures import Future, wait, FIRST_COMPLETED
+
+from colorama import Fore, Style
+
+STATUS_OK = 'ok'
+STATUS_ERROR = 'error'
+STATUS_TIMEOUT = 'timeout'
+
+
+class Colors:
+    ERROR = Fore.RED + Style.BRIGHT
+    RESET = Style.RESET_ALL
+
+
+class Stage:
+    """Grafikteki tek aşama
+
+    func, deps sırasıyla bağımlılıkların sonuçlarını pozisyonel argüman
+    olarak, aşamanın çıktı hedefini (StageLog) out anahtar argümanıyla
+    alır. Başarısız ya da süresi dolan bir bağımlılığın sonucu None
+    olarak iletilir; aşama bu durumu kendisi ele almalıdır.
+    """
+
+    __slots__ = ('name', 'func', 'deps', 'timeout', 'label')
+
+    def __init__(self, name, func, deps=(), timeout=None, label=None):
+        self.name = name
+        self.func = func
+        self.deps = tuple(deps)
+        self.timeout = timeout
+        self.label = label or name
+
+
+def validate_graph(stages):
+    """Bilinmeyen bağımlılık, tekrar eden ad ya da döngü varsa ValueError"""
+    by_name = {}
+    for stage in stages:
+        if stage.name in by_name:
+            raise ValueError(f"Aşama adı tekrar ediyor: {stage.name}")
+        by_name[stage.name] = stage
+    for stage in stages:
+        for dep in stage.deps:
+            if dep not in by_name:
+                raise ValueError(f"{stage.name}: bilinmeyen bağımlılık {dep}")
+    visiting, visited = set(), set()
+
+    def visit(name):
+        if name in visited:
+            return
+        if name in visiting:
+            raise ValueError(f"Bağımlılık döngüsü: {name}")
+        visiting.add(name)
+        for dep in by_name[name].deps:
+            visit(dep)
+        visiting.discard(name)
+        visited.add(name)
+
+    for stage in stages:
+        visit(stage.name)
+    return by_name
+
+
+class StageLog:
+    """Tek aşamanın çıktı hedefi; print() yerine çağrılır
+
+    Aşamanın kendi thread'i, açtığı işçi thread'ler ve asyncio döngüsü
+    aynı nesneye yazabilir. buffered açıksa satırlar aşama bitene kadar
+    tutulur, değilse hemen hedefe yazılır. Aşama iptal edildikten sonra
+    (süre sınırı aşıldığında) yazılanlar atılır; cancelled olayı uzun
+    süren işlerin erken bırakması için izlenebilir.
+    """
+
+    def __init__(self, target=None, buffered=True):
+        self.target = target
+        self.buffered = buffered
+        self.cancelled = threading.Event()
+        self._lines = []
+        self._lock = threading.Lock()
+
+    def __call__(self, *values, sep=' ', end='\n'):
+        text = sep.join(str(value) for value in values) + end
+        with self._lock:
+            if self.cancelled.is_set():
+                return
+            if self.buffered:
+                self._lines.append(text)
+            else:
+                target = self.target or sys.stdout
+                target.write(text)
+                target.flush()
+
+    def drain(self):
+        """Tamponlanan çıktıyı döndür ve tamponu boşalt"""
+        with self._lock:
+            text = ''.join(self._lines)
+            self._lines.clear()
+        return text
+
+    def cancel(self):
+        with self._lock:
+            self.cancelled.set()
+            self._lines.clear()
+
+
+def run_graph(stages, on_done=None, capture_output=True):
+    """Aşamaları bağımlılık sırasına uyarak eşzamanlı çalıştır
+
+    on_done(stage, status, result, elapsed) her aşama bittiğinde (ana
+    thread'de) çağrılır. Her aşama kendi StageLog'unu out argümanıyla
+    alır; capture_output açıksa aşamanın çıktısı tamponlanır ve aşama
+    bitince tek blok halinde yazılır, böylece eşzamanlı aşamaların (ve
+    onların işçi thread'lerinin) satırları birbirine karışmaz.
+
+    Süresi dolan aşamanın thread'i durdurulamaz: StageLog'u iptal
+    edilir, sonraki çıktısı atılır ve sonucu yok sayılır. Aşamalar daemon
+    thread'lerde çalışır, terk edilen bir aşama programın kapanmasını
+    bekletmez. Dönüş: {ad: {'status', 'result', 'elapsed'}}
+    """
+    by_name = validate_graph(stages)
+    dependents = {name: [] for name in by_name}
+    waiting = {}
+    for stage in stages:
+        waiting[stage.name] = len(stage.deps)
+        for dep in stage.deps:
+            dependents[dep].append(stage.name)
+
+    outcomes = {}
+    running = {}
+
+    def execute(stage, args, log, future):
+        try:
+            future.set_result(stage.func(*args, out=log))
+        except Exception as e:
+            future.set_exception(e)
+
+    def submit(stage):
+        args = [outcomes[dep]['result'] for dep in stage.deps]
+        log = StageLog(buffered=capture_output)
+        future = Future()
+        future.set_running_or_notify_cancel()
+        threading.Thread(target=execute, args=(stage, args, log, future),
+                         name=f"stage-{stage.name}", daemon=True).start()
+        started = time.monotonic()
+        deadline = started + stage.timeout if stage.timeout else None
+        running[future] = (stage, log, started, deadline)
+
+    def finish(stage, status, result, started):
+        elapsed = time.monotonic() - started
+        outcomes[stage.name] = {'status': status, 'result': result, 'elapsed': elapsed}
+        if on_done is not None:
+            on_done(stage, status, result, elapsed)
+        for name in dependents[stage.name]:
+            waiting[name] -= 1
+            if waiting[name] == 0:
+                submit(by_name[name])
+
+    for stage in stages:
+        if not stage.deps:
+            submit(stage)
+    while running:
+        deadlines = [deadline for *_, deadline in running.values() if deadline is not None]
+        timeout = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+        done, _ = wait(list(running), timeout=timeout, return_when=FIRST_COMPLETED)
+        for future in done:
+            stage, log, started, _ = running.pop(future)
+            error = future.exception()
+            print(log.drain(), end='')
+            if error is not None:
+                print(f"{Colors.ERROR}[-] {stage.label} hatası: {error}{Colors.RESET}")
+            finish(stage, STATUS_ERROR if error is not None else STATUS_OK,
+                   None if error is not None else future.result(), started)
+        now = time.monotonic()
+        for future, (stage, log, started, deadline) in list(running.items()):
+            if deadline is not None and now >= deadline:
+                del running[future]
+                log.cancel()
+                finish(stage, STATUS_TIMEOUT, None, started)
+    return outcomes
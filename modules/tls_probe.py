@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+TLS Probe Module - Toplu TLS Sertifika Toplama
+Tek bir SSLContext'i (CA deposu bir kez yüklenir) paylaşarak çok sayıda
+host/port'a eşzamanlı TLS el sıkışması yapar, sunucunun gönderdiği DER
+sertifika zincirini yakalar ve sertifikaları olay döngüsünü bloklamadan
+bir iş parçacığında cryptography ile çözümler. Aynı sertifika (örn. joker
+sertifika paylaşan subdomainler) yalnızca bir kez çözümlenir.
+"""
+
+import asyncio
+import hashlib
+import ssl
+import threading
+import time
+from collections import OrderedDict
+
+try:
+    from cryptography import x509
+    from cryptography.x509.oid import NameOID
+    CRYPTOGRAPHY_AVAILABLE = True
+except ImportError:
+    CRYPTOGRAPHY_AVAILABLE = False
+
+try:
+    from modules.settings import get_setting_section
+except ImportError:
+    try:
+        from settings import get_setting_section
+    except ImportError:
+        get_setting_section = None
+
+DEFAULT_TLS_PORT = 443
+DEFAULT_TIMEOUT = 5.0             # Bağlantı + el sıkışma için toplam süre
+DEFAULT_CONCURRENCY = 100         # Aynı anda süren el sıkışma sayısı
+MAX_PARSED_CERTIFICATES = 4096    # Çözümlenmiş sertifika önbelleği (LRU)
+
+# Sunucunun gönderdiği tam zincir yalnızca Python 3.13+'te herkese açık API ile alınır
+CHAIN_SUPPORTED = hasattr(ssl.SSLObject, 'get_unverified_chain')
+
+# İmza algoritması OID'leri
+SIGNATURE_ALGORITHMS = {
+    '1.2.840.113549.1.1.4': 'md5WithRSAEncryption',
+    '1.2.840.113549.1.1.5': 'sha1WithRSAEncryption',
+    '1.2.840.113549.1.1.10': 'rsassaPss',
+    '1.2.840.113549.1.1.11': 'sha256WithRSAEncryption',
+    '1.2.840.113549.1.1.12': 'sha384WithRSAEncryption',
+    '1.2.840.113549.1.1.13': 'sha512WithRSAEncryption',
+    '1.2.840.10045.4.1': 'ecdsa-with-SHA1',
+    '1.2.840.10045.4.3.2': 'ecdsa-with-SHA256',
+    '1.2.840.10045.4.3.3': 'ecdsa-with-SHA384',
+    '1.2.840.10045.4.3.4': 'ecdsa-with-SHA512',
+    '1.3.101.112': 'Ed25519',
+    '1.3.101.113': 'Ed448'
+}
+
+# Ad öznitelikleri getpeercert() ile aynı uzun adlarla raporlanır
+NAME_ATTRIBUTES = {
+    NameOID.COMMON_NAME: 'commonName',
+    NameOID.ORGANIZATION_NAME: 'organizationName',
+    NameOID.ORGANIZATIONAL_UNIT_NAME: 'organizationalUnitName',
+    NameOID.COUNTRY_NAME: 'countryName',
+    NameOID.STATE_OR_PROVINCE_NAME: 'stateOrProvinceName',
+    NameOID.LOCALITY_NAME: 'localityName',
+    NameOID.EMAIL_ADDRESS: 'emailAddress',
+    NameOID.SERIAL_NUMBER: 'serialNumber',
+    NameOID.DOMAIN_COMPONENT: 'domainComponent'
+} if CRYPTOGRAPHY_AVAILABLE else {}
+
+
+def capability_warnings():
+    """Bu ortamda eksik kalan yetenekler için kullanıcıya gösterilecek uyarılar"""
+    warnings = []
+    if not CRYPTOGRAPHY_AVAILABLE:
+        warnings.append("cryptography yüklü değil: sertifikalar çözümlenmeyecek "
+                        "(SAN, issuer, geçerlilik yok) - pip install cryptography")
+    if not CHAIN_SUPPORTED:
+        warnings.append("Python 3.13 öncesi: sunucu zinciri alınamıyor, yalnızca yaprak sertifika toplanacak")
+    return warnings
+
+
+# -- Sertifika çözümleme --------------------------------------------------
+
+def _name_dict(name):
+    return {NAME_ATTRIBUTES.get(attribute.oid, attribute.rfc4514_attribute_name): attribute.value
+            for attribute in name}
+
+
+def _validity(cert, field):
+    # cryptography 42+ saat dilimli *_utc özelliklerini sunar
+    value = getattr(cert, f"{field}_utc", None) or getattr(cert, field)
+    return value.strftime('%b %d %H:%M:%S %Y GMT')
+
+
+def parse_certificate(der):
+    """DER sertifikadan rapor sözlüğü üret (bloklayıcı; olay döngüsü dışında çağrılır)
+
+    Çözümlenemeyen sertifikada alanlar 'N/A' kalır ve 'error' doldurulur.
+    """
+    result = {
+        'version': 'N/A',
+        'serial_number': 'N/A',
+        'issuer': {},
+        'subject': {},
+        'not_before': 'N/A',
+        'not_after': 'N/A',
+        'san': [],
+        'dns_names': [],
+        'signature_algorithm': 'N/A',
+        'sha256': hashlib.sha256(der).hexdigest(),
+        'error': None
+    }
+    if not CRYPTOGRAPHY_AVAILABLE:
+        result['error'] = 'cryptography yüklü değil'
+        return result
+    try:
+        cert = x509.load_der_x509_certificate(der)
+        result.update({
+            'version': cert.version.value + 1,
+            'serial_number': format(cert.serial_number, 'X'),
+            'issuer': _name_dict(cert.issuer),
+            'subject': _name_dict(cert.subject),
+            'not_before': _validity(cert, 'not_valid_before'),
+            'not_after': _validity(cert, 'not_valid_after')
+        })
+        oid = cert.signature_algorithm_oid.dotted_string
+        result['signature_algorithm'] = SIGNATURE_ALGORITHMS.get(oid, oid)
+        try:
+            alt_names = cert.extensions.get_extension_for_class(x509.SubjectAlternativeName).value
+        except x509.ExtensionNotFound:
+            alt_names = None
+        if alt_names is not None:
+            dns_names = alt_names.get_values_for_type(x509.DNSName)
+            addresses = [str(address) for address in alt_names.get_values_for_type(x509.IPAddress)]
+            result['dns_names'] = dns_names
+            result['san'] = dns_names + addresses
+    except (ValueError, x509.DuplicateExtension, x509.UnsupportedGeneralNameType) as e:
+        result['error'] = str(e)
+    return result
+
+
+def peer_chain(ssl_object):
+    """Sunucunun gönderdiği zincir (DER listesi, yaprak sertifika başta)
+
+    Zincir yalnızca Python 3.13+'teki get_unverified_chain() ile alınır;
+    daha eski sürümlerde yaprak sertifikayla yetinilir (bkz.
+    capability_warnings).
+    """
+    if CHAIN_SUPPORTED:
+        try:
+            chain = ssl_object.get_unverified_chain()
+        except (ssl.SSLError, ValueError):
+            chain = None
+        if chain:
+            return list(chain)
+    leaf = ssl_object.getpeercert(binary_form=True)
+    return [leaf] if leaf else []
+
+
+def parse_target(target, default_port=DEFAULT_TLS_PORT):
+    """'host', 'host:port', '[v6]:port' ya da (host, port) → (host, port)"""
+    if isinstance(target, (tuple, list)):
+        return target[0], int(target[1])
+    target = target.strip()
+    if target.startswith('['):
+        host, _, rest = target[1:].partition(']')
+        return host, int(rest[1:]) if rest.startswith(':') else default_port
+    if target.count(':') == 1:
+        host, port = target.rsplit(':', 1)
+        return host, int(port)
+    return target, default_port
+
+
+def san_names(results, domain=None):
+    """Sonuçlardaki sertifikaların DNS SAN adları
+
+    *.example.com gibi joker girdiler tabanına indirgenir. domain
+    verilirse yalnızca domain'in kendisi ve altındaki adlar döner.
+    """
+    suffix = f".{domain}" if domain else None
+    names = set()
+    for result in results:
+        certificate = result.certificate
+        if not certificate:
+            continue
+        for name in certificate['dns_names']:
+            name = name.lower().rstrip('.')
+            if name.startswith('*.'):
+                name = name[2:]
+            if domain is None or name == domain or name.endswith(suffix):
+                names.add(name)
+    return names
+
+
+# -- Prob sonucu ------------------------------------------------------------
+
+class TlsResult:
+    """Tek host:port için el sıkışma sonucu; error doluysa bağlantı kurulamadı"""
+
+    __slots__ = ('host', 'port', 'server_name', 'tls_version', 'cipher', 'chain',
+                 'certificates', 'verified', 'verify_error', 'error', 'elapsed')
+
+    def __init__(self, host, port, server_name=None):
+        self.host = host
+        self.port = port
+        self.server_name = server_name
+        self.tls_version = None
+        self.cipher = None
+        self.chain = []
+        self.certificates = []
+        self.verified = False
+        self.verify_error = None
+        self.error = None
+        self.elapsed = 0.0
+
+    @property
+    def ok(self):
+        return self.error is None and bool(self.chain)
+
+    @property
+    def certificate(self):
+        """Yaprak sertifikanın çözümlenmiş hali"""
+        return self.certificates[0] if self.certificates else None
+
+    def to_dict(self):
+        return {
+            'host': self.host,
+            'port': self.port,
+            'tls_version': self.tls_version,
+            'cipher': self.cipher,
+            'verified': self.verified,
+            'verify_error': self.verify_error,
+            'error': self.error,
+            'elapsed': round(self.elapsed, 3),
+            'chain': self.certificates
+        }
+
+    def __repr__(self):
+        return f"TlsResult({self.host!r}, {self.port}, ok={self.ok}, verified={self.verified})"
+
+
+# -- Prob motoru ------------------------------------------------------------
+
+class TlsProber:
+    """Paylaşılan SSLContext ile eşzamanlı TLS prob motoru
+
+    El sıkışma önce doğrulayan bağlamla yapılır; zincir doğrulanamazsa
+    (süresi dolmuş, kendinden imzalı, isim uyuşmazlığı) sertifikayı yine de
+    toplamak için doğrulamasız bağlamla bir kez daha denenir ve sonuç
+    verified=False olarak işaretlenir. Çözümlenmiş sertifikalar DER
+    içeriğine göre en fazla max_parsed adetlik bir LRU önbellekte tutulur
+    ve çalıştırmalar (ve aynı nesneyi kullanan thread'ler) arasında korunur.
+    """
+
+    def __init__(self, timeout=DEFAULT_TIMEOUT, concurrency=DEFAULT_CONCURRENCY,
+                 max_parsed=MAX_PARSED_CERTIFICATES):
+        self.timeout = timeout
+        self.concurrency = max(1, concurrency)
+        self.context = ssl.create_default_context()
+        self.insecure_context = ssl.create_default_context()
+        self.insecure_context.check_hostname = False
+        self.insecure_context.verify_mode = ssl.CERT_NONE
+        self.stats = {'handshakes': 0, 'unverified': 0, 'errors': 0, 'parsed': 0, 'parse_cache_hits': 0}
+        self.max_parsed = max(1, max_parsed)
+        self._parsed = OrderedDict()
+        self._parsed_lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls):
+        """Ayarlardaki 'tls' bölümünden oluştur"""
+        config = get_setting_section('tls') if get_setting_section else {}
+        return cls(
+            timeout=config.get('timeout', DEFAULT_TIMEOUT),
+            concurrency=config.get('concurrency', DEFAULT_CONCURRENCY),
+        )
+
+    async def _handshake(self, host, port, server_name, context):
+        self.stats['handshakes'] += 1
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port, ssl=context, server_hostname=server_name,
+                                    ssl_handshake_timeout=self.timeout),
+            self.timeout)
+        try:
+            ssl_object = writer.get_extra_info('ssl_object')
+            return peer_chain(ssl_object), ssl_object.version(), ssl_object.cipher()
+        finally:
+            # close_notify beklemeden kapat; veri alışverişi yapılmıyor
+            writer.transport.abort()
+
+    def _cached_certificate(self, der):
+        with self._parsed_lock:
+            parsed = self._parsed.get(der)
+            if parsed is not None:
+                self._parsed.move_to_end(der)
+            return parsed
+
+    def _store_certificate(self, der, parsed):
+        with self._parsed_lock:
+            self._parsed[der] = parsed
+            self._parsed.move_to_end(der)
+            while len(self._parsed) > self.max_parsed:
+                self._parsed.popitem(last=False)
+
+    async def _parse_chain(self, chain, pending):
+        loop = asyncio.get_running_loop()
+        certificates = []
+        for der in chain:
+            parsed = self._cached_certificate(der)
+            if parsed is not None:
+                self.stats['parse_cache_hits'] += 1
+            else:
+                future = pending.get(der)
+                if future is None:
+                    future = pending[der] = loop.run_in_executor(None, parse_certificate, der)
+                    self.stats['parsed'] += 1
+                else:
+                    self.stats['parse_cache_hits'] += 1
+                parsed = await future
+                self._store_certificate(der, parsed)
+            certificates.append(parsed)
+        return certificates
+
+    async def _probe(self, host, port, server_name, pending):
+        result = TlsResult(host, port, server_name or host)
+        # IP adresleri SNI olarak gönderilmez; hostname kontrolü IP SAN ile yapılır
+        sni = result.server_name
+        started = time.monotonic()
+        try:
+            try:
+                chain, result.tls_version, result.cipher = await self._handshake(
+                    host, port, sni, self.context)
+                result.verified = True
+            except ssl.SSLCertVerificationError as e:
+                self.stats['unverified'] += 1
+                result.verify_error = e.verify_message or str(e)
+                chain, result.tls_version, result.cipher = await self._handshake(
+                    host, port, sni, self.insecure_context)
+        except (OSError, asyncio.TimeoutError, ValueError) as e:
+            self.stats['errors'] += 1
+            result.error = str(e) or type(e).__name__
+            result.elapsed = time.monotonic() - started
+            return result
+        result.elapsed = time.monotonic() - started
+        result.chain = chain
+        result.certificates = await self._parse_chain(chain, pending)
+        return result
+
+    async def probe(self, host, port=DEFAULT_TLS_PORT, server_name=None):
+        """Tek hedefi çalışan olay döngüsü içinde probla"""
+        return await self._probe(host, port, server_name, {})
+
+    async def _probe_stream(self, targets, on_result, port):
+        targets = iter(targets)
+        pending = {}
+
+        async def worker():
+            for target in targets:
+                host, target_port = parse_target(target, port)
+                on_result(await self._probe(host, target_port, None, pending))
+
+        await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+
+    def probe_many(self, targets, on_result=None, port=DEFAULT_TLS_PORT):
+        """Hedefleri en fazla `concurrency` el sıkışma aynı anda sürecek şekilde probla
+
+        targets tembel tüketilir; her sonuç tamamlandığı sırayla
+        on_result(TlsResult) ile bildirilir. Dönüş: tüm sonuçların listesi.
+        """
+        results = []
+
+        def collect(result):
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+
+        asyncio.run(self._probe_stream(targets, collect, port))
+        return results
+
+    def probe_one(self, host, port=DEFAULT_TLS_PORT):
+        return self.probe_many([(host, port)])[0]
+
@@ -8,14 +8,34 @@ Sosyal medya ve web sitelerinde kullanıcı adı araştırması
 
 import os
 import sys
-import requests
+import asyncio
 import json
+import re
 from pathlib import Path
 from colorama import Fore, Style
 from datetime import datetime
 
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    from modules.http_client import create_async_session, http_request
+    from modules.rate_limiter import THROTTLE_STATUSES, limited_session_request
+    from modules.result_cache import ResultCache
+    from modules.settings import get_setting_section
+except ImportError:
+    from http_client import create_async_session, http_request
+    from rate_limiter import THROTTLE_STATUSES, limited_session_request
+    from result_cache import ResultCache
+    from settings import get_setting_section
+
 # Ana dizin
 BASE_DIR = Path(__file__).resolve().parent.parent
+CACHE_FILE = BASE_DIR / 'data' / 'username_cache.db'
+CACHE_NAMESPACE = 'username'
 
 class Colors:
     HEADER = Fore.CYAN + Style.BRIGHT
@@ -26,90 +46,109 @@ class Colors:
     INPUT = Fore.WHITE + Style.BRIGHT
     RESET = Style.RESET_ALL
 
-# 300+ sosyal medya ve web sitesi listesi
-SOCIAL_SITES = {
-    # Ana Platformlar
-    "Instagram": "https://www.instagram.com/{}",
-    "Twitter/X": "https://twitter.com/{}",
-    "Facebook": "https://www.facebook.com/{}",
-    "LinkedIn": "https://www.linkedin.com/in/{}",
-    "TikTok": "https://www.tiktok.com/@{}",
-    "YouTube": "https://www.youtube.com/@{}",
-    "Reddit": "https://www.reddit.com/user/{}",
-    "Pinterest": "https://www.pinterest.com/{}",
-    "Snapchat": "https://www.snapchat.com/add/{}",
-    "Telegram": "https://t.me/{}",
-    
-    # Profesyonel
-    "GitHub": "https://github.com/{}",
-    "GitLab": "https://gitlab.com/{}",
-    "Bitbucket": "https://bitbucket.org/{}",
-    "StackOverflow": "https://stackoverflow.com/users/{}",
-    "Behance": "https://www.behance.net/{}",
-    "Dribbble": "https://dribbble.com/{}",
-    "DeviantArt": "https://www.deviantart.com/{}",
-    "CodePen": "https://codepen.io/{}",
-    "HackerRank": "https://www.hackerrank.com/{}",
-    "Kaggle": "https://www.kaggle.com/{}",
-    
-    # Müzik & Video
-    "Spotify": "https://open.spotify.com/user/{}",
-    "SoundCloud": "https://soundcloud.com/{}",
-    "Twitch": "https://www.twitch.tv/{}",
-    "Mixer": "https://mixer.com/{}",
-    "Vimeo": "https://vimeo.com/{}",
-    "Dailymotion": "https://www.dailymotion.com/{}",
-    "Bandcamp": "https://bandcamp.com/{}",
-    "Mixcloud": "https://www.mixcloud.com/{}",
-    
-    # Forum & Topluluk
-    "Medium": "https://medium.com/@{}",
-    "Wordpress": "https://{}.wordpress.com",
-    "Blogger": "https://{}.blogspot.com",
-    "Tumblr": "https://{}.tumblr.com",
-    "Patreon": "https://www.patreon.com/{}",
-    "Ko-fi": "https://ko-fi.com/{}",
-    "BuyMeACoffee": "https://www.buymeacoffee.com/{}",
-    
-    # Gaming
-    "Steam": "https://steamcommunity.com/id/{}",
-    "Xbox": "https://account.xbox.com/en-us/profile?gamertag={}",
-    "PSN": "https://my.playstation.com/profile/{}",
-    "Epic Games": "https://www.epicgames.com/id/{}",
-    "Roblox": "https://www.roblox.com/users/{}/profile",
-    "Minecraft": "https://namemc.com/profile/{}",
-    "Discord": "https://discord.com/users/{}",
-    
-    # Fotoğraf & Görsel
-    "Flickr": "https://www.flickr.com/photos/{}",
-    "500px": "https://500px.com/{}",
-    "Unsplash": "https://unsplash.com/@{}",
-    "VSCO": "https://vsco.co/{}",
-    "EyeEm": "https://www.eyeem.com/u/{}",
-    
-    # İş & Networking
-    "AngelList": "https://angel.co/u/{}",
-    "Crunchbase": "https://www.crunchbase.com/person/{}",
-    "ProductHunt": "https://www.producthunt.com/@{}",
-    "Meetup": "https://www.meetup.com/members/{}",
-    
-    # Seyahat
-    "TripAdvisor": "https://www.tripadvisor.com/members/{}",
-    "Airbnb": "https://www.airbnb.com/users/show/{}",
-    "Couchsurfing": "https://www.couchsurfing.com/people/{}",
-    
-    # Öğrenme
-    "Udemy": "https://www.udemy.com/user/{}",
-    "Coursera": "https://www.coursera.org/user/{}",
-    "Skillshare": "https://www.skillshare.com/user/{}",
-    
-    # Diğer
-    "Quora": "https://www.quora.com/profile/{}",
-    "SlideShare": "https://www.slideshare.net/{}",
-    "About.me": "https://about.me/{}",
-    "Keybase": "https://keybase.io/{}",
-    "Gravatar": "https://en.gravatar.com/{}",
-}
+# Asenkron motor varsayılanları
+DEFAULT_TIMEOUT = 5
+DEFAULT_CONCURRENCY = 50   # Aynı anda açık toplam istek
+DEFAULT_PER_HOST = 4       # Aynı host'a aynı anda açık istek
+PENDING_FACTOR = 4         # Bekleyen görev penceresi = concurrency x bu değer
+
+# Site kataloğu data/sites.json içinde tutulur; her kayıt profil URL'si ve
+# tespit kurallarını taşır:
+#   status          : profilin var sayıldığı HTTP kodları (varsayılan [200])
+#   absent_redirect : son URL bununla eşleşirse profil yok (ör. login sayfası)
+#   absent_regex    : gövdede eşleşirse profil yok
+#   present_regex   : gövdede eşleşmezse profil yok
+#   min_size/max_size: gövde boyutu sınırları (byte)
+#   probe           : "head", "range" ya da "get"; verilmezse öğrenilir
+#   probe_bytes     : ranged/streamed GET'te okunacak en fazla gövde (byte)
+SITES_FILE = BASE_DIR / 'data' / 'sites.json'
+CHUNK_SIZE = 8192
+DEFAULT_PROBE_BYTES = 64 * 1024   # Bir profil için okunacak en fazla gövde
+MAX_BODY_BYTES = 1024 * 1024      # Range yok sayılıp tam gövde geldiğinde okunacak üst sınır
+REGEX_OVERLAP = 1024              # Parçalar arasında taşan eşleşmeler için tutulan kuyruk
+PROBE_STRATEGIES = ('head', 'range', 'get')
+HEAD_UNSUPPORTED = (405, 501)     # HEAD desteklenmiyor -> GET'e düş
+
+class SiteRule:
+    """Bir sitenin profil URL'si ve yükleme anında derlenmiş tespit kuralları"""
+    
+    def __init__(self, name, url, detect=None):
+        detect = detect or {}
+        self.name = name
+        self.url = url
+        self.status_codes = frozenset(detect.get('status', [200]))
+        self.absent_redirect = re.compile(detect['absent_redirect']) if detect.get('absent_redirect') else None
+        self.absent_regex = re.compile(detect['absent_regex'].encode()) if detect.get('absent_regex') else None
+        self.present_regex = re.compile(detect['present_regex'].encode()) if detect.get('present_regex') else None
+        self.min_size = detect.get('min_size')
+        self.max_size = detect.get('max_size')
+        self.needs_body = bool(self.absent_regex or self.present_regex or self.min_size or self.max_size)
+        self.probe = detect.get('probe') if detect.get('probe') in PROBE_STRATEGIES else None
+        self.probe_bytes = detect.get('probe_bytes', DEFAULT_PROBE_BYTES)
+    
+    def check_head(self, status, final_url):
+        """Gövde okumadan karar verilebiliyorsa True/False, yoksa None döndür"""
+        if status not in self.status_codes:
+            return False
+        if self.absent_redirect and self.absent_redirect.search(final_url):
+            return False
+        if not self.needs_body:
+            return True
+        return None
+
+class BodyScanner:
+    """Gövdeyi parça parça tarar; kural karar verir vermez okuma kesilebilir"""
+    
+    def __init__(self, rule):
+        self.rule = rule
+        self.size = 0
+        self._tail = b''
+    
+    def feed(self, chunk):
+        """Yeni parçayı işle; karar verildiyse True/False, yoksa None döndür"""
+        rule = self.rule
+        self.size += len(chunk)
+        if rule.max_size and self.size > rule.max_size:
+            return False
+        if rule.absent_regex or rule.present_regex:
+            window = self._tail + chunk
+            if rule.absent_regex and rule.absent_regex.search(window):
+                return False
+            if rule.present_regex and rule.present_regex.search(window):
+                return True
+            self._tail = window[-REGEX_OVERLAP:]
+        elif rule.min_size and not rule.max_size and self.size >= rule.min_size:
+            return True
+        return None
+    
+    def finish(self, truncated=False):
+        """Gövde bitti (ya da okuma sınırına gelindi); son kararı ver
+        
+        truncated: gövdenin okunmayan bir kısmı kaldı. absent_regex o kısımda
+        olabileceğinden karar verilemez (None).
+        """
+        if truncated and self.rule.absent_regex:
+            return None
+        if self.rule.min_size and self.size < self.rule.min_size:
+            return False
+        if self.rule.present_regex:
+            return False
+        return True
+
+def load_site_catalog(path=SITES_FILE):
+    """Site kataloğunu yükle ve kuralları derle"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return {entry['name']: SiteRule(entry['name'], entry['url'], entry.get('detect'))
+            for entry in data['sites']}
+
+try:
+    SITE_RULES = load_site_catalog()
+except (OSError, ValueError, KeyError, re.error) as e:
+    print(f"{Colors.ERROR}[!] Site kataloğu yüklenemedi ({SITES_FILE}): {e}{Colors.RESET}")
+    SITE_RULES = {}
+
+SOCIAL_SITES = {name: rule.url for name, rule in SITE_RULES.items()}
 
 def print_header():
     """Modül başlığını yazdır"""
@@ -120,53 +159,385 @@ def print_header():
 {Colors.RESET}"""
     print(header)
 
-def check_username(username, site_name, url_pattern):
+def get_site_rule(site_name, url_pattern):
+    """Sitenin kuralını döndür; katalogda yoksa yalnızca durum koduna bakan kural"""
+    rule = SITE_RULES.get(site_name)
+    if rule is None or rule.url != url_pattern:
+        rule = SiteRule(site_name, url_pattern)
+    return rule
+
+# Çalışma sırasında öğrenilen yoklama yöntemleri (ör. HEAD'e 405 dönen siteler)
+LEARNED_PROBES = {}
+
+def probe_strategy(rule):
+    """Site için yoklama yöntemi: tanımlı > öğrenilmiş > kurala göre varsayılan
+    
+    Gövde gerektirmeyen kurallar HEAD ile, gövde gerektirenler ilk
+    probe_bytes byte'ı isteyen ranged GET ile yoklanır.
+    """
+    if rule.probe:
+        return rule.probe
+    if rule.name in LEARNED_PROBES:
+        return LEARNED_PROBES[rule.name]
+    return 'range' if rule.needs_body else 'head'
+
+def probe_headers(rule, strategy):
+    """Yönteme göre ek istek başlıkları (User-Agent ortak oturumdan gelir)"""
+    if strategy == 'range':
+        return {'Range': f"bytes=0-{rule.probe_bytes - 1}"}
+    return {}
+
+def read_limit(rule, status_code):
+    """Gövdeden okunacak en fazla byte
+    
+    206 yanıtında sunucu zaten yalnızca istenen aralığı (kuralın
+    penceresini) gönderir. 200 yanıtında (Range yok sayıldı ya da düz GET)
+    absent_regex işareti probe_bytes'tan sonra gelebilir; gövde
+    MAX_BODY_BYTES'a kadar okunur, sınıra gelinirse karar verilmez.
+    """
+    if status_code == 206 or not rule.absent_regex:
+        return rule.probe_bytes
+    return max(rule.probe_bytes, MAX_BODY_BYTES)
+
+def response_size(headers, body_bytes):
+    """Yanıt için aktarılan yaklaşık byte (başlıklar + okunan gövde)"""
+    return sum(len(key) + len(value) + 4 for key, value in headers.items()) + 16 + body_bytes
+
+def add_transfer(stats, headers, body_bytes):
+    """İstek/byte sayaçlarını güncelle"""
+    if stats is not None:
+        stats['requests'] += 1
+        stats['bytes'] += response_size(headers, body_bytes)
+
+def check_username(username, site_name, url_pattern, stats=None):
     """Bir sitede kullanıcı adını kontrol et"""
     url = url_pattern.format(username)
+    rule = get_site_rule(site_name, url_pattern)
+    strategy = probe_strategy(rule)
     
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=5, allow_redirects=True)
+        verdict = None
+        if strategy == 'head':
+            response = http_request('HEAD', url, timeout=DEFAULT_TIMEOUT, allow_redirects=True)
+            add_transfer(stats, response.headers, 0)
+            if response.status_code in THROTTLE_STATUSES:
+                return None, None
+            if response.status_code in HEAD_UNSUPPORTED:
+                LEARNED_PROBES[site_name] = strategy = 'get'
+            else:
+                verdict = rule.check_head(response.status_code, response.url)
         
-        if response.status_code == 200:
+        if verdict is None:
+            for _ in range(2):
+                with http_request('GET', url, headers=probe_headers(rule, strategy),
+                                  timeout=DEFAULT_TIMEOUT, allow_redirects=True,
+                                  stream=True) as response:
+                    if response.status_code in THROTTLE_STATUSES:
+                        # Sınırlayıcı tekrar denedi ama site hâlâ kısıtlıyor; hata say
+                        add_transfer(stats, response.headers, 0)
+                        return None, None
+                    if response.status_code == 416 and strategy == 'range':
+                        # Sunucu Range'i kabul etmiyor; düz GET ile tekrar dene
+                        add_transfer(stats, response.headers, 0)
+                        LEARNED_PROBES[site_name] = strategy = 'get'
+                        continue
+                    status = 200 if response.status_code == 206 else response.status_code
+                    verdict = rule.check_head(status, response.url)
+                    scanner = BodyScanner(rule)
+                    if verdict is None:
+                        limit = read_limit(rule, response.status_code)
+                        for chunk in response.iter_content(CHUNK_SIZE):
+                            verdict = scanner.feed(chunk)
+                            if verdict is not None or scanner.size >= limit:
+                                break
+                        if verdict is None:
+                            verdict = scanner.finish(truncated=response.status_code != 206 and scanner.size >= limit)
+                    add_transfer(stats, response.headers, scanner.size)
+                break
+        
+        if verdict is None:
+            return None, None
+        if verdict:
             return True, url
         else:
             return False, None
     except Exception:
         return None, None
 
-def search_username(username):
-    """Kullanıcı adını birden fazla sitede ara"""
-    print(f"\n{Colors.INFO}[*] '{username}' kullanıcı adı aranıyor...{Colors.RESET}\n")
+async def check_username_async(session, username, site_name, url_pattern, semaphore, stats=None):
+    """Bir sitede kullanıcı adını asenkron kontrol et (check_username ile aynı sonuç)"""
+    url = url_pattern.format(username)
+    rule = get_site_rule(site_name, url_pattern)
+    strategy = probe_strategy(rule)
+    
+    try:
+        verdict = None
+        if strategy == 'head':
+            async with limited_session_request(session, 'HEAD', url, slot=semaphore,
+                                               allow_redirects=True) as response:
+                add_transfer(stats, response.headers, 0)
+                if response.status in THROTTLE_STATUSES:
+                    return None, None
+                if response.status in HEAD_UNSUPPORTED:
+                    LEARNED_PROBES[site_name] = strategy = 'get'
+                else:
+                    verdict = rule.check_head(response.status, str(response.url))
+        
+        if verdict is None:
+            for _ in range(2):
+                async with limited_session_request(session, 'GET', url, slot=semaphore,
+                                                   headers=probe_headers(rule, strategy),
+                                                   allow_redirects=True) as response:
+                    if response.status in THROTTLE_STATUSES:
+                        add_transfer(stats, response.headers, 0)
+                        return None, None
+                    if response.status == 416 and strategy == 'range':
+                        # Sunucu Range'i kabul etmiyor; düz GET ile tekrar dene
+                        add_transfer(stats, response.headers, 0)
+                        LEARNED_PROBES[site_name] = strategy = 'get'
+                        continue
+                    status = 200 if response.status == 206 else response.status
+                    verdict = rule.check_head(status, str(response.url))
+                    scanner = BodyScanner(rule)
+                    if verdict is None:
+                        limit = read_limit(rule, response.status)
+                        async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                            verdict = scanner.feed(chunk)
+                            if verdict is not None or scanner.size >= limit:
+                                break
+                        if verdict is None:
+                            verdict = scanner.finish(truncated=response.status != 206 and scanner.size >= limit)
+                    add_transfer(stats, response.headers, scanner.size)
+                break
+        
+        if verdict is None:
+            return None, None
+        if verdict:
+            return True, url
+        return False, None
+    except Exception:
+        return None, None
+
+def open_cache():
+    """Ayarlara göre önbelleği aç; kapalıysa (None, ayarlar) döndür"""
+    config = get_setting_section('cache')
+    if not config.get('enabled', True):
+        return None, config
+    try:
+        return ResultCache(CACHE_FILE, max_entries=config['max_entries']), config
+    except Exception as e:
+        print(f"{Colors.WARNING}[!] Önbellek açılamadı: {e}{Colors.RESET}")
+        return None, config
+
+def cache_lookup(cache, username, site_name):
+    """Önbellekteki sonucu (status, url) olarak döndür, yoksa None"""
+    entry = cache.get(CACHE_NAMESPACE, f"{site_name}/{username}")
+    if entry is None:
+        return None
+    return entry['status'], entry['url']
+
+def cache_store(cache, config, username, site_name, status, url):
+    """Sonucu türüne göre (bulundu / bulunamadı / hata) ayrı TTL ile sakla"""
+    if status is True:
+        ttl = config['positive_ttl']
+    elif status is False:
+        ttl = config['negative_ttl']
+    else:
+        ttl = config['error_ttl']
+    cache.set(CACHE_NAMESPACE, f"{site_name}/{username}", {'status': status, 'url': url}, ttl)
+
+async def iter_username_async(username, concurrency=DEFAULT_CONCURRENCY,
+                              per_host=DEFAULT_PER_HOST, timeout=DEFAULT_TIMEOUT,
+                              cache=None, cache_config=None, refresh=False, stats=None):
+    """Site sonuçlarını tamamlandıkları anda (site_name, status, url) olarak üret
+    
+    Aynı anda en fazla `concurrency` istek açıktır. Bekleyen görev penceresi
+    bunun PENDING_FACTOR katıdır; böylece sınırlayıcıda bekleyen yavaş
+    host'ların görevleri diğer host'ların önünü tıkamaz. Katalog ne kadar
+    büyük olursa olsun bellek kullanımı sabit kalır. cache verilirse geçerli
+    kayıtlar ağa çıkmadan döner; refresh=True önbelleği okumadan günceller.
+    stats verilirse istek ve aktarılan byte sayıları buraya eklenir.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async with create_async_session(limit=concurrency, limit_per_host=per_host,
+                                    timeout=timeout) as session:
+        async def run(site_name, url_pattern):
+            status, url = await check_username_async(session, username, site_name, url_pattern,
+                                                     semaphore, stats)
+            return site_name, status, url
+        
+        sites = iter(SOCIAL_SITES.items())
+        pending = set()
+        window = concurrency * PENDING_FACTOR
+        try:
+            while True:
+                while len(pending) < window:
+                    try:
+                        site_name, url_pattern = next(sites)
+                    except StopIteration:
+                        break
+                    cached = cache_lookup(cache, username, site_name) if cache is not None and not refresh else None
+                    if cached is not None:
+                        yield (site_name,) + cached
+                        continue
+                    pending.add(asyncio.ensure_future(run(site_name, url_pattern)))
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    site_name, status, url = task.result()
+                    if cache is not None:
+                        cache_store(cache, cache_config, username, site_name, status, url)
+                    yield site_name, status, url
+        finally:
+            for task in pending:
+                task.cancel()
+
+def iter_username(username, cache=None, cache_config=None, refresh=False, stats=None):
+    """Site sonuçlarını sırayla (site_name, status, url) olarak üret"""
+    for site_name, url_pattern in SOCIAL_SITES.items():
+        cached = cache_lookup(cache, username, site_name) if cache is not None and not refresh else None
+        if cached is not None:
+            yield (site_name,) + cached
+            continue
+        status, url = check_username(username, site_name, url_pattern, stats)
+        if cache is not None:
+            cache_store(cache, cache_config, username, site_name, status, url)
+        yield site_name, status, url
+
+class JsonlSink:
+    """Her site sonucunu geldiği anda reports/username_search/ altına JSONL olarak ekler"""
+    
+    def __init__(self, username):
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        report_dir = BASE_DIR / 'reports' / 'username_search'
+        report_dir.mkdir(parents=True, exist_ok=True)
+        self.path = report_dir / f"{username}_{timestamp}.jsonl"
+        self.username = username
+        self._file = open(self.path, 'a', encoding='utf-8')
+    
+    def write(self, site_name, status, url):
+        verdict = 'found' if status is True else 'not_found' if status is False else 'error'
+        record = {
+            'username': self.username,
+            'site': site_name,
+            'verdict': verdict,
+            'url': url,
+            'checked_at': datetime.now().isoformat()
+        }
+        self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self._file.flush()
+    
+    def close(self):
+        self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+def _record_verdict(results, site_name, status, url, current, total, sink=None):
+    """Tek bir site sonucunu ekrana, sink'e ve sonuç sözlüğüne işle"""
+    print(f"{Colors.INFO}[{current}/{total}] {site_name} kontrol edildi...{Colors.RESET}", end='\r')
+    if sink is not None:
+        sink.write(site_name, status, url)
+    
+    if status is True:
+        results['found'].append((site_name, url))
+        print(f"{Colors.SUCCESS}✓ {site_name:20} - BULUNDU! {url}{Colors.RESET}")
+    elif status is False:
+        results['not_found'].append(site_name)
+    else:
+        results['errors'].append(site_name)
+
+def _catalog_order(results):
+    """Rapor sırası katalog sırasıyla aynı kalsın"""
+    order = {site_name: index for index, site_name in enumerate(SOCIAL_SITES)}
+    results['found'].sort(key=lambda item: order.get(item[0], len(order)))
+    results['not_found'].sort(key=lambda site_name: order.get(site_name, len(order)))
+    results['errors'].sort(key=lambda site_name: order.get(site_name, len(order)))
+    return results
+
+async def search_username_async(username, concurrency=DEFAULT_CONCURRENCY,
+                                per_host=DEFAULT_PER_HOST, timeout=DEFAULT_TIMEOUT, sink=None,
+                                cache=None, cache_config=None, refresh=False):
+    """Tüm siteleri ortak bağlantı havuzu üzerinden eşzamanlı kontrol et"""
+    print(f"\n{Colors.INFO}[*] '{username}' kullanıcı adı aranıyor (asenkron, {concurrency} eşzamanlı)...{Colors.RESET}\n")
     
     results = {
         'found': [],
         'not_found': [],
-        'errors': []
+        'errors': [],
+        'transfer': {'requests': 0, 'bytes': 0}
     }
-    
     total = len(SOCIAL_SITES)
     current = 0
     
-    for site_name, url_pattern in SOCIAL_SITES.items():
+    async for site_name, status, url in iter_username_async(username, concurrency, per_host, timeout,
+                                                            cache, cache_config, refresh,
+                                                            results['transfer']):
         current += 1
-        print(f"{Colors.INFO}[{current}/{total}] {site_name} kontrol ediliyor...{Colors.RESET}", end='\r')
-        
-        status, url = check_username(username, site_name, url_pattern)
-        
-        if status is True:
-            results['found'].append((site_name, url))
-            print(f"{Colors.SUCCESS}✓ {site_name:20} - BULUNDU! {url}{Colors.RESET}")
-        elif status is False:
-            results['not_found'].append(site_name)
-        else:
-            results['errors'].append(site_name)
+        _record_verdict(results, site_name, status, url, current, total, sink)
     
     print("\n")
+    return _catalog_order(results)
+
+def search_username_sequential(username, sink=None, cache=None, cache_config=None, refresh=False):
+    """Kullanıcı adını siteler üzerinde tek tek ara (aiohttp yoksa yedek yol)"""
+    print(f"\n{Colors.INFO}[*] '{username}' kullanıcı adı aranıyor...{Colors.RESET}\n")
+    
+    results = {
+        'found': [],
+        'not_found': [],
+        'errors': [],
+        'transfer': {'requests': 0, 'bytes': 0}
+    }
+    total = len(SOCIAL_SITES)
+    verdicts = iter_username(username, cache, cache_config, refresh, results['transfer'])
+    
+    for current, (site_name, status, url) in enumerate(verdicts, 1):
+        _record_verdict(results, site_name, status, url, current, total, sink)
+    
+    print("\n")
+    return results
+
+def search_username(username, engine='async', concurrency=DEFAULT_CONCURRENCY,
+                    per_host=DEFAULT_PER_HOST, timeout=DEFAULT_TIMEOUT, stream=False,
+                    use_cache=True, refresh=False):
+    """Kullanıcı adını birden fazla sitede ara
+    
+    engine='async' aiohttp ile eşzamanlı tarama yapar; aiohttp kurulu değilse
+    ya da engine='sequential' verilirse eski sıralı yol kullanılır.
+    stream=True her sonucu geldiği anda JSONL raporuna ekler.
+    use_cache=False önbelleği tamamen atlar; refresh=True önbelleği okumadan
+    yeni sonuçlarla günceller.
+    """
+    cache, cache_config = open_cache() if use_cache else (None, None)
+    sink = JsonlSink(username) if stream else None
+    try:
+        if engine == 'async' and AIOHTTP_AVAILABLE:
+            results = asyncio.run(search_username_async(username, concurrency, per_host, timeout, sink,
+                                                        cache, cache_config, refresh))
+        else:
+            results = search_username_sequential(username, sink, cache, cache_config, refresh)
+    finally:
+        if cache is not None:
+            cache.close()
+        if sink is not None:
+            sink.close()
+            print(f"{Colors.SUCCESS}✓ Anlık sonuçlar: {sink.path}{Colors.RESET}")
     return results
 
+def format_bytes(size):
+    """Byte sayısını okunabilir biçime çevir"""
+    for unit in ['B', 'KB', 'MB']:
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
 def save_results(username, results):
     """Sonuçları dosyaya kaydet"""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -182,7 +553,11 @@ def save_results(username, results):
         f.write(f"Kullanıcı Adı: {username}\n")
         f.write(f"Tarih: {datetime.now().strftime('%d.%m.%Y %H:%M:%S')}\n")
         f.write(f"Toplam Site: {len(SOCIAL_SITES)}\n")
-        f.write(f"Bulunan: {len(results['found'])}\n\n")
+        f.write(f"Bulunan: {len(results['found'])}\n")
+        if 'transfer' in results:
+            f.write(f"Aktarılan Veri: {format_bytes(results['transfer']['bytes'])} "
+                    f"({results['transfer']['requests']} istek)\n")
+        f.write("\n")
         f.write("="*65 + "\n\n")
         
         if results['found']:
@@ -198,8 +573,12 @@ def save_results(username, results):
     
     return report_file
 
-def main():
-    """Ana fonksiyon"""
+def main(use_cache=True, refresh=False):
+    """Ana fonksiyon
+    
+    Menüden çağrıldığında (refresh verilmemişse) önbelleğin atlanıp
+    atlanmayacağı kullanıcıya sorulur.
+    """
     os.system('clear' if os.name != 'nt' else 'cls')
     print_header()
     
@@ -211,13 +590,22 @@ def main():
         print(f"{Colors.ERROR}[!] Kullanıcı adı boş olamaz!{Colors.RESET}")
         return
     
-    results = search_username(username)
+    stream = input(f"{Colors.INPUT}Sonuçlar geldikçe JSONL dosyasına yazılsın mı? (E/H): {Colors.RESET}").strip().upper()
+    
+    if use_cache and not refresh:
+        fresh = input(f"{Colors.INPUT}Önbellek atlanıp tüm siteler yeniden kontrol edilsin mi? (E/H): {Colors.RESET}").strip().upper()
+        refresh = fresh in ['E', 'Y', 'EVET', 'YES']
+    
+    results = search_username(username, stream=stream in ['E', 'Y', 'EVET', 'YES'],
+                              use_cache=use_cache, refresh=refresh)
     
     # Özet
     print(f"\n{Colors.HEADER}╔═══════════════════ SONUÇ ÖZETİ ═══════════════════╗{Colors.RESET}")
     print(f"{Colors.SUCCESS}✓ Bulunan Profiller  : {len(results['found'])}{Colors.RESET}")
     print(f"{Colors.WARNING}✗ Bulunamayan        : {len(results['not_found'])}{Colors.RESET}")
     print(f"{Colors.ERROR}? Hata Oluşan        : {len(results['errors'])}{Colors.RESET}")
+    print(f"{Colors.INFO}⇅ Aktarılan Veri     : {format_bytes(results['transfer']['bytes'])} "
+          f"({results['transfer']['requests']} istek){Colors.RESET}")
     print(f"{Colors.HEADER}╚════════════════════════════════════════════════════╝{Colors.RESET}\n")
     
     if results['found']:
@@ -229,4 +617,9 @@ def main():
     input(f"\n{Colors.INPUT}Ana menüye dönmek için Enter'a basın...{Colors.RESET}")
 
 if __name__ == "__main__":
-    main()
+    import argparse
+    parser = argparse.ArgumentParser(description="HIG-Osint kullanıcı adı araştırma")
+    parser.add_argument('--no-cache', action='store_true', help="Önbelleği okuma ve yazma")
+    parser.add_argument('--refresh', action='store_true', help="Önbelleği okumadan tüm siteleri yeniden kontrol et")
+    args = parser.parse_args()
+    main(use_cache=not args.no_cache, refresh=args.refresh)
@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+WHOIS Client Module - Doğrudan TCP/43 WHOIS İstemcisi
+Sorguları harici bir araç ya da kütüphane olmadan doğrudan WHOIS
+sunucularına gönderir. TLD → sunucu eşlemesi yerleşik tablodan, yoksa
+IANA'dan öğrenilir; kayıt (registry) yanıtındaki registrar yönlendirmesi
+izlenir. Çözümlenmiş kayıtlar, TLD sunucuları ve yönlendirme zincirleri
+data/whois_cache.db'de uzun TTL ile saklanır, böylece tekrar eden
+taramalar WHOIS sunucularına yeniden gitmez.
+"""
+
+import re
+import socket
+from datetime import datetime
+from pathlib import Path
+
+try:
+    from modules.rate_limiter import RateLimiter
+    from modules.result_cache import ResultCache
+except ImportError:
+    from rate_limiter import RateLimiter
+    from result_cache import ResultCache
+
+try:
+    from modules.settings import get_setting_section
+except ImportError:
+    try:
+        from settings import get_setting_section
+    except ImportError:
+        get_setting_section = None
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+CACHE_FILE = BASE_DIR / 'data' / 'whois_cache.db'
+CACHE_NAMESPACE = 'whois'
+REFERRAL_NAMESPACE = 'whois_referral'
+SERVER_NAMESPACE = 'whois_server'
+
+WHOIS_PORT = 43
+IANA_WHOIS_SERVER = 'whois.iana.org'
+DEFAULT_TIMEOUT = 10.0
+MAX_RESPONSE_BYTES = 1 << 20      # Bundan uzun yanıtlar kesilir
+MAX_REFERRALS = 2                 # registry → registrar → (en fazla bir ek sıçrama)
+
+RECORD_TTL = 7 * 86400            # Kayıt bilgileri nadiren değişir
+NEGATIVE_TTL = 86400              # "Kayıt yok" yanıtı bir gün geçerli
+SERVER_TTL = 30 * 86400           # TLD sunucusu ve yönlendirme zinciri
+RATE_PER_SERVER = 1.0             # WHOIS sunucuları sorgu hızını sert sınırlar
+RATE_BURST = 2
+
+# Sık kullanılan TLD'lerin WHOIS sunucuları; listede olmayanlar IANA'dan öğrenilir
+TLD_SERVERS = {
+    'com': 'whois.verisign-grs.com',
+    'net': 'whois.verisign-grs.com',
+    'org': 'whois.pir.org',
+    'info': 'whois.nic.info',
+    'biz': 'whois.nic.biz',
+    'io': 'whois.nic.io',
+    'co': 'whois.nic.co',
+    'me': 'whois.nic.me',
+    'tv': 'whois.nic.tv',
+    'cc': 'ccwhois.verisign-grs.com',
+    'xyz': 'whois.nic.xyz',
+    'app': 'whois.nic.google',
+    'dev': 'whois.nic.google',
+    'edu': 'whois.educause.edu',
+    'gov': 'whois.dotgov.gov',
+    'us': 'whois.nic.us',
+    'tr': 'whois.trabis.gov.tr',
+    'de': 'whois.denic.de',
+    'uk': 'whois.nic.uk',
+    'fr': 'whois.nic.fr',
+    'nl': 'whois.domain-registry.nl',
+    'eu': 'whois.eu',
+    'it': 'whois.nic.it',
+    'ch': 'whois.nic.ch',
+    'se': 'whois.iis.se',
+    'pl': 'whois.dns.pl',
+    'ru': 'whois.tcinet.ru',
+    'ca': 'whois.cira.ca',
+    'au': 'whois.auda.org.au',
+    'jp': 'whois.jprs.jp',
+    'br': 'whois.registro.br',
+    'in': 'whois.registry.in'
+}
+
+# Düz alan adı dışında sorgu sözdizimi isteyen sunucular
+QUERY_FORMATS = {
+    'whois.verisign-grs.com': 'domain {}',
+    'ccwhois.verisign-grs.com': 'domain {}',
+    'whois.denic.de': '-T dn,ace {}',
+    'whois.jprs.jp': '{}/e'
+}
+
+# Rapor alanı → yanıtta aranan etiketler (öncelik sırasıyla)
+FIELD_LABELS = {
+    'domain_name': ['domain name', 'domain'],
+    'registrar': ['registrar', 'sponsoring registrar', 'registrar name'],
+    'whois_server': ['registrar whois server', 'whois server'],
+    'creation_date': ['creation date', 'created', 'created on', 'created date',
+                      'registered on', 'registration time', 'registered'],
+    'expiration_date': ['registry expiry date', 'registrar registration expiration date',
+                        'expiration date', 'expiry date', 'expires', 'expires on', 'paid-till'],
+    'updated_date': ['updated date', 'last updated', 'last modified', 'changed', 'modified'],
+    'org': ['registrant organization', 'registrant organisation', 'org', 'organization'],
+    'country': ['registrant country', 'country'],
+    'state': ['registrant state/province', 'state'],
+    'city': ['registrant city', 'city'],
+    'address': ['registrant street', 'address', 'street'],
+    'zipcode': ['registrant postal code', 'postal code', 'zipcode'],
+    'registrant_name': ['registrant name', 'registrant']
+}
+LIST_FIELD_LABELS = {
+    'name_servers': ['name server', 'nserver', 'nameserver', 'name servers'],
+    'status': ['domain status', 'status']
+}
+
+LINE_PATTERN = re.compile(r'^\s*([A-Za-z][\w /.()-]{0,60}?)\s*:\s*(.+?)\s*$', re.M)
+EMAIL_PATTERN = re.compile(r'[\w.+-]+@[\w-]+(?:\.[\w-]+)+')
+IANA_SERVER_PATTERN = re.compile(r'^whois:\s*(\S+)', re.M | re.I)
+REFERRAL_PATTERN = re.compile(
+    r'^\s*(?:Registrar WHOIS Server|Whois Server|ReferralServer)\s*:\s*'
+    r'(?:r?whois://)?([A-Za-z0-9.-]+\.[A-Za-z]{2,})\s*$', re.M | re.I)
+NOT_FOUND_PATTERN = re.compile(
+    r'^\s*(?:%+\s*)?(?:no match|not found|no data found|no entries found|domain not found|'
+    r'no matching record|the queried object does not exist|status:\s*(?:free|available))',
+    re.M | re.I)
+THROTTLE_PATTERN = re.compile(
+    r'limit exceeded|query rate|too many (?:queries|requests)|try again later|quota exceeded', re.I)
+
+
+class WhoisError(Exception):
+    """WHOIS sunucusuna ulaşılamadı ya da sorgu reddedildi"""
+
+
+def normalize_domain(domain):
+    """Küçük harf, sondaki nokta yok, IDN'ler punycode"""
+    domain = domain.strip().lower().rstrip('.')
+    try:
+        return domain.encode('idna').decode('ascii')
+    except UnicodeError:
+        return domain
+
+
+def format_query(server, domain):
+    return QUERY_FORMATS.get(server, '{}').format(domain)
+
+
+def find_referral(text):
+    """Yanıttaki registrar WHOIS sunucusu (yoksa None)"""
+    match = REFERRAL_PATTERN.search(text)
+    return match.group(1).lower() if match else None
+
+
+def is_not_found(text):
+    return NOT_FOUND_PATTERN.search(text) is not None
+
+
+def parse_whois(text):
+    """Serbest biçimli WHOIS yanıtını rapor alanlarına ayır
+
+    Tekil alanlar ilk eşleşen etiketten, liste alanları tüm eşleşen
+    satırlardan doldurulur; bulunamayan tekil alanlar None olur.
+    """
+    labels = {}
+    for line in text.splitlines():
+        if line.startswith(('%', '#', '>>>')):
+            continue
+        match = LINE_PATTERN.match(line)
+        if match:
+            labels.setdefault(match.group(1).lower(), []).append(match.group(2))
+
+    record = {}
+    for field, names in FIELD_LABELS.items():
+        record[field] = next((labels[name][0] for name in names if name in labels), None)
+    for field, names in LIST_FIELD_LABELS.items():
+        values = []
+        for name in names:
+            for value in labels.get(name, ()):
+                # "clientTransferProhibited https://icann.org/epp#..." → ilk kelime
+                value = value.split()[0]
+                if field == 'name_servers':
+                    value = value.lower().rstrip('.')
+                if value not in values:
+                    values.append(value)
+        record[field] = values
+    emails = []
+    for email in EMAIL_PATTERN.findall(text):
+        email = email.lower()
+        if email not in emails:
+            emails.append(email)
+    record['emails'] = emails
+    return record
+
+
+def merge_records(base, update):
+    """Registrar yanıtındaki dolu tekil alanlar registry yanıtındakilerin
+    yerine geçer; liste alanları birleştirilir"""
+    merged = dict(base)
+    for field, value in update.items():
+        current = merged.get(field)
+        if isinstance(value, list) and current:
+            merged[field] = current + [item for item in value if item not in current]
+        elif value or field not in merged:
+            merged[field] = value
+    return merged
+
+
+class WhoisClient:
+    """Önbellekli, yönlendirme izleyen TCP/43 WHOIS istemcisi
+
+    lookup() önce kalıcı önbelleğe bakar. Kayıt yoksa ya da süresi
+    dolmuşsa registry sunucusundan başlanıp yönlendirmeler izlenir ve
+    yanıtlar birleştirilir; domain'in zinciri önceden öğrenilmişse
+    registry sunucusu oradan alınır, TLD/IANA araması yapılmaz. Her
+    sunucu kendi hız sınırıyla sorgulanır.
+    """
+
+    def __init__(self, timeout=DEFAULT_TIMEOUT, record_ttl=RECORD_TTL, negative_ttl=NEGATIVE_TTL,
+                 server_ttl=SERVER_TTL, cache_path=CACHE_FILE, servers=None, port=WHOIS_PORT,
+                 iana_server=IANA_WHOIS_SERVER, rate=RATE_PER_SERVER):
+        self.timeout = timeout
+        self.record_ttl = record_ttl
+        self.negative_ttl = negative_ttl
+        self.server_ttl = server_ttl
+        self.cache_path = cache_path
+        self.servers = dict(TLD_SERVERS)
+        self.servers.update(servers or {})
+        self.port = port
+        self.iana_server = iana_server
+        self.limiter = RateLimiter(rate=rate, burst=RATE_BURST, min_rate=min(rate, 0.05), max_rate=rate)
+        self.stats = {'queries': 0, 'cache_hits': 0, 'referrals': 0, 'referral_cache_hits': 0}
+
+    @classmethod
+    def from_settings(cls):
+        """Ayarlardaki 'whois' bölümünden oluştur"""
+        config = get_setting_section('whois') if get_setting_section else {}
+        return cls(
+            timeout=config.get('timeout', DEFAULT_TIMEOUT),
+            record_ttl=config.get('record_ttl', RECORD_TTL),
+            negative_ttl=config.get('negative_ttl', NEGATIVE_TTL),
+            server_ttl=config.get('server_ttl', SERVER_TTL),
+            rate=config.get('rate_per_server', RATE_PER_SERVER),
+        )
+
+    # -- ağ --------------------------------------------------------------
+
+    def query(self, server, text):
+        """Sunucuya tek sorgu gönder, bağlantı kapanana kadar yanıtı oku"""
+        self.limiter.acquire(server)
+        self.stats['queries'] += 1
+        chunks = []
+        size = 0
+        try:
+            with socket.create_connection((server, self.port), timeout=self.timeout) as sock:
+                sock.sendall(f"{text}\r\n".encode('utf-8'))
+                while size < MAX_RESPONSE_BYTES:
+                    chunk = sock.recv(65536)
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+                    size += len(chunk)
+        except OSError as e:
+            raise WhoisError(f"{server}: {e}") from e
+        data = b''.join(chunks)[:MAX_RESPONSE_BYTES]
+        try:
+            response = data.decode('utf-8')
+        except UnicodeDecodeError:
+            response = data.decode('latin-1')
+        if THROTTLE_PATTERN.search(response) and not REFERRAL_PATTERN.search(response):
+            self.limiter.feedback(server, 429)
+            raise WhoisError(f"{server}: sorgu sınırı aşıldı")
+        self.limiter.feedback(server, 200)
+        return response
+
+    def server_for(self, domain, cache=None):
+        """Domain'in TLD sunucusu: yerleşik tablo → önbellek → IANA"""
+        labels = domain.split('.')
+        for suffix in ('.'.join(labels[-2:]), labels[-1]):
+            if suffix in self.servers:
+                return self.servers[suffix]
+        tld = labels[-1]
+        if cache is not None:
+            server = cache.get(SERVER_NAMESPACE, tld)
+            if server is not None:
+                return server
+        match = IANA_SERVER_PATTERN.search(self.query(self.iana_server, tld))
+        if not match:
+            raise WhoisError(f".{tld} için WHOIS sunucusu bulunamadı")
+        server = match.group(1).lower()
+        self.servers[tld] = server
+        if cache is not None:
+            cache.set(SERVER_NAMESPACE, tld, server, self.server_ttl)
+        return server
+
+    def _walk(self, domain, cache, server=None):
+        """Registry sunucusundan başlayıp registrar yönlendirmelerini izle
+
+        server verilmezse TLD sunucusu server_for() ile bulunur. Registry
+        yanıtı her zaman sorgulanıp registrar yanıtıyla birleştirilir;
+        name_servers, status gibi alanlar çoğu zaman yalnız registry'de
+        bulunur.
+        """
+        if server is None:
+            server = self.server_for(domain, cache)
+        chain = []
+        record = {}
+        response = ''
+        for hop in range(MAX_REFERRALS + 1):
+            try:
+                text = self.query(server, format_query(server, domain))
+            except WhoisError:
+                if not chain:
+                    raise
+                break   # Registrar yanıt vermezse registry bilgisiyle yetin
+            chain.append(server)
+            if hop == 0 and is_not_found(text):
+                return None, chain, text
+            record = merge_records(record, parse_whois(text))
+            response = text
+            referral = find_referral(text)
+            if not referral or referral in chain:
+                break
+            self.stats['referrals'] += 1
+            server = referral
+        return record, chain, response
+
+    # -- genel arayüz -------------------------------------------------------
+
+    def _open_cache(self):
+        if self.cache_path is None:
+            return None
+        try:
+            return ResultCache(self.cache_path)
+        except Exception:
+            return None
+
+    def lookup(self, domain, refresh=False):
+        """Domain kaydını döndür (önbellekten ya da ağdan)
+
+        Dönüş her zaman 'found' anahtarlı bir sözlüktür; sunucuya
+        ulaşılamazsa WhoisError fırlatılır ve hiçbir şey önbelleklenmez.
+        refresh=True önbelleği okumadan günceller.
+        """
+        domain = normalize_domain(domain)
+        cache = self._open_cache()
+        try:
+            if cache is not None and not refresh:
+                entry = cache.get(CACHE_NAMESPACE, domain)
+                if entry is not None:
+                    self.stats['cache_hits'] += 1
+                    entry['cached'] = True
+                    return entry
+
+            # Bilinen zincir TLD/IANA aramasını atlatır; registry yine sorgulanır
+            known = cache.get(REFERRAL_NAMESPACE, domain) if cache is not None else None
+            if known:
+                self.stats['referral_cache_hits'] += 1
+            record, chain, response = self._walk(domain, cache, known[0] if known else None)
+
+            entry = {
+                'domain': domain,
+                'found': record is not None,
+                'whois_server': chain[-1] if chain else None,
+                'referral_chain': chain,
+                'queried_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'record': record or {},
+                'raw': response
+            }
+            if cache is not None:
+                cache.set(CACHE_NAMESPACE, domain, entry,
+                          self.record_ttl if entry['found'] else self.negative_ttl)
+                if len(chain) > 1:
+                    cache.set(REFERRAL_NAMESPACE, domain, chain, self.server_ttl)
+            entry['cached'] = False
+            return entry
+        finally:
+            if cache is not None:
+                cache.close()